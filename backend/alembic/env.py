@@ -9,14 +9,13 @@ This module configures the Alembic migration environment with support for:
 - Safe production migrations
 """
 
-import asyncio
+import functools
 import os
 import sys
 from logging.config import fileConfig
 from typing import Any, Dict, Optional
 
 from sqlalchemy import pool, create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlalchemy.engine import Connection
 from alembic import context
 from alembic.config import Config
@@ -26,11 +25,6 @@ from alembic.environment import EnvironmentContext
 # Add the project root to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import application models and configuration
-from app.core.config import settings
-from app.models.database import Base
-from app.core.database import get_engine
-
 # Alembic Config object
 config: Config = context.config
 
@@ -38,17 +32,47 @@ config: Config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Target metadata for autogenerate support
-target_metadata = Base.metadata
 
+@functools.lru_cache(maxsize=1)
+def _load_app():
+    """
+    Import application configuration and models on first use.
+    
+    Importing the models pulls in the whole application package, so it is
+    deferred until a migration path actually needs it.
+    
+    Returns:
+        tuple: (settings, Base)
+    """
+    from app.core.config import settings
+    from app.models.database import Base
+    return settings, Base
+
+
+def get_settings():
+    """Get application settings."""
+    return _load_app()[0]
+
+
+def get_target_metadata():
+    """Get target metadata for autogenerate support."""
+    return _load_app()[1].metadata
 
+
+@functools.lru_cache(maxsize=1)
 def get_database_url() -> str:
     """
     Get database URL based on environment and configuration.
     
+    The result is cached since settings and the Alembic config are fixed
+    for the lifetime of the process; call ``get_database_url.cache_clear()``
+    if they are changed at runtime (e.g. in tests).
+    
     Returns:
         str: Database URL for migrations
     """
+    settings = get_settings()
+    
     # Check if we're in testing mode
     if settings.ENVIRONMENT == "testing" and settings.DATABASE_TEST_URL:
         return settings.DATABASE_TEST_URL.replace("+asyncpg", "")  # Use sync driver for migrations
@@ -64,11 +88,80 @@ def get_database_url() -> str:
     return db_url
 
 
+@functools.lru_cache(maxsize=1)
+def _managed_names():
+    """
+    Table names and schemas managed by our models, precomputed for the filters.
+    
+    Returns:
+        tuple: (frozenset of table names, frozenset of schema names)
+    """
+    tables = get_target_metadata().tables
+    return (
+        frozenset(tables.keys()),
+        frozenset(table.schema for table in tables.values()),
+    )
+
+
+def include_name(name, type_, parent_names):
+    """
+    Filter schema and table names before Alembic reflects them.
+    
+    Unlike ``include_object``, this hook runs on the raw name listing, so
+    schemas and tables we don't manage are never reflected at all instead
+    of being inspected one by one and then discarded.
+    
+    Args:
+        name: Schema or table name (None for the default schema)
+        type_: Object type ('schema', 'table', ...)
+        parent_names: Names of the enclosing schema/table
+        
+    Returns:
+        bool: True if the object should be reflected
+    """
+    if type_ == "schema":
+        return name in _managed_names()[1]
+    if type_ == "table":
+        return name in _managed_names()[0]
+    return True
+
+
+def _include_table(name: Optional[str]) -> bool:
+    """Include only tables defined in our models."""
+    return name in _managed_names()[0]
+
+
+def _include_index(name: Optional[str]) -> bool:
+    """Skip PostgreSQL system indexes and auto-created unique constraint indexes."""
+    return not (name.startswith("pg_") or name.endswith("_key"))
+
+
+def _include_foreign_key(name: Optional[str]) -> bool:
+    """Skip foreign key constraints with system-generated names."""
+    return bool(name) and not name.startswith("fk_")
+
+
+_INCLUDE_HANDLERS = {
+    "table": _include_table,
+    "index": _include_index,
+    "foreign_key_constraint": _include_foreign_key,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _include_name(type_: str, name: Optional[str]) -> bool:
+    """Memoized include decision; depends only on object type and name."""
+    handler = _INCLUDE_HANDLERS.get(type_)
+    return handler(name) if handler is not None else True
+
+
 def include_object(object, name, type_, reflected, compare_to):
     """
     Determine whether to include an object in migrations.
     
     This function filters out objects that shouldn't be managed by Alembic.
+    Autogenerate calls it for every reflected object, so the decision is
+    dispatched on ``type_`` and memoized by ``(type_, name)``.
     
     Args:
         object: The schema object
@@ -80,27 +173,7 @@ def include_object(object, name, type_, reflected, compare_to):
     Returns:
         bool: True if object should be included in migration
     """
-    # Skip tables not in our schema
-    if type_ == "table":
-        # Include only tables defined in our models
-        return name in target_metadata.tables
-    
-    # Skip system indexes
-    if type_ == "index":
-        # Skip PostgreSQL system indexes
-        if name.startswith("pg_"):
-            return False
-        # Skip automatically created unique indexes for unique constraints
-        if name.endswith("_key"):
-            return False
-    
-    # Skip foreign key constraints with system-generated names
-    if type_ == "foreign_key_constraint":
-        if not name or name.startswith("fk_"):
-            return False
-    
-    # Include everything else
-    return True
+    return _include_name(type_, name)
 
 
 def compare_type(context, inspected_column, metadata_column, inspected_type, metadata_type):
@@ -124,26 +197,31 @@ def compare_type(context, inspected_column, metadata_column, inspected_type, met
     return context.default_compare_type(inspected_column, metadata_column, inspected_type, metadata_type)
 
 
+# Server default spellings PostgreSQL treats as the same timestamp function
+_TS_EQUIV = frozenset({
+    frozenset({"now()", "current_timestamp"}),
+    frozenset({"current_timestamp", "timezone('utc'::text, now())"}),
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_default(default: str) -> str:
+    """Normalize a rendered server default for comparison."""
+    return default.lower().strip("'\"")
+
+
 def compare_server_default(context, inspected_column, metadata_column, inspected_default, metadata_default, rendered_metadata_default):
     """
     Custom server default comparison to avoid unnecessary migrations.
     """
     # Handle function calls like now() vs CURRENT_TIMESTAMP
     if inspected_default and metadata_default:
-        inspected_norm = str(inspected_default).lower().strip("'\"")
-        metadata_norm = str(rendered_metadata_default).lower().strip("'\"")
-        
-        # Common timestamp function equivalents
-        timestamp_functions = [
-            ('now()', 'current_timestamp'),
-            ('current_timestamp', 'now()'),
-            ('current_timestamp', 'timezone(\'utc\'::text, now())'),
-        ]
-        
-        for func1, func2 in timestamp_functions:
-            if (inspected_norm == func1 and metadata_norm == func2) or \
-               (inspected_norm == func2 and metadata_norm == func1):
-                return False
+        pair = frozenset({
+            _normalize_default(str(inspected_default)),
+            _normalize_default(str(rendered_metadata_default)),
+        })
+        if pair in _TS_EQUIV:
+            return False
     
     # Default comparison
     return context.default_compare_server_default(
@@ -163,7 +241,7 @@ def run_migrations_offline() -> None:
     url = get_database_url()
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=get_target_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         include_object=include_object,
@@ -186,15 +264,13 @@ def do_run_migrations(connection: Connection) -> None:
     """
     context.configure(
         connection=connection,
-        target_metadata=target_metadata,
+        target_metadata=get_target_metadata(),
+        include_name=include_name,
         include_object=include_object,
         compare_type=compare_type,
         compare_server_default=compare_server_default,
         render_as_batch=False,
         transaction_per_migration=True,
-        # Enable constraint naming for better migration support
-        compare_type=True,
-        compare_server_default=True,
         include_schemas=True,
     )
 
@@ -202,48 +278,30 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
+def run_migrations_online() -> None:
     """
-    Run migrations in async mode for compatibility with async SQLAlchemy.
+    Run migrations in 'online' mode.
+    
+    In this scenario we need to create an Engine and associate a connection
+    with the context.
     """
-    # Get database URL for sync operations
+    settings = get_settings()
     database_url = get_database_url()
     
-    # Create synchronous engine for migrations
+    # Alembic runs every migration over one connection, so hold exactly
+    # one for the life of the engine and never time out long DDL
     connectable = create_engine(
         database_url,
-        poolclass=pool.NullPool,
+        poolclass=pool.StaticPool,
+        connect_args={"options": "-c statement_timeout=0"},
         echo=settings.DATABASE_ECHO if settings.ENVIRONMENT == "development" else False,
     )
 
-    with connectable.connect() as connection:
-        do_run_migrations(connection)
-
-    await connectable.dispose()
-
-
-def run_migrations_online() -> None:
-    """
-    Run migrations in 'online' mode.
-    
-    In this scenario we need to create an Engine and associate a connection
-    with the context.
-    """
-    # Check if we should run async
-    if asyncio.iscoroutinefunction(do_run_migrations):
-        asyncio.run(run_async_migrations())
-    else:
-        # Synchronous mode
-        database_url = get_database_url()
-        
-        connectable = create_engine(
-            database_url,
-            poolclass=pool.NullPool,
-            echo=settings.DATABASE_ECHO if settings.ENVIRONMENT == "development" else False,
-        )
-
+    try:
         with connectable.connect() as connection:
             do_run_migrations(connection)
+    finally:
+        connectable.dispose()
 
 
 # Quality assurance helper functions
@@ -255,7 +313,7 @@ def validate_migration_safety() -> bool:
         bool: True if migration is safe, False otherwise
     """
     # In production, require additional confirmation for destructive operations
-    if settings.ENVIRONMENT == "production":
+    if get_settings().ENVIRONMENT == "production":
         # Check for potentially destructive operations
         script_dir = ScriptDirectory.from_config(config)
         
@@ -266,22 +324,33 @@ def validate_migration_safety() -> bool:
     return True
 
 
+_MIGRATION_CTX: Optional[Dict[str, Any]] = None
+
+
 def get_migration_context() -> Dict[str, Any]:
     """
     Get migration context with environment-specific settings.
     
+    The configuration is built once per process and reused.
+    
     Returns:
         dict: Migration context configuration
     """
+    global _MIGRATION_CTX
+    if _MIGRATION_CTX is not None:
+        return _MIGRATION_CTX
+    
     context_config = {
+        "include_name": include_name,
         "include_object": include_object,
         "compare_type": compare_type,
         "compare_server_default": compare_server_default,
-        "target_metadata": target_metadata,
+        "target_metadata": get_target_metadata(),
         "transaction_per_migration": True,
     }
     
     # Environment-specific configurations
+    settings = get_settings()
     if settings.ENVIRONMENT == "development":
         context_config.update({
             "render_as_batch": False,
@@ -295,7 +364,8 @@ def get_migration_context() -> Dict[str, Any]:
             "compare_server_default": True,
         })
     
-    return context_config
+    _MIGRATION_CTX = context_config
+    return _MIGRATION_CTX
 
 
 # Main execution logic
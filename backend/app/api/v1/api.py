@@ -11,7 +11,13 @@ from app.api.v1.endpoints import health, test_cases, user_stories
 
 api_router = APIRouter()
 
+# (router, prefix, tags) for every v1 endpoint module
+ENDPOINT_ROUTERS = (
+    (health.router, "/health", ["health"]),
+    (test_cases.router, "/test-cases", ["test-cases"]),
+    (user_stories.router, "/user-stories", ["user-stories"]),
+)
+
 # Include all endpoint routers
-api_router.include_router(health.router, prefix="/health", tags=["health"])
-api_router.include_router(test_cases.router, prefix="/test-cases", tags=["test-cases"])
-api_router.include_router(user_stories.router, prefix="/user-stories", tags=["user-stories"])
+for router, prefix, tags in ENDPOINT_ROUTERS:
+    api_router.include_router(router, prefix=prefix, tags=tags)
@@ -2,36 +2,21 @@
 API dependencies for the Test Generation Agent.
 
 This module provides common dependencies used across API endpoints,
-including database sessions, authentication, and rate limiting.
+including authentication, validation, and rate limiting.
 """
 
-from typing import AsyncGenerator, Optional
+import hashlib
+import hmac
+from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
-from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
-import time
-from collections import defaultdict
 
-from app.core.database import get_db
 from app.core.security import get_current_user
-from app.core.config import settings
+from app.core.config import Settings, get_settings, settings
+from app.core.rate_limit import is_request_allowed
 
 logger = structlog.get_logger(__name__)
 
-# Simple in-memory rate limiter (in production, use Redis)
-rate_limit_storage = defaultdict(list)
-
-
-async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Get database session dependency.
-    
-    Yields:
-        AsyncSession: Database session
-    """
-    async for session in get_db():
-        yield session
-
 
 async def get_current_user_id(
     current_user: str = Depends(get_current_user)
@@ -48,12 +33,16 @@ async def get_current_user_id(
     return current_user
 
 
-async def verify_webhook_auth(request: Request) -> bool:
+async def verify_webhook_auth(
+    request: Request,
+    settings: Settings = Depends(get_settings)
+) -> bool:
     """
     Verify webhook authentication.
     
     Args:
         request: FastAPI request object
+        settings: Application settings
         
     Returns:
         bool: True if authentication is valid
@@ -72,8 +61,20 @@ async def verify_webhook_auth(request: Request) -> bool:
             detail="Missing webhook signature"
         )
     
-    # In a real implementation, you would verify the signature
-    # against the request body using the webhook secret
+    # Starlette caches the body, so the endpoint can still read it afterwards
+    body = await request.body()
+    expected = hmac.new(
+        settings.AZURE_DEVOPS_WEBHOOK_SECRET.encode(),
+        body,
+        hashlib.sha256
+    ).hexdigest()
+    
+    if not hmac.compare_digest(f"sha256={expected}", signature):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook signature"
+        )
+    
     return True
 
 
@@ -100,28 +101,20 @@ def rate_limit_dependency(
             HTTPException: If rate limit exceeded
         """
         client_ip = request.client.host
-        current_time = time.time()
-        
-        # Clean old entries (older than 1 minute)
-        rate_limit_storage[client_ip] = [
-            timestamp for timestamp in rate_limit_storage[client_ip]
-            if current_time - timestamp < 60
-        ]
+        route = request.scope.get("route")
+        route_path = route.path if route is not None else request.url.path
         
-        # Check rate limit
-        if len(rate_limit_storage[client_ip]) >= max_requests:
+        # Check and record the request in the shared sliding window
+        if not await is_request_allowed(client_ip, route_path, max_requests):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded. Too many requests per minute."
             )
-        
-        # Add current request
-        rate_limit_storage[client_ip].append(current_time)
     
     return rate_limiter
 
 
-async def validate_quality_threshold(
+def validate_quality_threshold(
     quality_threshold: Optional[float] = None
 ) -> float:
     """
@@ -148,7 +141,7 @@ async def validate_quality_threshold(
     return quality_threshold
 
 
-async def validate_pagination(
+def validate_pagination(
     skip: int = 0,
     limit: int = 100,
     max_limit: int = 1000
@@ -188,37 +181,32 @@ async def validate_pagination(
     return skip, limit
 
 
-class ServiceDependency:
-    """Container for service dependencies."""
-    
-    def __init__(self):
-        self._services = {}
+class ServiceContainer:
+    """Container for service dependencies.
     
-    def register_service(self, name: str, service_instance):
-        """Register a service instance."""
-        self._services[name] = service_instance
+    Services are plain attributes set at startup, e.g.
+    ``service_container.test_generation = TestGenerationService()``.
+    """
     
-    def get_service(self, name: str):
-        """Get a service instance."""
-        if name not in self._services:
-            raise ValueError(f"Service '{name}' not registered")
-        return self._services[name]
+    test_generation = None
+    quality_validation = None
+    analytics = None
 
 
 # Global service container
-service_container = ServiceDependency()
+service_container = ServiceContainer()
 
 
 async def get_test_generation_service():
     """Get test generation service dependency."""
-    return service_container.get_service("test_generation")
+    return service_container.test_generation
 
 
 async def get_quality_service():
     """Get quality validation service dependency."""
-    return service_container.get_service("quality_validation")
+    return service_container.quality_validation
 
 
 async def get_analytics_service():
     """Get analytics service dependency."""
-    return service_container.get_service("analytics")
+    return service_container.analytics
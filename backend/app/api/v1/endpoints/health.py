@@ -5,13 +5,14 @@ This module provides health check endpoints for monitoring
 the application and its dependencies.
 """
 
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Response
+from prometheus_client import CollectorRegistry, Gauge, generate_latest, CONTENT_TYPE_LATEST
 import structlog
 
-from app.core.database import get_db
-from app.core.redis import ping_redis, get_redis_info
+from app.core.config import settings
+from app.core.redis import ping_redis, get_redis_info, redis_probe_batch
 from app.utils.database_health import (
     quick_health_check,
     detailed_health_check,
@@ -19,11 +20,97 @@ from app.utils.database_health import (
     check_test_generation_health
 )
 from app.utils.cache import get_cache_stats
+from app.utils.health_cache import cached, single_flight
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# TTLs for cached probe results (seconds)
+PROBE_CACHE_TTL = 1.0
+METRICS_CACHE_TTL = 5.0
+
+# Redis INFO fields reported by the health endpoints, with fallback values
+_REDIS_INFO_DEFAULTS = {
+    "redis_version": "unknown",
+    "uptime_in_seconds": 0,
+    "connected_clients": 0,
+    "used_memory_human": "unknown",
+    "used_memory_peak_human": "unknown",
+    "maxmemory_human": "unknown",
+    "maxmemory_policy": "unknown",
+    "total_connections_received": 0,
+    "total_commands_processed": 0,
+    "keyspace_hits": 0,
+    "keyspace_misses": 0,
+    "expired_keys": 0,
+}
+_REDIS_INFO_KEYS = tuple(_REDIS_INFO_DEFAULTS)
+_REDIS_SUMMARY_KEYS = (
+    "uptime_in_seconds",
+    "connected_clients",
+    "used_memory_human",
+    "total_connections_received",
+    "total_commands_processed",
+)
+_REDIS_COMPONENT_KEYS = (
+    "connected_clients",
+    "used_memory_human",
+    "keyspace_hits",
+    "keyspace_misses",
+)
+
+
+# Prometheus gauges served by /metrics: (name, help, source, source key)
+_METRICS_REGISTRY = CollectorRegistry()
+_METRIC_DEFINITIONS = (
+    # Database metrics
+    ("testgen_database_connections_active", "Active database connections", "db", "connection_count"),
+    ("testgen_database_size_mb", "Database size in megabytes", "db", "database_size_mb"),
+    ("testgen_database_pool_utilization", "Checked-out pool connections", "db", "pool_utilization"),
+    ("testgen_database_errors_last_hour", "Database errors in the last hour", "db", "error_count"),
+    # Generation metrics
+    ("testgen_generations_24h", "Test generations in the last 24 hours", "generation", "total_generations_24h"),
+    ("testgen_avg_processing_time_seconds", "Average generation processing time", "generation", "avg_processing_time"),
+    ("testgen_avg_quality_score", "Average generated test quality score", "generation", "avg_quality_score"),
+    ("testgen_incomplete_generations", "Generations without an end time", "generation", "incomplete_generations"),
+    # Redis metrics
+    ("testgen_redis_connected_clients", "Connected Redis clients", "redis", "connected_clients"),
+    ("testgen_redis_used_memory_bytes", "Redis memory usage in bytes", "redis", "used_memory"),
+    ("testgen_redis_keyspace_hits", "Redis keyspace hits", "redis", "keyspace_hits"),
+    ("testgen_redis_keyspace_misses", "Redis keyspace misses", "redis", "keyspace_misses"),
+    ("testgen_redis_hit_rate", "Application cache hit ratio", "cache", "hit_ratio"),
+    ("testgen_redis_total_keys", "Application cache lookups", "cache", "total_keys"),
+    ("testgen_redis_cache_errors", "Application cache errors", "cache", "total_errors"),
+)
+_METRIC_GAUGES = tuple(
+    (Gauge(name, description, registry=_METRICS_REGISTRY), source, key)
+    for name, description, source, key in _METRIC_DEFINITIONS
+)
+
+# Latest rendered metrics, refreshed in the background by metrics_refresher()
+_metrics_snapshot: Optional[bytes] = None
+
+
+def _extract_redis_info(info: Dict[str, Any], keys=_REDIS_INFO_KEYS) -> Dict[str, Any]:
+    """
+    Extract the reported subset of Redis INFO fields.
+    
+    ``redis_version`` is always reported as ``version``.
+    
+    Args:
+        info: Raw Redis INFO dictionary
+        keys: Fields to extract in addition to the version
+        
+    Returns:
+        Dict containing the selected fields with defaults applied
+    """
+    extracted = {"version": info.get("redis_version", "unknown")}
+    for key in keys:
+        if key != "redis_version":
+            extracted[key] = info.get(key, _REDIS_INFO_DEFAULTS[key])
+    return extracted
+
 
 @router.get("/health", tags=["health"])
 async def health_check() -> Dict[str, Any]:
@@ -34,11 +121,14 @@ async def health_check() -> Dict[str, Any]:
         Dict containing basic health status
     """
     try:
-        # Quick database connectivity check
-        db_healthy = await quick_health_check()
-        
-        # Quick Redis connectivity check
-        redis_healthy = await ping_redis()
+        # Database and Redis connectivity checks run concurrently
+        db_healthy, redis_healthy = await asyncio.gather(
+            cached("db_quick", PROBE_CACHE_TTL, quick_health_check),
+            cached("redis_ping", PROBE_CACHE_TTL, ping_redis),
+            return_exceptions=True
+        )
+        db_healthy = db_healthy is True
+        redis_healthy = redis_healthy is True
         
         status = "healthy" if (db_healthy and redis_healthy) else "unhealthy"
         
@@ -65,22 +155,21 @@ async def detailed_health_check_endpoint() -> Dict[str, Any]:
         Dict containing detailed health information
     """
     try:
-        health_info = await detailed_health_check()
+        health_info, redis_probe = await asyncio.gather(
+            single_flight("detailed", detailed_health_check),
+            redis_probe_batch(),
+            return_exceptions=True
+        )
+        if isinstance(health_info, Exception):
+            raise health_info
+        if isinstance(redis_probe, Exception):
+            redis_probe = (False, {"error": str(redis_probe)})
+        redis_healthy, redis_info = redis_probe
         
         # Add Redis health information
-        redis_info = await get_redis_info()
-        redis_healthy = await ping_redis()
-        
         health_info["redis"] = {
             "status": "healthy" if redis_healthy else "unhealthy",
-            "info": {
-                "version": redis_info.get("redis_version", "unknown"),
-                "uptime_in_seconds": redis_info.get("uptime_in_seconds", 0),
-                "connected_clients": redis_info.get("connected_clients", 0),
-                "used_memory_human": redis_info.get("used_memory_human", "unknown"),
-                "total_connections_received": redis_info.get("total_connections_received", 0),
-                "total_commands_processed": redis_info.get("total_commands_processed", 0)
-            }
+            "info": _extract_redis_info(redis_info, _REDIS_SUMMARY_KEYS)
         }
         
         # Update overall status if Redis is unhealthy
@@ -100,7 +189,7 @@ async def detailed_health_check_endpoint() -> Dict[str, Any]:
 
 
 @router.get("/health/database", tags=["health"])
-async def database_health_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def database_health_check() -> Dict[str, Any]:
     """
     Database-specific health check.
     
@@ -108,7 +197,7 @@ async def database_health_check(db: AsyncSession = Depends(get_db)) -> Dict[str,
         Dict containing database health information
     """
     try:
-        metrics = await get_database_metrics()
+        metrics = await cached("db_metrics", METRICS_CACHE_TTL, get_database_metrics)
         
         if metrics.get("database_status") != "healthy":
             raise HTTPException(status_code=503, detail=metrics)
@@ -135,14 +224,12 @@ async def redis_health_check() -> Dict[str, Any]:
         Dict containing Redis health information
     """
     try:
-        # Check Redis connectivity
-        redis_healthy = await ping_redis()
-        
-        # Get Redis info
-        redis_info = await get_redis_info()
-        
-        # Get cache statistics
-        cache_stats = await get_cache_stats()
+        # Check Redis connectivity and get Redis info in one round trip,
+        # alongside the cache statistics
+        (redis_healthy, redis_info), cache_stats = await asyncio.gather(
+            redis_probe_batch(),
+            get_cache_stats()
+        )
         
         if not redis_healthy:
             raise HTTPException(status_code=503, detail={
@@ -154,20 +241,7 @@ async def redis_health_check() -> Dict[str, Any]:
         return {
             "status": "healthy",
             "message": "Redis is healthy and operational",
-            "info": {
-                "version": redis_info.get("redis_version", "unknown"),
-                "uptime_in_seconds": redis_info.get("uptime_in_seconds", 0),
-                "connected_clients": redis_info.get("connected_clients", 0),
-                "used_memory_human": redis_info.get("used_memory_human", "unknown"),
-                "used_memory_peak_human": redis_info.get("used_memory_peak_human", "unknown"),
-                "maxmemory_human": redis_info.get("maxmemory_human", "unknown"),
-                "maxmemory_policy": redis_info.get("maxmemory_policy", "unknown"),
-                "total_connections_received": redis_info.get("total_connections_received", 0),
-                "total_commands_processed": redis_info.get("total_commands_processed", 0),
-                "keyspace_hits": redis_info.get("keyspace_hits", 0),
-                "keyspace_misses": redis_info.get("keyspace_misses", 0),
-                "expired_keys": redis_info.get("expired_keys", 0)
-            },
+            "info": _extract_redis_info(redis_info),
             "cache_stats": cache_stats
         }
         
@@ -187,15 +261,20 @@ async def components_health_check() -> Dict[str, Any]:
         Dict containing health status of all components
     """
     try:
-        # Database health
-        db_health = await get_database_metrics()
-        
-        # Redis health
-        redis_healthy = await ping_redis()
-        redis_info = await get_redis_info()
-        
-        # Test generation system health
-        generation_health = await check_test_generation_health()
+        # Database, Redis and test generation probes are independent
+        db_health, redis_probe, generation_health = await asyncio.gather(
+            cached("db_metrics", METRICS_CACHE_TTL, get_database_metrics),
+            redis_probe_batch(),
+            cached("generation_metrics", METRICS_CACHE_TTL, check_test_generation_health),
+            return_exceptions=True
+        )
+        if isinstance(db_health, Exception):
+            db_health = {"database_status": "unhealthy", "error": str(db_health)}
+        if isinstance(redis_probe, Exception):
+            redis_probe = (False, {"error": str(redis_probe)})
+        redis_healthy, redis_info = redis_probe
+        if isinstance(generation_health, Exception):
+            generation_health = {"healthy": False, "error": str(generation_health)}
         
         # Overall system health
         overall_healthy = (
@@ -217,13 +296,7 @@ async def components_health_check() -> Dict[str, Any]:
                 },
                 "redis": {
                     "status": "healthy" if redis_healthy else "unhealthy",
-                    "metrics": {
-                        "version": redis_info.get("redis_version", "unknown"),
-                        "connected_clients": redis_info.get("connected_clients", 0),
-                        "used_memory_human": redis_info.get("used_memory_human", "unknown"),
-                        "keyspace_hits": redis_info.get("keyspace_hits", 0),
-                        "keyspace_misses": redis_info.get("keyspace_misses", 0)
-                    }
+                    "metrics": _extract_redis_info(redis_info, _REDIS_COMPONENT_KEYS)
                 },
                 "vector_db": {
                     "status": "unknown",  # TODO: Implement Vector DB health check
@@ -247,8 +320,13 @@ async def readiness_check() -> Dict[str, Any]:
     """
     try:
         # Check if all critical components are ready
-        db_ready = await quick_health_check()
-        redis_ready = await ping_redis()
+        db_ready, redis_ready = await asyncio.gather(
+            cached("db_quick", PROBE_CACHE_TTL, quick_health_check),
+            cached("redis_ping", PROBE_CACHE_TTL, ping_redis),
+            return_exceptions=True
+        )
+        db_ready = db_ready is True
+        redis_ready = redis_ready is True
         
         # Add additional readiness checks here
         # - Vector database connectivity
@@ -295,47 +373,73 @@ async def liveness_check() -> Dict[str, Any]:
         raise HTTPException(status_code=503, detail="Liveness check failed")
 
 
-@router.get("/metrics", tags=["monitoring"])
-async def get_metrics() -> Dict[str, Any]:
+async def refresh_metrics_snapshot() -> bytes:
     """
-    Prometheus-compatible metrics endpoint.
+    Collect metrics from all sources and render a new snapshot.
     
     Returns:
-        Dict containing metrics for monitoring
+        bytes: Metrics in the Prometheus text exposition format
     """
-    try:
-        db_metrics = await get_database_metrics()
-        generation_metrics = await check_test_generation_health()
-        
-        # Get Redis metrics
-        redis_info = await get_redis_info()
-        cache_stats = await get_cache_stats()
-        
-        return {
-            # Database metrics
-            "testgen_database_connections_active": db_metrics.get("connection_count", 0),
-            "testgen_database_size_mb": db_metrics.get("database_size_mb", 0),
-            "testgen_database_pool_utilization": db_metrics.get("pool_utilization", 0),
-            "testgen_database_errors_last_hour": db_metrics.get("error_count", 0),
-            
-            # Generation metrics
-            "testgen_generations_24h": generation_metrics.get("total_generations_24h", 0),
-            "testgen_avg_processing_time_seconds": generation_metrics.get("avg_processing_time", 0),
-            "testgen_avg_quality_score": generation_metrics.get("avg_quality_score", 0),
-            "testgen_incomplete_generations": generation_metrics.get("incomplete_generations", 0),
-            
-            # Redis metrics
-            "testgen_redis_connected_clients": redis_info.get("connected_clients", 0),
-            "testgen_redis_used_memory_bytes": redis_info.get("used_memory", 0),
-            "testgen_redis_keyspace_hits": redis_info.get("keyspace_hits", 0),
-            "testgen_redis_keyspace_misses": redis_info.get("keyspace_misses", 0),
-            "testgen_redis_hit_rate": cache_stats.get("summary", {}).get("hit_ratio", 0),
-            "testgen_redis_total_keys": cache_stats.get("summary", {}).get("total_keys", 0),
-            "testgen_redis_cache_errors": cache_stats.get("summary", {}).get("total_errors", 0),
-            
-            "timestamp": db_metrics.get("timestamp")
-        }
-        
-    except Exception as e:
-        logger.error("Metrics collection failed", error=str(e))
-        raise HTTPException(status_code=503, detail="Metrics collection failed")
+    global _metrics_snapshot
+    
+    db_metrics, generation_metrics, redis_info, cache_stats = await asyncio.gather(
+        get_database_metrics(),
+        check_test_generation_health(),
+        get_redis_info(),
+        get_cache_stats(),
+        return_exceptions=True
+    )
+    # A failed source reports zeroed metrics rather than failing the refresh
+    if isinstance(db_metrics, Exception):
+        db_metrics = {}
+    if isinstance(generation_metrics, Exception):
+        generation_metrics = {}
+    if isinstance(redis_info, Exception):
+        redis_info = {}
+    if isinstance(cache_stats, Exception):
+        cache_stats = {}
+    
+    sources = {
+        "db": db_metrics,
+        "generation": generation_metrics,
+        "redis": redis_info,
+        "cache": cache_stats.get("summary", {}),
+    }
+    for gauge, source, key in _METRIC_GAUGES:
+        gauge.set(sources[source].get(key) or 0)
+    
+    _metrics_snapshot = generate_latest(_METRICS_REGISTRY)
+    return _metrics_snapshot
+
+
+async def metrics_refresher(interval: float = settings.METRICS_REFRESH_INTERVAL_SECONDS) -> None:
+    """
+    Keep the metrics snapshot fresh so scrapes never hit the database.
+    
+    Intended to run as a background task for the lifetime of the app.
+    
+    Args:
+        interval: Seconds between refreshes
+    """
+    while True:
+        try:
+            await refresh_metrics_snapshot()
+        except Exception as e:
+            logger.error("Metrics refresh failed", error=str(e))
+        await asyncio.sleep(interval)
+
+
+@router.get("/metrics", tags=["monitoring"], response_model=None)
+async def get_metrics() -> Response:
+    """
+    Prometheus metrics endpoint.
+    
+    Serves the latest snapshot rendered by the background refresher.
+    
+    Returns:
+        Response with metrics in the Prometheus text exposition format
+    """
+    if _metrics_snapshot is None:
+        raise HTTPException(status_code=503, detail="Metrics not yet collected")
+    
+    return Response(content=_metrics_snapshot, media_type=CONTENT_TYPE_LATEST)
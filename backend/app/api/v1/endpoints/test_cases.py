@@ -6,28 +6,35 @@ generation, retrieval, and management with comprehensive error handling
 and validation.
 """
 
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
+import asyncio
+from typing import List, Optional, Dict, Any, Set
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, null, text
+from sqlalchemy.orm import selectinload, load_only, noload
 import structlog
+import time
 import uuid
 from datetime import datetime
 
+from app.core.database import get_db, get_db_readonly
 from app.api.v1.dependencies import (
-    get_database_session,
     rate_limit_dependency,
     validate_quality_threshold,
     validate_pagination
 )
 from app.models.test_case import TestCase, TestClassification, TestPriority
+from app.models.quality_metrics import QualityMetrics
 from app.models.user_story import UserStory
+from app.api.v1.endpoints.user_stories import invalidate_user_story_counts
+from app.utils.cache import cache_get, cache_set, generate_cache_key
+from app.utils.cache_invalidation import TEST_CASE_CACHE_PREFIX, invalidate_test_case_caches
 from app.schemas.generation.request import GenerationRequest, UserStoryInput, GenerationOptions
 from app.schemas.generation.response import (
     GenerationResult, 
     GeneratedTestCase, 
     GenerationSummary,
+    GenerationTask,
     TestStep,
     QualityMetricsOutput
 )
@@ -36,6 +43,123 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# Read endpoints are cached in Redis keyed on their query parameters; list
+# pages and detail entries are invalidated on test case and user story writes.
+LIST_CACHE_TTL = 30
+DETAIL_CACHE_TTL = 60
+
+# Generation runs in the background; task status is kept in Redis
+GENERATION_TASK_PREFIX = "testgen:generation"
+GENERATION_TASK_TTL = 3600
+
+# Running generation tasks, referenced until they finish
+_generation_tasks: Set[asyncio.Task] = set()
+
+# How long shutdown waits for running generations before cancelling them
+GENERATION_SHUTDOWN_GRACE_SECONDS = 10
+
+# Columns read by TestCase.to_dict(include_sensitive=False)
+TEST_CASE_DETAIL_COLUMNS = tuple(
+    getattr(TestCase, column.key) for column in TestCase.__table__.c
+    if column.name not in ("deleted_at", "deleted_by", "created_by", "updated_by")
+)
+
+
+# Fixed mock payloads, built once at import rather than on every call
+_POSITIVE_STEPS = (
+    TestStep(
+        step_number=1,
+        action="Navigate to the application",
+        expected_result="Application loads successfully"
+    ),
+    TestStep(
+        step_number=2,
+        action="Perform the main action from user story",
+        expected_result="Action completes successfully"
+    ),
+    TestStep(
+        step_number=3,
+        action="Verify the expected outcome",
+        expected_result="Expected outcome is achieved"
+    )
+)
+
+_POSITIVE_TAGS = ("smoke", "regression", "positive")
+
+_POSITIVE_QUALITY = QualityMetricsOutput(
+    overall_score=0.87,
+    clarity_score=0.90,
+    completeness_score=0.85,
+    executability_score=0.88,
+    traceability_score=0.92,
+    realism_score=0.85,
+    coverage_score=0.82,
+    confidence_level="high",
+    quality_issues_count=0,
+    validation_passed=True
+)
+
+_NEGATIVE_STEPS = (
+    TestStep(
+        step_number=1,
+        action="Navigate to the application",
+        expected_result="Application loads successfully"
+    ),
+    TestStep(
+        step_number=2,
+        action="Attempt the action with invalid data",
+        expected_result="Appropriate error message is displayed"
+    ),
+    TestStep(
+        step_number=3,
+        action="Verify error handling",
+        expected_result="System handles error gracefully"
+    )
+)
+
+_NEGATIVE_TAGS = ("error-handling", "negative", "regression")
+
+_NEGATIVE_QUALITY = QualityMetricsOutput(
+    overall_score=0.82,
+    clarity_score=0.85,
+    completeness_score=0.80,
+    executability_score=0.85,
+    traceability_score=0.88,
+    realism_score=0.80,
+    coverage_score=0.78,
+    confidence_level="high",
+    quality_issues_count=1,
+    validation_passed=True
+)
+
+_EDGE_STEPS = (
+    TestStep(
+        step_number=1,
+        action="Set up boundary condition scenario",
+        expected_result="System is ready for edge case testing"
+    ),
+    TestStep(
+        step_number=2,
+        action="Execute action at boundary limits",
+        expected_result="System handles boundary conditions correctly"
+    )
+)
+
+_EDGE_TAGS = ("edge-case", "boundary", "manual")
+
+_EDGE_QUALITY = QualityMetricsOutput(
+    overall_score=0.75,
+    clarity_score=0.78,
+    completeness_score=0.72,
+    executability_score=0.75,
+    traceability_score=0.80,
+    realism_score=0.73,
+    coverage_score=0.77,
+    confidence_level="medium",
+    quality_issues_count=2,
+    validation_passed=True
+)
+
 
 async def mock_test_generation_service(
     story_input: UserStoryInput,
@@ -56,10 +180,11 @@ async def mock_test_generation_service(
         GenerationResult: Generated test cases with quality metrics
     """
     logger.info("Generating test cases", story_title=story_input.title)
+    start_time = time.perf_counter()
     
-    # Simulate processing time
-    import asyncio
-    await asyncio.sleep(0.5)
+    # Derive title variants once for all generated cases
+    title_lower = story_input.title.lower()
+    title_short = title_lower.removeprefix('as a user, i want to ')
     
     # Generate mock test cases based on story content
     test_cases = []
@@ -67,88 +192,34 @@ async def mock_test_generation_service(
     # Positive test case
     positive_case = GeneratedTestCase(
         id=str(uuid.uuid4()),
-        title=f"Verify {story_input.title.lower().replace('as a user, i want to ', '')}",
-        description=f"Test the successful execution of {story_input.title.lower()}",
-        steps=[
-            TestStep(
-                step_number=1,
-                action="Navigate to the application",
-                expected_result="Application loads successfully"
-            ),
-            TestStep(
-                step_number=2,
-                action="Perform the main action from user story",
-                expected_result="Action completes successfully"
-            ),
-            TestStep(
-                step_number=3,
-                action="Verify the expected outcome",
-                expected_result="Expected outcome is achieved"
-            )
-        ],
+        title=f"Verify {title_short}",
+        description=f"Test the successful execution of {title_lower}",
+        steps=list(_POSITIVE_STEPS),
         test_type="positive",
         classification="ui_automation",
         classification_confidence=0.85,
         classification_reasoning="UI interaction with clear automation points",
         priority="high",
         estimated_duration=15,
-        tags=["smoke", "regression", "positive"],
-        quality_metrics=QualityMetricsOutput(
-            overall_score=0.87,
-            clarity_score=0.90,
-            completeness_score=0.85,
-            executability_score=0.88,
-            traceability_score=0.92,
-            realism_score=0.85,
-            coverage_score=0.82,
-            confidence_level="high",
-            quality_issues_count=0,
-            validation_passed=True
-        )
+        tags=list(_POSITIVE_TAGS),
+        quality_metrics=_POSITIVE_QUALITY
     )
     test_cases.append(positive_case)
     
     # Negative test case
     negative_case = GeneratedTestCase(
         id=str(uuid.uuid4()),
-        title=f"Verify error handling for {story_input.title.lower().replace('as a user, i want to ', '')}",
-        description=f"Test error scenarios for {story_input.title.lower()}",
-        steps=[
-            TestStep(
-                step_number=1,
-                action="Navigate to the application",
-                expected_result="Application loads successfully"
-            ),
-            TestStep(
-                step_number=2,
-                action="Attempt the action with invalid data",
-                expected_result="Appropriate error message is displayed"
-            ),
-            TestStep(
-                step_number=3,
-                action="Verify error handling",
-                expected_result="System handles error gracefully"
-            )
-        ],
+        title=f"Verify error handling for {title_short}",
+        description=f"Test error scenarios for {title_lower}",
+        steps=list(_NEGATIVE_STEPS),
         test_type="negative",
         classification="ui_automation",
         classification_confidence=0.80,
         classification_reasoning="Error handling scenarios suitable for automation",
         priority="medium",
         estimated_duration=12,
-        tags=["error-handling", "negative", "regression"],
-        quality_metrics=QualityMetricsOutput(
-            overall_score=0.82,
-            clarity_score=0.85,
-            completeness_score=0.80,
-            executability_score=0.85,
-            traceability_score=0.88,
-            realism_score=0.80,
-            coverage_score=0.78,
-            confidence_level="high",
-            quality_issues_count=1,
-            validation_passed=True
-        )
+        tags=list(_NEGATIVE_TAGS),
+        quality_metrics=_NEGATIVE_QUALITY
     )
     test_cases.append(negative_case)
     
@@ -156,39 +227,17 @@ async def mock_test_generation_service(
     if options.max_test_cases > 2:
         edge_case = GeneratedTestCase(
             id=str(uuid.uuid4()),
-            title=f"Verify boundary conditions for {story_input.title.lower().replace('as a user, i want to ', '')}",
-            description=f"Test edge cases and boundary conditions for {story_input.title.lower()}",
-            steps=[
-                TestStep(
-                    step_number=1,
-                    action="Set up boundary condition scenario",
-                    expected_result="System is ready for edge case testing"
-                ),
-                TestStep(
-                    step_number=2,
-                    action="Execute action at boundary limits",
-                    expected_result="System handles boundary conditions correctly"
-                )
-            ],
+            title=f"Verify boundary conditions for {title_short}",
+            description=f"Test edge cases and boundary conditions for {title_lower}",
+            steps=list(_EDGE_STEPS),
             test_type="edge",
             classification="manual",
             classification_confidence=0.70,
             classification_reasoning="Edge cases often require manual validation",
             priority="low",
             estimated_duration=20,
-            tags=["edge-case", "boundary", "manual"],
-            quality_metrics=QualityMetricsOutput(
-                overall_score=0.75,
-                clarity_score=0.78,
-                completeness_score=0.72,
-                executability_score=0.75,
-                traceability_score=0.80,
-                realism_score=0.73,
-                coverage_score=0.77,
-                confidence_level="medium",
-                quality_issues_count=2,
-                validation_passed=True
-            )
+            tags=list(_EDGE_TAGS),
+            quality_metrics=_EDGE_QUALITY
         )
         test_cases.append(edge_case)
     
@@ -198,17 +247,30 @@ async def mock_test_generation_service(
         if tc.quality_metrics.overall_score >= options.quality_threshold
     ]
     
-    # Calculate summary metrics
-    avg_quality = sum(tc.quality_metrics.overall_score for tc in filtered_cases) / len(filtered_cases)
+    # Calculate summary metrics and quality distribution in a single pass
+    excellent = good = fair = poor = 0
+    total_quality = 0.0
+    for tc in filtered_cases:
+        score = tc.quality_metrics.overall_score
+        total_quality += score
+        if score >= 0.85:
+            excellent += 1
+        elif score >= 0.75:
+            good += 1
+        elif score >= 0.60:
+            fair += 1
+        else:
+            poor += 1
+    avg_quality = total_quality / len(filtered_cases) if filtered_cases else 0.0
     
     summary = GenerationSummary(
         average_quality_score=avg_quality,
-        processing_time_seconds=0.5,
+        processing_time_seconds=time.perf_counter() - start_time,
         quality_distribution={
-            "excellent": len([tc for tc in filtered_cases if tc.quality_metrics.overall_score >= 0.85]),
-            "good": len([tc for tc in filtered_cases if 0.75 <= tc.quality_metrics.overall_score < 0.85]),
-            "fair": len([tc for tc in filtered_cases if 0.60 <= tc.quality_metrics.overall_score < 0.75]),
-            "poor": len([tc for tc in filtered_cases if tc.quality_metrics.overall_score < 0.60])
+            "excellent": excellent,
+            "good": good,
+            "fair": fair,
+            "poor": poor
         },
         complexity_score=0.6,  # Mock complexity score
         coverage_analysis={
@@ -231,29 +293,169 @@ async def mock_test_generation_service(
     )
 
 
-@router.post("/generate", response_model=GenerationResult)
+async def fast_count(db: AsyncSession, filters: List[Any], exact: bool = False) -> int:
+    """
+    Count active test cases matching the given filters.
+    
+    Without filters (and unless ``exact`` is set) the planner's row estimate
+    from ``pg_class`` is returned instead of scanning the table.
+    
+    Args:
+        db: Database session
+        filters: Filter clauses applied on top of the soft-delete filter
+        exact: Always run an exact count
+        
+    Returns:
+        int: Number of matching test cases (estimated when unfiltered)
+    """
+    if not filters and not exact:
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": TestCase.__table__.fullname}
+        )
+        estimate = result.scalar()
+        # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+        if estimate is not None and estimate > 0:
+            return estimate
+    
+    count_result = await db.execute(
+        select(func.count(TestCase.id)).where(TestCase.is_deleted == False, *filters)
+    )
+    return count_result.scalar()
+
+
+async def _run_generation(task_id: str, request: GenerationRequest, user_story_id: int) -> None:
+    """
+    Run test case generation for a queued task and record its outcome.
+    
+    Args:
+        task_id: Generation task ID
+        request: Original generation request
+        user_story_id: ID of the stored user story
+    """
+    try:
+        generation_result = await mock_test_generation_service(request.story, request.options)
+        
+        # Store generated test cases in database
+        # In a real implementation, this would persist the generated cases;
+        # for now, we'll just log the action
+        logger.info("Storing generated test cases in database", task_id=task_id)
+        # Pages cached while the task was running predate the stored cases
+        await invalidate_test_case_caches()
+        
+        task = GenerationTask(
+            task_id=task_id,
+            status="completed",
+            user_story_id=user_story_id,
+            result=generation_result
+        )
+        
+        logger.info(
+            "Test case generation completed",
+            task_id=task_id,
+            cases_generated=len(generation_result.test_cases),
+            average_quality=generation_result.summary.average_quality_score,
+            processing_time=generation_result.summary.processing_time_seconds
+        )
+        
+    except asyncio.CancelledError:
+        # Leave pollers a final status instead of a task stuck in pending
+        await _record_generation_outcome(GenerationTask(
+            task_id=task_id,
+            status="failed",
+            user_story_id=user_story_id,
+            error="Test case generation was interrupted by shutdown"
+        ))
+        raise
+    except Exception as e:
+        logger.error(
+            "Test case generation failed",
+            task_id=task_id,
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        task = GenerationTask(
+            task_id=task_id,
+            status="failed",
+            user_story_id=user_story_id,
+            error=f"Test case generation failed: {str(e)}"
+        )
+    
+    await _record_generation_outcome(task)
+
+
+async def _record_generation_outcome(task: GenerationTask) -> None:
+    """
+    Store a finished generation task where get_generation_task can poll it.
+    
+    The write is retried once. If a completed result still cannot be stored,
+    a small failed record is attempted so the task does not stay pending
+    until its TTL runs out.
+    
+    Args:
+        task: Finished generation task
+    """
+    task_key = f"{GENERATION_TASK_PREFIX}:{task.task_id}"
+    payload = task.model_dump(mode="json")
+    for _ in range(2):
+        if await cache_set(task_key, payload, GENERATION_TASK_TTL):
+            return
+    
+    logger.error(
+        "Failed to store generation task outcome",
+        task_id=task.task_id,
+        status=task.status
+    )
+    if task.status != "failed":
+        failed_task = GenerationTask(
+            task_id=task.task_id,
+            status="failed",
+            user_story_id=task.user_story_id,
+            error="Test case generation finished but its result could not be stored"
+        )
+        await cache_set(task_key, failed_task.model_dump(mode="json"), GENERATION_TASK_TTL)
+
+
+async def shutdown_generation_tasks(timeout: float = GENERATION_SHUTDOWN_GRACE_SECONDS) -> None:
+    """
+    Wait briefly for running generations, then cancel whatever is left.
+    
+    Args:
+        timeout: Seconds to wait before cancelling
+    """
+    if not _generation_tasks:
+        return
+    
+    _, pending = await asyncio.wait(set(_generation_tasks), timeout=timeout)
+    for generation_task in pending:
+        generation_task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    
+    if pending:
+        logger.warning("Cancelled unfinished generation tasks", count=len(pending))
+
+
+@router.post("/generate", response_model=GenerationTask, status_code=status.HTTP_202_ACCEPTED)
 async def generate_test_cases(
     request: GenerationRequest,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_database_session),
+    db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(rate_limit_dependency())
-) -> GenerationResult:
+) -> GenerationTask:
     """
-    Generate test cases from a user story.
+    Queue test case generation for a user story.
     
-    This endpoint accepts a user story and generates comprehensive test cases
-    using AI-powered generation with quality validation and optimization.
+    The user story is stored immediately and generation runs in the
+    background; poll ``GET /generate/{task_id}`` for the result.
     
     Args:
         request: Generation request containing user story and options
-        background_tasks: Background tasks for async processing
         db: Database session
         
     Returns:
-        GenerationResult: Generated test cases with quality metrics
+        GenerationTask: The pending generation task
         
     Raises:
-        HTTPException: If generation fails or validation errors occur
+        HTTPException: If the request is invalid or the task cannot be queued
     """
     try:
         logger.info(
@@ -264,7 +466,7 @@ async def generate_test_cases(
         )
         
         # Validate quality threshold
-        quality_threshold = await validate_quality_threshold(request.options.quality_threshold)
+        quality_threshold = validate_quality_threshold(request.options.quality_threshold)
         request.options.quality_threshold = quality_threshold
         
         # Check if user story already exists
@@ -279,7 +481,8 @@ async def generate_test_cases(
             user_story = result.scalar_one_or_none()
         
         # Create or update user story in database
-        if not user_story:
+        story_created = user_story is None
+        if story_created:
             user_story = UserStory(
                 azure_devops_id=request.story.azure_devops_id or f"generated_{uuid.uuid4()}",
                 title=request.story.title,
@@ -289,31 +492,42 @@ async def generate_test_cases(
                 created_by="api_user"
             )
             db.add(user_story)
-            await db.flush()  # Get the ID without committing
         
-        # Generate test cases using the mock service
-        generation_result = await mock_test_generation_service(request.story, request.options)
+        # Commit (flushing the new story and assigning its ID) before any
+        # generation work so no transaction stays open while it runs
+        await db.commit()
         
-        # Store generated test cases in database
-        def create_test_cases_in_background():
-            """Background task to store test cases."""
-            logger.info("Storing generated test cases in database")
-            # In a real implementation, this would be an async background task
-            # For now, we'll just log the action
-            
-        background_tasks.add_task(create_test_cases_in_background)
+        # Listings and details may now be stale
+        await invalidate_test_case_caches()
+        if story_created:
+            await invalidate_user_story_counts()
         
-        await db.commit()
+        # Record the pending task before starting it so it can be polled
+        task = GenerationTask(
+            task_id=str(uuid.uuid4()),
+            status="pending",
+            user_story_id=user_story.id
+        )
+        task_key = f"{GENERATION_TASK_PREFIX}:{task.task_id}"
+        if not await cache_set(task_key, task.model_dump(mode="json"), GENERATION_TASK_TTL):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Generation task store is unavailable"
+            )
         
-        logger.info(
-            "Test case generation completed",
-            cases_generated=len(generation_result.test_cases),
-            average_quality=generation_result.summary.average_quality_score,
-            processing_time=generation_result.summary.processing_time_seconds
+        # Keep a reference so the task is not garbage collected mid-run
+        generation_task = asyncio.create_task(
+            _run_generation(task.task_id, request, user_story.id)
         )
+        _generation_tasks.add(generation_task)
+        generation_task.add_done_callback(_generation_tasks.discard)
         
-        return generation_result
+        logger.info("Test case generation queued", task_id=task.task_id)
         
+        return task
+        
+    except HTTPException:
+        raise
     except Exception as e:
         await db.rollback()
         logger.error("Test case generation failed", error=str(e), error_type=type(e).__name__)
@@ -323,12 +537,36 @@ async def generate_test_cases(
         )
 
 
+@router.get("/generate/{task_id}", response_model=GenerationTask)
+async def get_generation_task(task_id: str) -> GenerationTask:
+    """
+    Get the status and result of a generation task.
+    
+    Args:
+        task_id: Generation task ID
+        
+    Returns:
+        GenerationTask: Task status, with the result once completed
+        
+    Raises:
+        HTTPException: If the task is unknown or has expired
+    """
+    task_data = await cache_get(f"{GENERATION_TASK_PREFIX}:{task_id}")
+    if task_data is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Generation task {task_id} not found"
+        )
+    return GenerationTask(**task_data)
+
+
 @router.get("/{test_case_id}", response_model=Dict[str, Any])
 async def get_test_case(
     test_case_id: int,
     include_quality: bool = Query(True, description="Include quality metrics"),
     include_relationships: bool = Query(False, description="Include related objects"),
-    db: AsyncSession = Depends(get_database_session)
+    include_steps: bool = Query(True, description="Include steps, test data and conditions"),
+    db: AsyncSession = Depends(get_db_readonly)
 ) -> Dict[str, Any]:
     """
     Get a specific test case by ID.
@@ -337,6 +575,7 @@ async def get_test_case(
         test_case_id: Test case ID
         include_quality: Whether to include quality metrics
         include_relationships: Whether to include related objects
+        include_steps: Whether to include step details in the response
         db: Database session
         
     Returns:
@@ -348,14 +587,29 @@ async def get_test_case(
     try:
         logger.info("Retrieving test case", test_case_id=test_case_id)
         
-        # Build query with optional relationships
+        cache_key = generate_cache_key(
+            f"{TEST_CASE_CACHE_PREFIX}:detail",
+            test_case_id,
+            include_quality=include_quality,
+            include_relationships=include_relationships,
+            include_steps=include_steps
+        )
+        cached_response = await cache_get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        
+        # Build query with optional relationships; the audit columns are
+        # never serialized here so they are not fetched
         query = select(TestCase).where(
             TestCase.id == test_case_id,
             TestCase.is_deleted == False
-        )
+        ).options(load_only(*TEST_CASE_DETAIL_COLUMNS))
         
         if include_quality:
             query = query.options(selectinload(TestCase.quality_metrics))
+        else:
+            # Avoid an implicit lazy load from overall_quality_score
+            query = query.options(noload(TestCase.quality_metrics))
         
         if include_relationships:
             query = query.options(
@@ -375,9 +629,12 @@ async def get_test_case(
         # Convert to dictionary with requested inclusions
         test_case_dict = test_case.to_dict(
             include_relationships=include_relationships,
-            include_sensitive=False
+            include_sensitive=False,
+            include_steps=include_steps
         )
         
+        await cache_set(cache_key, test_case_dict, DETAIL_CACHE_TTL)
+        
         logger.info("Test case retrieved successfully", test_case_id=test_case_id)
         return test_case_dict
         
@@ -401,7 +658,8 @@ async def list_test_cases(
     tag: Optional[str] = Query(None, description="Filter by tag"),
     search: Optional[str] = Query(None, description="Search in title and description"),
     include_quality: bool = Query(False, description="Include quality metrics"),
-    db: AsyncSession = Depends(get_database_session)
+    exact_count: bool = Query(False, description="Always return an exact total count"),
+    db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
     List test cases with filtering and pagination.
@@ -415,6 +673,7 @@ async def list_test_cases(
         tag: Filter by tag
         search: Search term for title/description
         include_quality: Include quality metrics
+        exact_count: Count exactly even when no filters are applied
         db: Database session
         
     Returns:
@@ -422,7 +681,7 @@ async def list_test_cases(
     """
     try:
         # Validate pagination
-        skip, limit = await validate_pagination(skip, limit)
+        skip, limit = validate_pagination(skip, limit)
         
         logger.info(
             "Listing test cases",
@@ -435,54 +694,86 @@ async def list_test_cases(
             search=search
         )
         
-        # Build base query
-        query = select(TestCase).where(TestCase.is_deleted == False)
-        count_query = select(func.count(TestCase.id)).where(TestCase.is_deleted == False)
+        cache_key = generate_cache_key(
+            f"{TEST_CASE_CACHE_PREFIX}:list",
+            skip=skip,
+            limit=limit,
+            user_story_id=user_story_id,
+            classification=classification.value if classification else None,
+            priority=priority.value if priority else None,
+            tag=tag,
+            search=search,
+            include_quality=include_quality,
+            exact_count=exact_count
+        )
+        cached_response = await cache_get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        
+        # Build filters once for the page query (and the count fallback)
+        filters = []
         
-        # Apply filters
         if user_story_id:
-            query = query.where(TestCase.user_story_id == user_story_id)
-            count_query = count_query.where(TestCase.user_story_id == user_story_id)
+            filters.append(TestCase.user_story_id == user_story_id)
         
         if classification:
-            query = query.where(TestCase.classification == classification)
-            count_query = count_query.where(TestCase.classification == classification)
+            filters.append(TestCase.classification == classification)
         
         if priority:
-            query = query.where(TestCase.priority == priority)
-            count_query = count_query.where(TestCase.priority == priority)
+            filters.append(TestCase.priority == priority)
         
         if tag:
-            query = query.where(TestCase.tags.op('?')(tag))
-            count_query = count_query.where(TestCase.tags.op('?')(tag))
+            # Array containment (tags @> ARRAY[tag]) is served by the GIN index
+            filters.append(TestCase.tags.contains([tag]))
         
         if search:
-            search_filter = (
+            filters.append(
                 TestCase.title.ilike(f"%{search}%") |
                 TestCase.description.ilike(f"%{search}%")
             )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
         
-        # Add optional relationships
+        # Select plain columns (no ORM hydration) plus the window total
         if include_quality:
-            query = query.options(selectinload(TestCase.quality_metrics))
-        
-        # Apply pagination and ordering
-        query = query.order_by(TestCase.created_at.desc()).offset(skip).limit(limit)
-        
-        # Execute queries
-        result = await db.execute(query)
-        test_cases = result.scalars().all()
-        
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
+            quality_score = (
+                select(QualityMetrics.overall_score)
+                .where(QualityMetrics.test_case_id == TestCase.id)
+                .order_by(QualityMetrics.id.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+        else:
+            quality_score = null()
+        
+        # Unfiltered listings use the table estimate instead of a full count
+        use_estimate = not filters and not exact_count
+        
+        columns = [*TestCase.__table__.c, quality_score.label("overall_quality_score")]
+        if not use_estimate:
+            columns.append(func.count().over().label("total"))
+        
+        query = (
+            select(*columns)
+            .where(TestCase.is_deleted == False, *filters)
+            .order_by(TestCase.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         
-        # Convert to dictionaries
-        test_cases_data = [
-            tc.to_dict(include_relationships=False, include_sensitive=False)
-            for tc in test_cases
-        ]
+        # Stream rows and serialize them as they arrive
+        total = None
+        test_cases_data = []
+        result = await db.stream(query)
+        async for row in result:
+            if not use_estimate:
+                total = row.total
+            test_cases_data.append(TestCase.row_to_dict(row))
+        
+        if use_estimate:
+            # Keep the estimate consistent with the rows actually returned
+            total = max(await fast_count(db, filters), skip + len(test_cases_data))
+        elif total is None:
+            # Page past the end carries no window count; count separately
+            total = await fast_count(db, filters, exact=True) if skip > 0 else 0
         
         response = {
             "test_cases": test_cases_data,
@@ -492,7 +783,8 @@ async def list_test_cases(
                 "total": total,
                 "pages": (total + limit - 1) // limit,
                 "has_next": skip + limit < total,
-                "has_prev": skip > 0
+                "has_prev": skip > 0,
+                "total_estimated": use_estimate
             },
             "filters": {
                 "user_story_id": user_story_id,
@@ -503,9 +795,11 @@ async def list_test_cases(
             }
         }
         
+        await cache_set(cache_key, response, LIST_CACHE_TTL)
+        
         logger.info(
             "Test cases retrieved successfully",
-            count=len(test_cases),
+            count=len(test_cases_data),
             total=total,
             skip=skip,
             limit=limit
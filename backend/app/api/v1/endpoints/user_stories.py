@@ -5,27 +5,190 @@ This module provides CRUD endpoints for user story management with
 comprehensive validation, filtering, and error handling.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import base64
+import binascii
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, exists, func, tuple_, true, false
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, aliased
 import structlog
 import uuid
 from datetime import datetime
 
+from app.core.database import get_db, get_db_readonly, get_read_engine
 from app.api.v1.dependencies import (
-    get_database_session,
     rate_limit_dependency,
     validate_pagination
 )
-from app.models.user_story import UserStory, ProcessingStatus
+from app.models.user_story import UserStory, ProcessingStatus, LIST_DERIVED_COLUMNS
+from app.models.test_case import TestCase, AUTOMATED_CLASSIFICATIONS
+from app.models.quality_metrics import QualityMetrics
 from app.schemas.generation.request import UserStoryInput
+from app.utils.cache import (
+    cache_get,
+    cache_set,
+    cache_get_many,
+    cache_set_many,
+    cache_delete_pattern,
+    generate_cache_key
+)
+from app.utils.cache_invalidation import invalidate_test_case_caches
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# Filtered list totals are cached until the next user story write
+USER_STORY_COUNT_PREFIX = "testgen:user_stories:count"
+
+# Serialized list rows, keyed by id and updated_at so any write to the row
+# moves it to a fresh key; the TTL bounds drift in derived fields such as
+# days_since_created and total_test_cases
+USER_STORY_DICT_PREFIX = "testgen:user_stories:dict"
+USER_STORY_DICT_TTL = 300
+
+# Largest value of a SERIAL primary key; bounds the ID decoded from a cursor
+MAX_SERIAL_ID = 2 ** 31 - 1
+
+# Pages larger than this are streamed item by item instead of being encoded
+# into one response body
+STREAM_PAGE_THRESHOLD = 200
+
+# Columns read by the list endpoint; everything UserStory.row_to_dict needs
+USER_STORY_LIST_COLUMNS = tuple(
+    column for column in UserStory.__table__.c
+    if column.name not in (
+        "original_content", "normalization_metadata", "search_tsv",
+        "deleted_at", "deleted_by", "created_by", "updated_by"
+    )
+)
+
+# GROUPING() bitmasks over (classification, priority, test_type) identifying
+# which grouping set a statistics row belongs to
+_GROUPED_BY_CLASSIFICATION = 0b011
+_GROUPED_BY_PRIORITY = 0b101
+_GROUPED_BY_TYPE = 0b110
+
+
+async def invalidate_user_story_counts() -> None:
+    """Drop cached user story list totals after a write."""
+    await cache_delete_pattern(f"{USER_STORY_COUNT_PREFIX}:*")
+
+
+def user_story_dict_key(row: Any) -> Optional[str]:
+    """
+    Build the cache key for a serialized user story row.
+    
+    Args:
+        row: User story result row to key
+        
+    Returns:
+        Optional[str]: Cache key, or None if the row has no updated_at yet
+    """
+    if row.updated_at is None:
+        return None
+    return f"{USER_STORY_DICT_PREFIX}:{row.id}:{row.updated_at.timestamp()}"
+
+
+async def serialize_user_stories(rows: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Serialize a page of user story rows, fetching cached rows with one MGET.
+    
+    Args:
+        rows: Result rows in the shape UserStory.row_to_dict expects
+        
+    Returns:
+        List of user story dictionaries in the input order
+    """
+    keys = [user_story_dict_key(row) for row in rows]
+    present_keys = [key for key in keys if key]
+    cached_by_key = dict(zip(present_keys, await cache_get_many(present_keys)))
+    
+    serialized = []
+    misses = {}
+    for row, key in zip(rows, keys):
+        data = cached_by_key.get(key) if key else None
+        if data is None:
+            data = UserStory.row_to_dict(row)
+            if key:
+                misses[key] = data
+        serialized.append(data)
+    
+    await cache_set_many(misses, ttl=USER_STORY_DICT_TTL)
+    return serialized
+
+
+async def iter_list_response(
+    items: List[Dict[str, Any]],
+    metadata: Dict[str, Any]
+) -> AsyncIterator[bytes]:
+    """
+    Encode a list response incrementally, one user story at a time.
+    
+    Produces the same document as encoding
+    ``{"user_stories": items, **metadata}`` in one go.
+    
+    Args:
+        items: Serialized user stories
+        metadata: Remaining top-level fields (pagination, filters)
+        
+    Yields:
+        bytes: Consecutive chunks of the JSON document
+    """
+    yield b'{"user_stories":['
+    for index, item in enumerate(items):
+        yield (b"," if index else b"") + orjson.dumps(item)
+    # Splice the metadata object's members in after the array
+    yield b"]," + orjson.dumps(metadata)[1:]
+
+
+def encode_cursor(created_at: datetime, user_story_id: int) -> str:
+    """
+    Encode a keyset pagination cursor for the given row position.
+    
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        user_story_id: ID of the last row on the page
+        
+    Returns:
+        str: Opaque URL-safe cursor
+    """
+    raw = f"{created_at.isoformat()}|{user_story_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a keyset pagination cursor.
+    
+    Args:
+        cursor: Cursor returned by a previous page
+        
+    Returns:
+        Tuple[datetime, int]: Creation timestamp and ID of the last row seen
+        
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        created_at, user_story_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        position = datetime.fromisoformat(created_at), int(user_story_id)
+        # Issued cursors always carry an aware timestamp and a serial ID;
+        # anything else was tampered with and would fail in the query
+        if position[0].tzinfo is None or not 0 < position[1] <= MAX_SERIAL_ID:
+            raise ValueError("Cursor position out of range")
+        return position
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
 
 class UserStoryCreate(UserStoryInput):
     """Schema for creating a user story."""
@@ -61,10 +224,10 @@ class UserStoryResponse(UserStoryInput):
         from_attributes = True
 
 
-@router.post("", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_user_story(
     story_data: UserStoryCreate,
-    db: AsyncSession = Depends(get_database_session),
+    db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(rate_limit_dependency())
 ) -> Dict[str, Any]:
     """
@@ -83,44 +246,44 @@ async def create_user_story(
     try:
         logger.info("Creating user story", title=story_data.title)
         
-        # Check if Azure DevOps ID already exists
-        if story_data.azure_devops_id:
-            result = await db.execute(
-                select(UserStory).where(
-                    UserStory.azure_devops_id == story_data.azure_devops_id,
-                    UserStory.is_deleted == False
-                )
-            )
-            existing_story = result.scalar_one_or_none()
-            
-            if existing_story:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"User story with Azure DevOps ID '{story_data.azure_devops_id}' already exists"
-                )
-        
-        # Create new user story
-        user_story = UserStory(
-            azure_devops_id=story_data.azure_devops_id or f"manual_{uuid.uuid4()}",
-            title=story_data.title,
-            description=story_data.description,
-            acceptance_criteria=story_data.acceptance_criteria,
-            domain_classification=story_data.domain,
-            processing_status=ProcessingStatus.PENDING,
-            created_by="api_user"
-        )
+        story_values = {
+            "azure_devops_id": story_data.azure_devops_id or f"manual_{uuid.uuid4()}",
+            "title": story_data.title,
+            "description": story_data.description,
+            "acceptance_criteria": story_data.acceptance_criteria,
+            "domain_classification": story_data.domain,
+            "processing_status": ProcessingStatus.PENDING,
+            "created_by": "api_user"
+        }
         
         # Validate content before saving
-        validation_errors = user_story.validate_content()
+        validation_errors = UserStory(**story_values).validate_content()
         if validation_errors:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Validation failed: {'; '.join(validation_errors)}"
             )
         
-        db.add(user_story)
+        # Insert in one round-trip; the unique constraint on azure_devops_id
+        # detects duplicates without a separate (racy) existence check
+        result = await db.execute(
+            pg_insert(UserStory)
+            .values(**story_values)
+            .on_conflict_do_nothing(index_elements=[UserStory.azure_devops_id])
+            .returning(UserStory)
+            .execution_options(populate_existing=True)
+        )
+        user_story = result.scalar_one_or_none()
+        
+        if user_story is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"User story with Azure DevOps ID '{story_values['azure_devops_id']}' already exists"
+            )
+        
+        # RETURNING already carries server defaults; no refresh needed
         await db.commit()
-        await db.refresh(user_story)
+        await invalidate_user_story_counts()
         
         # Convert to response format
         response_data = user_story.to_dict(include_relationships=False, include_sensitive=False)
@@ -131,7 +294,7 @@ async def create_user_story(
             azure_devops_id=user_story.azure_devops_id
         )
         
-        return response_data
+        return ORJSONResponse(response_data, status_code=status.HTTP_201_CREATED)
         
     except HTTPException:
         await db.rollback()
@@ -145,12 +308,12 @@ async def create_user_story(
         )
 
 
-@router.get("/{user_story_id}", response_model=Dict[str, Any])
+@router.get("/{user_story_id}", response_model=None)
 async def get_user_story(
     user_story_id: int,
     include_test_cases: bool = Query(False, description="Include associated test cases"),
     include_relationships: bool = Query(False, description="Include all related objects"),
-    db: AsyncSession = Depends(get_database_session)
+    db: AsyncSession = Depends(get_db_readonly)
 ) -> Dict[str, Any]:
     """
     Get a specific user story by ID.
@@ -176,15 +339,16 @@ async def get_user_story(
             UserStory.is_deleted == False
         )
         
+        # Let the database drop soft-deleted test cases from the eager load
         if include_test_cases or include_relationships:
-            query = query.options(selectinload(UserStory.test_cases))
-        
-        if include_relationships:
             query = query.options(
-                selectinload(UserStory.generation_statistics),
-                selectinload(UserStory.ground_truth_benchmarks)
+                selectinload(UserStory.test_cases.and_(TestCase.is_deleted == False))
             )
         
+        # to_dict serializes generation statistics but not benchmarks
+        if include_relationships:
+            query = query.options(selectinload(UserStory.generation_statistics))
+        
         result = await db.execute(query)
         user_story = result.scalar_one_or_none()
         
@@ -201,7 +365,7 @@ async def get_user_story(
         )
         
         logger.info("User story retrieved successfully", user_story_id=user_story_id)
-        return response_data
+        return ORJSONResponse(response_data)
         
     except HTTPException:
         raise
@@ -213,17 +377,19 @@ async def get_user_story(
         )
 
 
-@router.get("", response_model=Dict[str, Any])
+@router.get("", response_model=None)
 async def list_user_stories(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    status: Optional[ProcessingStatus] = Query(None, description="Filter by processing status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page (overrides skip)"),
+    processing_status: Optional[ProcessingStatus] = Query(None, alias="status", description="Filter by processing status"),
     domain: Optional[str] = Query(None, description="Filter by domain classification"),
     search: Optional[str] = Query(None, description="Search in title, description, and acceptance criteria"),
     complexity_min: Optional[float] = Query(None, ge=0.0, le=1.0, description="Minimum complexity score"),
     complexity_max: Optional[float] = Query(None, ge=0.0, le=1.0, description="Maximum complexity score"),
     include_test_cases: bool = Query(False, description="Include test case counts"),
-    db: AsyncSession = Depends(get_database_session)
+    skip_total: bool = Query(False, description="Skip counting matching records; total and pages are returned as null"),
+    db: AsyncSession = Depends(get_db_readonly)
 ) -> Dict[str, Any]:
     """
     List user stories with filtering and pagination.
@@ -231,12 +397,14 @@ async def list_user_stories(
     Args:
         skip: Number of records to skip
         limit: Number of records to return
-        status: Filter by processing status
+        cursor: Keyset cursor; when given, the page starts after that row
+        processing_status: Filter by processing status
         domain: Filter by domain classification
         search: Search term for title/description/acceptance criteria
         complexity_min: Minimum complexity score
         complexity_max: Maximum complexity score
-        include_test_cases: Include test case information
+        include_test_cases: Kept for compatibility; test case counts are always included
+        skip_total: Skip the total count; has_next comes from one extra row instead
         db: Database session
         
     Returns:
@@ -244,7 +412,7 @@ async def list_user_stories(
     """
     try:
         # Validate pagination
-        skip, limit = await validate_pagination(skip, limit)
+        skip, limit = validate_pagination(skip, limit)
         
         # Validate complexity range
         if complexity_min is not None and complexity_max is not None:
@@ -258,62 +426,107 @@ async def list_user_stories(
             "Listing user stories",
             skip=skip,
             limit=limit,
-            status=status,
+            status=processing_status,
             domain=domain,
             search=search,
             complexity_min=complexity_min,
             complexity_max=complexity_max
         )
         
-        # Build base query
-        query = select(UserStory).where(UserStory.is_deleted == False)
-        count_query = select(func.count(UserStory.id)).where(UserStory.is_deleted == False)
+        # Build filters once for the page query and the count
+        filters = [UserStory.is_deleted == False]
         
-        # Apply filters
-        if status:
-            query = query.where(UserStory.processing_status == status)
-            count_query = count_query.where(UserStory.processing_status == status)
+        if processing_status:
+            filters.append(UserStory.processing_status == processing_status)
         
         if domain:
-            query = query.where(UserStory.domain_classification == domain)
-            count_query = count_query.where(UserStory.domain_classification == domain)
+            filters.append(UserStory.domain_classification == domain)
         
         if search:
-            search_filter = (
-                UserStory.title.ilike(f"%{search}%") |
-                UserStory.description.ilike(f"%{search}%") |
-                UserStory.acceptance_criteria.ilike(f"%{search}%")
+            # Both branches are index-assisted: GIN on search_tsv for words,
+            # trigram GIN on title for substrings
+            filters.append(
+                UserStory.search_tsv.op("@@")(func.plainto_tsquery("english", search)) |
+                UserStory.title.ilike(f"%{search}%")
             )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
         
         if complexity_min is not None:
-            query = query.where(UserStory.complexity_score >= complexity_min)
-            count_query = count_query.where(UserStory.complexity_score >= complexity_min)
+            filters.append(UserStory.complexity_score >= complexity_min)
         
         if complexity_max is not None:
-            query = query.where(UserStory.complexity_score <= complexity_max)
-            count_query = count_query.where(UserStory.complexity_score <= complexity_max)
+            filters.append(UserStory.complexity_score <= complexity_max)
         
-        # Add optional relationships
-        if include_test_cases:
-            query = query.options(selectinload(UserStory.test_cases))
-        
-        # Apply pagination and ordering
-        query = query.order_by(UserStory.created_at.desc()).offset(skip).limit(limit)
-        
-        # Execute queries
-        result = await db.execute(query)
-        user_stories = result.scalars().all()
+        # Read plain rows rather than ORM instances; derived fields are
+        # computed in SQL and the live test case count comes from a
+        # correlated subquery instead of loading the test cases themselves
+        test_case_count = (
+            select(func.count(TestCase.id))
+            .where(
+                TestCase.user_story_id == UserStory.id,
+                TestCase.is_deleted == False
+            )
+            .correlate(UserStory)
+            .scalar_subquery()
+            .label("test_case_count")
+        )
+        query = select(
+            *USER_STORY_LIST_COLUMNS, *LIST_DERIVED_COLUMNS, test_case_count
+        ).where(*filters)
+        count_query = select(func.count(UserStory.id)).where(*filters)
+        
+        # Without a total, one extra row tells whether another page exists
+        page_size = limit + 1 if skip_total else limit
+        
+        # Apply ordering (id breaks created_at ties) and pagination; a
+        # cursor seeks past the last row seen instead of scanning an offset
+        query = query.order_by(UserStory.created_at.desc(), UserStory.id.desc()).limit(page_size)
+        if cursor:
+            query = query.where(tuple_(UserStory.created_at, UserStory.id) < decode_cursor(cursor))
+        else:
+            query = query.offset(skip)
+        
+        # Exact totals are cached per filter combination
+        total = None
+        if not skip_total:
+            count_key = generate_cache_key(
+                USER_STORY_COUNT_PREFIX,
+                status=processing_status.value if processing_status else None,
+                domain=domain,
+                search=search,
+                complexity_min=complexity_min,
+                complexity_max=complexity_max
+            )
+            total = await cache_get(count_key)
+        
+        # Execute queries; on a count cache miss the count runs concurrently
+        # on its own pooled connection instead of after the page query
+        if total is None and not skip_total:
+            async with get_read_engine().connect() as count_conn:
+                result, count_result = await asyncio.gather(
+                    db.execute(query),
+                    count_conn.execute(count_query)
+                )
+            total = count_result.scalar()
+            await cache_set(count_key, total)
+        else:
+            result = await db.execute(query)
+        user_stories = result.all()
+        
+        if skip_total:
+            has_next = len(user_stories) > limit
+            user_stories = user_stories[:limit]
+        elif cursor:
+            has_next = len(user_stories) == limit
+        else:
+            has_next = skip + limit < total
         
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
+        # Convert to dictionaries, reusing cached serializations for the page
+        user_stories_data = await serialize_user_stories(user_stories)
         
-        # Convert to dictionaries
-        user_stories_data = [
-            us.to_dict(include_relationships=False, include_sensitive=False)
-            for us in user_stories
-        ]
+        next_cursor = None
+        if has_next:
+            last = user_stories[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
         
         response = {
             "user_stories": user_stories_data,
@@ -321,12 +534,13 @@ async def list_user_stories(
                 "skip": skip,
                 "limit": limit,
                 "total": total,
-                "pages": (total + limit - 1) // limit,
-                "has_next": skip + limit < total,
-                "has_prev": skip > 0
+                "pages": (total + limit - 1) // limit if total is not None else None,
+                "has_next": has_next,
+                "has_prev": bool(cursor) or skip > 0,
+                "next_cursor": next_cursor
             },
             "filters": {
-                "status": status.value if status else None,
+                "status": processing_status.value if processing_status else None,
                 "domain": domain,
                 "search": search,
                 "complexity_min": complexity_min,
@@ -342,7 +556,17 @@ async def list_user_stories(
             limit=limit
         )
         
-        return response
+        # Stream large pages so the first bytes go out before the whole
+        # body is encoded
+        if len(user_stories_data) > STREAM_PAGE_THRESHOLD:
+            items = response.pop("user_stories")
+            return StreamingResponse(
+                iter_list_response(items, response),
+                media_type="application/json"
+            )
+        
+        # Already JSON-ready; skip FastAPI's jsonable_encoder pass
+        return ORJSONResponse(response)
         
     except HTTPException:
         raise
@@ -354,11 +578,11 @@ async def list_user_stories(
         )
 
 
-@router.put("/{user_story_id}", response_model=Dict[str, Any])
+@router.put("/{user_story_id}", response_model=None)
 async def update_user_story(
     user_story_id: int,
     story_data: UserStoryUpdate,
-    db: AsyncSession = Depends(get_database_session),
+    db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(rate_limit_dependency())
 ) -> Dict[str, Any]:
     """
@@ -378,14 +602,27 @@ async def update_user_story(
     try:
         logger.info("Updating user story", user_story_id=user_story_id)
         
-        # Get existing user story
-        result = await db.execute(
-            select(UserStory).where(
-                UserStory.id == user_story_id,
-                UserStory.is_deleted == False
-            )
+        # Get existing user story, checking a new Azure DevOps ID for
+        # conflicts in the same query
+        query = select(UserStory).where(
+            UserStory.id == user_story_id,
+            UserStory.is_deleted == False
         )
-        user_story = result.scalar_one_or_none()
+        if story_data.azure_devops_id is not None:
+            other = aliased(UserStory)
+            query = query.add_columns(
+                exists().where(
+                    other.azure_devops_id == story_data.azure_devops_id,
+                    other.id != user_story_id,
+                    other.is_deleted == False
+                ).label("azure_devops_id_conflict")
+            )
+        else:
+            query = query.add_columns(false().label("azure_devops_id_conflict"))
+        
+        result = await db.execute(query)
+        row = result.one_or_none()
+        user_story, azure_devops_id_conflict = row if row else (None, False)
         
         if not user_story:
             raise HTTPException(
@@ -393,69 +630,84 @@ async def update_user_story(
                 detail=f"User story with ID {user_story_id} not found"
             )
         
-        # Update fields if provided
-        updated_fields = []
+        # Collect changed columns; the row is written in a single UPDATE below
+        changes: Dict[str, Any] = {}
         
         if story_data.title is not None:
-            user_story.title = story_data.title
-            updated_fields.append("title")
+            changes["title"] = story_data.title
         
         if story_data.description is not None:
-            user_story.description = story_data.description
-            updated_fields.append("description")
+            changes["description"] = story_data.description
         
         if story_data.acceptance_criteria is not None:
-            user_story.acceptance_criteria = story_data.acceptance_criteria
-            updated_fields.append("acceptance_criteria")
+            changes["acceptance_criteria"] = story_data.acceptance_criteria
         
         if story_data.domain is not None:
-            user_story.domain_classification = story_data.domain
-            updated_fields.append("domain")
+            changes["domain_classification"] = story_data.domain
         
         if story_data.azure_devops_id is not None:
-            # Check if new Azure DevOps ID already exists
-            result = await db.execute(
-                select(UserStory).where(
-                    UserStory.azure_devops_id == story_data.azure_devops_id,
-                    UserStory.id != user_story_id,
-                    UserStory.is_deleted == False
-                )
-            )
-            existing_story = result.scalar_one_or_none()
-            
-            if existing_story:
+            if azure_devops_id_conflict:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail=f"User story with Azure DevOps ID '{story_data.azure_devops_id}' already exists"
                 )
             
-            user_story.azure_devops_id = story_data.azure_devops_id
-            updated_fields.append("azure_devops_id")
+            changes["azure_devops_id"] = story_data.azure_devops_id
         
-        if not updated_fields:
+        if not changes:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No fields provided for update"
             )
         
-        # Set updated metadata
-        user_story.updated_by = "api_user"
+        updated_fields = list(changes)
         
-        # Validate updated content
-        validation_errors = user_story.validate_content()
+        # Validate updated content against the merged row
+        candidate = UserStory(
+            title=changes.get("title", user_story.title),
+            description=changes.get("description", user_story.description),
+            acceptance_criteria=changes.get("acceptance_criteria", user_story.acceptance_criteria),
+            azure_devops_id=changes.get("azure_devops_id", user_story.azure_devops_id),
+            complexity_score=user_story.complexity_score
+        )
+        validation_errors = candidate.validate_content()
         if validation_errors:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Validation failed: {'; '.join(validation_errors)}"
             )
         
+        # Set updated metadata
+        changes["updated_by"] = "api_user"
+        
         # Reset processing status if content changed
-        if any(field in updated_fields for field in ["title", "description", "acceptance_criteria"]):
-            user_story.processing_status = ProcessingStatus.PENDING
-            user_story.processed_at = None
+        if any(field in changes for field in ["title", "description", "acceptance_criteria"]):
+            changes["processing_status"] = ProcessingStatus.PENDING
+            changes["processed_at"] = None
+        
+        # Write only the changed columns and reload the row in the same
+        # statement instead of a separate refresh
+        result = await db.execute(
+            update(UserStory)
+            .where(
+                UserStory.id == user_story_id,
+                UserStory.is_deleted == False
+            )
+            .values(**changes)
+            .returning(UserStory)
+            .execution_options(populate_existing=True)
+        )
+        user_story = result.scalar_one_or_none()
+        
+        if not user_story:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User story with ID {user_story_id} not found"
+            )
         
         await db.commit()
-        await db.refresh(user_story)
+        await invalidate_user_story_counts()
+        await invalidate_test_case_caches()
         
         # Convert to response format
         response_data = user_story.to_dict(include_relationships=False, include_sensitive=False)
@@ -466,7 +718,7 @@ async def update_user_story(
             updated_fields=updated_fields
         )
         
-        return response_data
+        return ORJSONResponse(response_data)
         
     except HTTPException:
         await db.rollback()
@@ -484,7 +736,7 @@ async def update_user_story(
 async def delete_user_story(
     user_story_id: int,
     permanent: bool = Query(False, description="Perform permanent delete instead of soft delete"),
-    db: AsyncSession = Depends(get_database_session),
+    db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(rate_limit_dependency())
 ):
     """
@@ -501,31 +753,48 @@ async def delete_user_story(
     try:
         logger.info("Deleting user story", user_story_id=user_story_id, permanent=permanent)
         
-        # Get existing user story
-        result = await db.execute(
-            select(UserStory).where(
-                UserStory.id == user_story_id,
-                UserStory.is_deleted == False if not permanent else True
-            )
-        )
-        user_story = result.scalar_one_or_none()
-        
-        if not user_story:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User story with ID {user_story_id} not found"
-            )
-        
         if permanent:
-            # Permanent delete - remove from database
+            # Permanent delete - load the row so ORM cascades run
+            result = await db.execute(
+                select(UserStory).where(UserStory.id == user_story_id)
+            )
+            user_story = result.scalar_one_or_none()
+            
+            if not user_story:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"User story with ID {user_story_id} not found"
+                )
+            
             await db.delete(user_story)
             logger.info("User story permanently deleted", user_story_id=user_story_id)
         else:
-            # Soft delete - mark as deleted
-            user_story.soft_delete(deleted_by="api_user")
+            # Soft delete - mark as deleted in a single statement
+            result = await db.execute(
+                update(UserStory)
+                .where(
+                    UserStory.id == user_story_id,
+                    UserStory.is_deleted == False
+                )
+                .values(
+                    is_deleted=True,
+                    deleted_at=func.now(),
+                    deleted_by="api_user"
+                )
+                .returning(UserStory.id)
+            )
+            
+            if result.scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"User story with ID {user_story_id} not found"
+                )
+            
             logger.info("User story soft deleted", user_story_id=user_story_id)
         
         await db.commit()
+        await invalidate_user_story_counts()
+        await invalidate_test_case_caches()
         
     except HTTPException:
         await db.rollback()
@@ -539,10 +808,10 @@ async def delete_user_story(
         )
 
 
-@router.post("/{user_story_id}/restore", response_model=Dict[str, Any])
+@router.post("/{user_story_id}/restore", response_model=None)
 async def restore_user_story(
     user_story_id: int,
-    db: AsyncSession = Depends(get_database_session),
+    db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(rate_limit_dependency())
 ) -> Dict[str, Any]:
     """
@@ -561,12 +830,21 @@ async def restore_user_story(
     try:
         logger.info("Restoring user story", user_story_id=user_story_id)
         
-        # Get soft-deleted user story
+        # Restore the soft-deleted user story and return the restored row
         result = await db.execute(
-            select(UserStory).where(
+            update(UserStory)
+            .where(
                 UserStory.id == user_story_id,
                 UserStory.is_deleted == True
             )
+            .values(
+                is_deleted=False,
+                deleted_at=None,
+                deleted_by=None,
+                updated_by="api_user"
+            )
+            .returning(UserStory)
+            .execution_options(populate_existing=True)
         )
         user_story = result.scalar_one_or_none()
         
@@ -576,17 +854,15 @@ async def restore_user_story(
                 detail=f"Deleted user story with ID {user_story_id} not found"
             )
         
-        # Restore the user story
-        user_story.restore(updated_by="api_user")
-        
         await db.commit()
-        await db.refresh(user_story)
+        await invalidate_user_story_counts()
+        await invalidate_test_case_caches()
         
         # Convert to response format
         response_data = user_story.to_dict(include_relationships=False, include_sensitive=False)
         
         logger.info("User story restored successfully", user_story_id=user_story_id)
-        return response_data
+        return ORJSONResponse(response_data)
         
     except HTTPException:
         await db.rollback()
@@ -600,10 +876,10 @@ async def restore_user_story(
         )
 
 
-@router.get("/{user_story_id}/statistics", response_model=Dict[str, Any])
+@router.get("/{user_story_id}/statistics", response_model=None)
 async def get_user_story_statistics(
     user_story_id: int,
-    db: AsyncSession = Depends(get_database_session)
+    db: AsyncSession = Depends(get_db_readonly)
 ) -> Dict[str, Any]:
     """
     Get statistics for a user story.
@@ -621,11 +897,9 @@ async def get_user_story_statistics(
     try:
         logger.info("Getting user story statistics", user_story_id=user_story_id)
         
-        # Get user story with test cases
+        # Get user story metadata only; test cases are aggregated in SQL
         result = await db.execute(
-            select(UserStory)
-            .options(selectinload(UserStory.test_cases))
-            .where(
+            select(UserStory).where(
                 UserStory.id == user_story_id,
                 UserStory.is_deleted == False
             )
@@ -638,8 +912,69 @@ async def get_user_story_statistics(
                 detail=f"User story with ID {user_story_id} not found"
             )
         
-        # Calculate statistics
-        test_cases = [tc for tc in user_story.test_cases if not tc.is_deleted]
+        # Current quality metrics row per test case
+        latest_metrics = (
+            select(QualityMetrics.overall_score, QualityMetrics.validation_passed)
+            .where(QualityMetrics.test_case_id == TestCase.id)
+            .order_by(QualityMetrics.id.desc())
+            .limit(1)
+            .lateral()
+        )
+        
+        # One row per classification, priority and test type, plus a grand
+        # total row (grouping_id 7) carrying the automation and quality figures
+        stats_query = (
+            select(
+                TestCase.classification,
+                TestCase.priority,
+                TestCase.test_type,
+                func.grouping(
+                    TestCase.classification, TestCase.priority, TestCase.test_type
+                ).label("grouping_id"),
+                func.count().label("total"),
+                func.count().filter(
+                    TestCase.classification.in_(AUTOMATED_CLASSIFICATIONS)
+                ).label("automated"),
+                func.avg(latest_metrics.c.overall_score).label("average_quality_score"),
+                func.count().filter(latest_metrics.c.overall_score >= 0.8).label("high_quality_cases"),
+                func.count().filter(latest_metrics.c.validation_passed == True).label("validation_passed")
+            )
+            .select_from(TestCase)
+            .outerjoin(latest_metrics, true())
+            .where(
+                TestCase.user_story_id == user_story_id,
+                TestCase.is_deleted == False
+            )
+            .group_by(
+                func.grouping_sets(
+                    tuple_(TestCase.classification),
+                    tuple_(TestCase.priority),
+                    tuple_(TestCase.test_type),
+                    tuple_()
+                )
+            )
+        )
+        stats_result = await db.execute(stats_query)
+        
+        by_classification = {}
+        by_priority = {}
+        by_type = {}
+        totals = None
+        for row in stats_result:
+            if row.grouping_id == _GROUPED_BY_CLASSIFICATION:
+                if row.classification:
+                    by_classification[row.classification.value] = row.total
+            elif row.grouping_id == _GROUPED_BY_PRIORITY:
+                if row.priority:
+                    by_priority[row.priority.value] = row.total
+            elif row.grouping_id == _GROUPED_BY_TYPE:
+                if row.test_type:
+                    by_type[row.test_type] = row.total
+            else:
+                totals = row
+        
+        total_cases = totals.total if totals else 0
+        automated_cases = totals.automated if totals else 0
         
         statistics = {
             "user_story_id": user_story_id,
@@ -650,73 +985,32 @@ async def get_user_story_statistics(
             "complexity_level": user_story.complexity_level,
             "domain_classification": user_story.domain_classification,
             "test_cases": {
-                "total": len(test_cases),
-                "by_classification": {},
-                "by_priority": {},
-                "by_type": {},
-                "automated": 0,
-                "manual": 0
+                "total": total_cases,
+                "by_classification": by_classification,
+                "by_priority": by_priority,
+                "by_type": by_type,
+                "automated": automated_cases,
+                "manual": total_cases - automated_cases
             },
             "quality_metrics": {
-                "average_quality_score": 0.0,
-                "high_quality_cases": 0,
-                "validation_passed": 0
+                "average_quality_score": (
+                    float(totals.average_quality_score)
+                    if totals and totals.average_quality_score is not None else 0.0
+                ),
+                "high_quality_cases": totals.high_quality_cases if totals else 0,
+                "validation_passed": totals.validation_passed if totals else 0
             },
             "timestamps": {
-                "created_at": user_story.created_at.isoformat() if user_story.created_at else None,
-                "updated_at": user_story.updated_at.isoformat() if user_story.updated_at else None,
-                "processed_at": user_story.processed_at.isoformat() if user_story.processed_at else None,
+                # orjson encodes datetimes (and None) natively
+                "created_at": user_story.created_at,
+                "updated_at": user_story.updated_at,
+                "processed_at": user_story.processed_at,
                 "days_since_created": user_story.days_since_created
             }
         }
         
-        # Calculate test case statistics
-        if test_cases:
-            from collections import Counter
-            
-            # Count by classification
-            classifications = [tc.classification.value for tc in test_cases if tc.classification]
-            statistics["test_cases"]["by_classification"] = dict(Counter(classifications))
-            
-            # Count by priority
-            priorities = [tc.priority.value for tc in test_cases if tc.priority]
-            statistics["test_cases"]["by_priority"] = dict(Counter(priorities))
-            
-            # Count by test type
-            types = [tc.test_type for tc in test_cases if tc.test_type]
-            statistics["test_cases"]["by_type"] = dict(Counter(types))
-            
-            # Count automated vs manual
-            for tc in test_cases:
-                if tc.is_automated:
-                    statistics["test_cases"]["automated"] += 1
-                else:
-                    statistics["test_cases"]["manual"] += 1
-            
-            # Calculate quality metrics
-            quality_scores = []
-            high_quality_count = 0
-            validation_passed_count = 0
-            
-            for tc in test_cases:
-                if tc.quality_metrics:
-                    score = float(tc.quality_metrics.overall_score)
-                    quality_scores.append(score)
-                    
-                    if score >= 0.8:
-                        high_quality_count += 1
-                    
-                    if tc.quality_metrics.validation_passed:
-                        validation_passed_count += 1
-            
-            if quality_scores:
-                statistics["quality_metrics"]["average_quality_score"] = sum(quality_scores) / len(quality_scores)
-            
-            statistics["quality_metrics"]["high_quality_cases"] = high_quality_count
-            statistics["quality_metrics"]["validation_passed"] = validation_passed_count
-        
         logger.info("User story statistics retrieved successfully", user_story_id=user_story_id)
-        return statistics
+        return ORJSONResponse(statistics)
         
     except HTTPException:
         raise
@@ -7,23 +7,34 @@ connection pooling, health checks, and error handling.
 """
 
 import asyncio
-from typing import AsyncGenerator, Optional
+import functools
+import logging
+import time
+from typing import Any, AsyncGenerator, Dict, Optional
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import (
     AsyncSession, 
     create_async_engine, 
     async_sessionmaker,
+    AsyncConnection,
     AsyncEngine
 )
+from sqlalchemy import event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateColumn, CreateIndex
 from sqlalchemy.sql import text
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError
 import structlog
 
 from app.core.config import settings
+# Module import (not a name import) because migrations imports this module
+from app.utils import migrations
 
-logger = structlog.get_logger(__name__)
+logger = structlog.get_logger(__name__).bind(module="database")
+# structlog builds the event dict before level filtering, so debug calls
+# on hot paths are gated on the underlying stdlib logger
+_stdlib_logger = logging.getLogger(__name__)
 
 # Create declarative base for models
 Base = declarative_base()
@@ -32,6 +43,86 @@ Base = declarative_base()
 _engine: Optional[AsyncEngine] = None
 _session_factory: Optional[async_sessionmaker] = None
 
+# Separate read-only engine and pool for read endpoints, so readers and
+# writers never queue behind each other for a connection
+_read_engine: Optional[AsyncEngine] = None
+_readonly_session_factory: Optional[async_sessionmaker] = None
+
+# Separate engine for health checks and metrics, so probe traffic cannot
+# exhaust the primary pool
+_health_engine: Optional[AsyncEngine] = None
+_health_session_factory: Optional[async_sessionmaker] = None
+
+# Server facts that cannot change while connected (name, user, version),
+# fetched once per engine: "primary" or "health"
+_server_info: Dict[str, Dict[str, Any]] = {}
+
+
+def get_connect_args() -> dict:
+    """
+    Build asyncpg connection arguments.
+    
+    The server is asked to send TCP keepalives, so connections left
+    half-open (e.g. by a NAT or load balancer timeout) are torn down rather
+    than lingering; the pre-ping remains the check at checkout. PgBouncer in transaction
+    pooling mode hands each transaction to an arbitrary server connection,
+    so asyncpg's per-connection prepared statement caches must be disabled
+    when it sits in front of PostgreSQL; it also rejects unknown startup
+    parameters, so server settings are only sent on direct connections.
+    
+    Returns:
+        dict: Keyword arguments passed to the asyncpg driver
+    """
+    connect_args = {
+        "timeout": settings.DATABASE_TIMEOUT,
+        "command_timeout": settings.DATABASE_COMMAND_TIMEOUT,
+    }
+    if settings.DATABASE_USE_PGBOUNCER:
+        connect_args.update({
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        })
+    else:
+        connect_args["server_settings"] = {
+            # Short OLTP queries never recoup JIT compilation time
+            "jit": "off",
+            "tcp_keepalives_idle": str(settings.DATABASE_TCP_KEEPALIVE_IDLE),
+            "tcp_keepalives_interval": str(settings.DATABASE_TCP_KEEPALIVE_INTERVAL),
+            "tcp_keepalives_count": str(settings.DATABASE_TCP_KEEPALIVE_COUNT),
+        }
+    return connect_args
+
+
+def install_idle_pre_ping(engine: AsyncEngine, idle_seconds: float) -> None:
+    """
+    Validate pooled connections at checkout only after they have sat idle.
+    
+    Connections returned to the pool seconds ago are almost certainly
+    alive, so pinging them on every checkout costs a round-trip for
+    nothing. A failed ping raises DisconnectionError, which makes the pool
+    discard the connection and check out another.
+    
+    Args:
+        engine: Engine whose pool gets the checkin/checkout listeners
+        idle_seconds: Idle time after which a connection is pinged
+    """
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _stamp_last_used(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+    
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get("last_used")
+        if last_used is None or time.monotonic() - last_used <= idle_seconds:
+            return
+        
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            raise DisconnectionError(f"Idle connection failed ping: {e}") from e
+
 
 def create_database_engine() -> AsyncEngine:
     """
@@ -40,17 +131,27 @@ def create_database_engine() -> AsyncEngine:
     Returns:
         AsyncEngine: Configured database engine
     """
+    idle_pre_ping = (
+        settings.DATABASE_POOL_PRE_PING
+        and settings.DATABASE_POOL_PRE_PING_IDLE > 0
+        and settings.ENVIRONMENT != "testing"
+    )
+    
     # Choose pool class based on environment
     if settings.ENVIRONMENT == "testing":
         pool_class = NullPool
         pool_kwargs = {}
     else:
-        pool_class = QueuePool
+        pool_class = AsyncAdaptedQueuePool
         pool_kwargs = {
             "pool_size": settings.DATABASE_POOL_SIZE,
             "max_overflow": settings.DATABASE_MAX_OVERFLOW,
-            "pool_pre_ping": True,  # Validate connections before use
-            "pool_recycle": 3600,   # Recycle connections every hour
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            # Reuse the most recently returned connection so a small set
+            # stays hot and surplus overflow connections age out
+            "pool_use_lifo": True,
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING and not idle_pre_ping,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
         }
     
     engine = create_async_engine(
@@ -58,20 +159,134 @@ def create_database_engine() -> AsyncEngine:
         poolclass=pool_class,
         echo=settings.DATABASE_ECHO,
         future=True,
+        connect_args=get_connect_args(),
+        # Room for every filter combination of the list endpoints in the
+        # compiled SQL cache (default 500)
+        query_cache_size=1200,
         **pool_kwargs
     )
+    if idle_pre_ping:
+        install_idle_pre_ping(engine, settings.DATABASE_POOL_PRE_PING_IDLE)
     
     logger.info(
         "Database engine created",
         url=settings.DATABASE_URL.split("@")[-1],  # Hide credentials
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pre_ping_idle=settings.DATABASE_POOL_PRE_PING_IDLE if idle_pre_ping else None,
+        pgbouncer=settings.DATABASE_USE_PGBOUNCER,
         environment=settings.ENVIRONMENT
     )
     
     return engine
 
 
+def create_read_engine() -> AsyncEngine:
+    """
+    Create the engine used by read-only endpoints.
+    
+    Connects to ``DATABASE_READ_URL`` when a read replica is configured and
+    to the primary otherwise. Connections run in AUTOCOMMIT mode, so reads
+    issue no BEGIN / COMMIT round-trips, and on direct connections the
+    server rejects writes through ``default_transaction_read_only``.
+    
+    Returns:
+        AsyncEngine: Configured read-only engine
+    """
+    url = settings.DATABASE_READ_URL or settings.DATABASE_URL
+    idle_pre_ping = (
+        settings.DATABASE_POOL_PRE_PING
+        and settings.DATABASE_POOL_PRE_PING_IDLE > 0
+        and settings.ENVIRONMENT != "testing"
+    )
+    
+    if settings.ENVIRONMENT == "testing":
+        pool_class = NullPool
+        pool_kwargs = {}
+    else:
+        pool_class = AsyncAdaptedQueuePool
+        pool_kwargs = {
+            "pool_size": settings.DATABASE_READ_POOL_SIZE,
+            "max_overflow": settings.DATABASE_READ_MAX_OVERFLOW,
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            "pool_use_lifo": True,
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING and not idle_pre_ping,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        }
+    
+    connect_args = get_connect_args()
+    if "server_settings" in connect_args:
+        connect_args["server_settings"]["default_transaction_read_only"] = "on"
+    
+    engine = create_async_engine(
+        url,
+        poolclass=pool_class,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        isolation_level="AUTOCOMMIT",
+        connect_args=connect_args,
+        query_cache_size=1200,
+        **pool_kwargs
+    )
+    if idle_pre_ping:
+        install_idle_pre_ping(engine, settings.DATABASE_POOL_PRE_PING_IDLE)
+    
+    logger.info(
+        "Read-only database engine created",
+        url=url.split("@")[-1],  # Hide credentials
+        pool_size=settings.DATABASE_READ_POOL_SIZE,
+        max_overflow=settings.DATABASE_READ_MAX_OVERFLOW,
+        read_replica=settings.DATABASE_READ_URL is not None
+    )
+    
+    return engine
+
+
+def create_health_engine() -> AsyncEngine:
+    """
+    Create the small, fixed-size engine used by health checks.
+    
+    Connects to ``DATABASE_READ_URL`` when a read replica is configured and
+    to the primary otherwise.
+    
+    Returns:
+        AsyncEngine: Configured health check engine
+    """
+    url = settings.DATABASE_READ_URL or settings.DATABASE_URL
+    
+    if settings.ENVIRONMENT == "testing":
+        pool_class = NullPool
+        pool_kwargs = {}
+    else:
+        pool_class = AsyncAdaptedQueuePool
+        pool_kwargs = {
+            "pool_size": settings.DATABASE_HEALTH_POOL_SIZE,
+            "max_overflow": 0,
+            "pool_timeout": 5,  # Fail probes fast instead of queueing
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        }
+    
+    engine = create_async_engine(
+        url,
+        poolclass=pool_class,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        connect_args=get_connect_args(),
+        **pool_kwargs
+    )
+    
+    logger.info(
+        "Health check database engine created",
+        url=url.split("@")[-1],  # Hide credentials
+        pool_size=settings.DATABASE_HEALTH_POOL_SIZE,
+        read_replica=settings.DATABASE_READ_URL is not None
+    )
+    
+    return engine
+
+
 def get_engine() -> AsyncEngine:
     """Get or create database engine."""
     global _engine
@@ -94,6 +309,50 @@ def get_session_factory() -> async_sessionmaker:
     return _session_factory
 
 
+def get_read_engine() -> AsyncEngine:
+    """Get or create the read-only engine."""
+    global _read_engine
+    if _read_engine is None:
+        _read_engine = create_read_engine()
+    return _read_engine
+
+
+def get_readonly_session_factory() -> async_sessionmaker:
+    """Get or create the read-only session factory."""
+    global _readonly_session_factory
+    if _readonly_session_factory is None:
+        _readonly_session_factory = async_sessionmaker(
+            bind=get_read_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _readonly_session_factory
+
+
+def get_health_engine() -> AsyncEngine:
+    """Get or create the health check engine."""
+    global _health_engine
+    if _health_engine is None:
+        _health_engine = create_health_engine()
+    return _health_engine
+
+
+def get_health_session_factory() -> async_sessionmaker:
+    """Get or create the health check session factory."""
+    global _health_session_factory
+    if _health_session_factory is None:
+        _health_session_factory = async_sessionmaker(
+            bind=get_health_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _health_session_factory
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session with proper error handling.
@@ -104,12 +363,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Raises:
         SQLAlchemyError: If database operation fails
     """
-    session_factory = get_session_factory()
+    # Factories are built by init_database; fall back for callers that
+    # never ran it (scripts, tests)
+    session_factory = _session_factory or get_session_factory()
     
+    # Liveness is checked once at pool checkout (DATABASE_POOL_PRE_PING),
+    # not with an extra query on every request
     async with session_factory() as session:
         try:
-            # Test connection at start of session
-            await session.execute(text("SELECT 1"))
             yield session
             await session.commit()
             
@@ -132,6 +393,29 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a session for endpoints that only read.
+    
+    The session comes from the read-only pool (the replica when
+    ``DATABASE_READ_URL`` is set), runs in AUTOCOMMIT mode and is never
+    committed, so a read costs no transaction round-trips.
+    
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    session_factory = _readonly_session_factory or get_readonly_session_factory()
+    
+    async with session_factory() as session:
+        try:
+            yield session
+        except SQLAlchemyError as e:
+            logger.error("Database operation error", error=str(e))
+            raise
+        finally:
+            await session.close()
+
+
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -153,6 +437,27 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def get_health_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Context manager for read-only sessions used by health checks and metrics.
+    
+    Sessions come from the dedicated health engine and are always rolled
+    back, never committed.
+    
+    Yields:
+        AsyncSession: Database session
+    """
+    session_factory = get_health_session_factory()
+    
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
 async def check_database_health() -> bool:
     """
     Check database connectivity and health.
@@ -162,18 +467,20 @@ async def check_database_health() -> bool:
     """
     try:
         async with get_db_session() as session:
-            # Test basic connectivity
-            result = await session.execute(text("SELECT 1 as health_check"))
-            health_check = result.scalar()
+            # Test connectivity and database-specific functionality in one
+            # round-trip
+            result = await session.execute(text(
+                "SELECT 1 AS health_check, current_database() AS database_name, "
+                "current_user AS user_name"
+            ))
+            row = result.one()
             
-            if health_check != 1:
-                logger.warning("Database health check returned unexpected value", value=health_check)
+            if row.health_check != 1:
+                logger.warning("Database health check returned unexpected value", value=row.health_check)
                 return False
-                
-            # Test database-specific functionality
-            await session.execute(text("SELECT current_database(), current_user"))
             
-            logger.debug("Database health check passed")
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Database health check passed", database=row.database_name)
             return True
             
     except Exception as e:
@@ -181,6 +488,31 @@ async def check_database_health() -> bool:
         return False
 
 
+# Tables whose search and list indexes postdate databases already in use;
+# create_all skips existing tables together with their indexes
+UPGRADED_TABLES = ("testgen.user_stories", "testgen.test_cases")
+
+
+async def upgrade_existing_tables(conn: AsyncConnection) -> None:
+    """
+    Add columns and indexes that create_all leaves out on existing tables.
+    
+    Every statement is idempotent, so this is safe to run on each startup.
+    
+    Args:
+        conn: Connection inside the schema setup transaction
+    """
+    user_stories = Base.metadata.tables["testgen.user_stories"]
+    await conn.execute(text(
+        "ALTER TABLE testgen.user_stories ADD COLUMN IF NOT EXISTS "
+        f"{CreateColumn(user_stories.c.search_tsv).compile(dialect=conn.dialect)}"
+    ))
+    
+    for table_key in UPGRADED_TABLES:
+        for index in Base.metadata.tables[table_key].indexes:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
+
 async def create_db_and_tables() -> None:
     """
     Create database tables and set up initial configuration.
@@ -188,11 +520,18 @@ async def create_db_and_tables() -> None:
     Raises:
         SQLAlchemyError: If table creation fails
     """
+    # Register every model on Base.metadata before create_all reads it
+    import app.models  # noqa: F401
+    
     try:
         engine = get_engine()
         async with engine.begin() as conn:
+            # Trigram operator classes used by the text search indexes
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            
             # Create all tables
             await conn.run_sync(Base.metadata.create_all)
+            await upgrade_existing_tables(conn)
             
             # Set up schema and permissions (if needed)
             await conn.execute(text("SET search_path TO testgen, public"))
@@ -206,13 +545,26 @@ async def create_db_and_tables() -> None:
 
 async def close_db_connection() -> None:
     """Close database connection and clean up resources."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engine, _readonly_session_factory
+    global _health_engine, _health_session_factory
     
     try:
+        if _read_engine:
+            await _read_engine.dispose()
+            _read_engine = None
+            _readonly_session_factory = None
+        
+        if _health_engine:
+            await _health_engine.dispose()
+            _health_engine = None
+            _health_session_factory = None
+            _server_info.pop("health", None)
+        
         if _engine:
             await _engine.dispose()
             _engine = None
             _session_factory = None
+            _server_info.pop("primary", None)
             logger.info("Database connection closed successfully")
             
     except Exception as e:
@@ -220,41 +572,63 @@ async def close_db_connection() -> None:
         raise
 
 
-async def test_database_connection() -> dict:
+async def test_database_connection(read_only: bool = False, include_stats: bool = False) -> dict:
     """
     Test database connection and return connection info.
     
+    Server name, user and version are fetched on the first call per engine
+    and cached; later calls only run a liveness query, plus the size and
+    table count when ``include_stats`` is set.
+    
+    Args:
+        read_only: Run the test on the health check engine instead of the
+            primary pool
+        include_stats: Also report database size and table count
+    
     Returns:
         dict: Connection information and test results
     """
+    session_scope = get_health_db_session if read_only else get_db_session
+    server_info = _server_info.get("health" if read_only else "primary")
+    
+    columns = ["1 as health_check"]
+    if server_info is None:
+        columns += [
+            "current_database() as database_name",
+            "current_user as user_name",
+            "version() as postgresql_version",
+            "current_setting('server_version') as server_version",
+        ]
+    if include_stats:
+        columns += [
+            "pg_database_size(current_database()) as database_size",
+            "(SELECT count(*) FROM information_schema.tables "
+            "WHERE table_schema = 'testgen') as table_count",
+        ]
+    
     try:
-        async with get_db_session() as session:
-            # Get database info
-            db_info_query = text("""
-                SELECT 
-                    current_database() as database_name,
-                    current_user as user_name,
-                    version() as postgresql_version,
-                    current_setting('server_version') as server_version,
-                    pg_database_size(current_database()) as database_size,
-                    (SELECT count(*) FROM information_schema.tables 
-                     WHERE table_schema = 'testgen') as table_count
-            """)
+        async with session_scope() as session:
+            result = await session.execute(text(f"SELECT {', '.join(columns)}"))
+            row = result.one()
             
-            result = await session.execute(db_info_query)
-            row = result.fetchone()
+            if server_info is None:
+                server_info = {
+                    "database_name": row.database_name,
+                    "user_name": row.user_name,
+                    "postgresql_version": row.postgresql_version.split(" ")[0] if row.postgresql_version else "unknown",
+                    "server_version": row.server_version,
+                }
+                _server_info["health" if read_only else "primary"] = server_info
             
             connection_info = {
                 "status": "healthy",
-                "database_name": row.database_name,
-                "user_name": row.user_name,
-                "postgresql_version": row.postgresql_version.split(" ")[0] if row.postgresql_version else "unknown",
-                "server_version": row.server_version,
-                "database_size_bytes": row.database_size,
-                "table_count": row.table_count,
+                **server_info,
                 "pool_size": settings.DATABASE_POOL_SIZE,
                 "max_overflow": settings.DATABASE_MAX_OVERFLOW
             }
+            if include_stats:
+                connection_info["database_size_bytes"] = row.database_size
+                connection_info["table_count"] = row.table_count
             
             logger.info("Database connection test successful", **connection_info)
             return connection_info
@@ -270,6 +644,39 @@ async def test_database_connection() -> dict:
 
 
 # Database initialization function for startup
+async def warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    """
+    Open ``size`` pooled connections concurrently and return them idle.
+    
+    Connections are created lazily on first checkout, so without a warmup
+    the first requests after startup each pay for TCP, TLS and auth.
+    Warmup is best effort: failures are logged and startup continues.
+    
+    Args:
+        engine: Engine whose pool to fill
+        size: Number of connections to open
+    """
+    async def open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(size)),
+        return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    
+    if errors:
+        logger.warning(
+            "Connection pool warmup incomplete",
+            requested=size,
+            failed=len(errors),
+            error=str(errors[0])
+        )
+    else:
+        logger.info("Connection pool warmed up", connections=size)
+
+
 async def init_database():
     """Initialize database connection and validate setup."""
     try:
@@ -279,18 +686,32 @@ async def init_database():
         if connection_info["status"] != "healthy":
             raise RuntimeError(f"Database initialization failed: {connection_info.get('error')}")
         
+        # Build the request session factories up front so get_db and
+        # get_db_readonly only read module globals
+        get_session_factory()
+        get_readonly_session_factory()
+        
         # Create tables if they don't exist
         await create_db_and_tables()
         
         # Run migrations if necessary
-        from app.utils.migrations import handle_automatic_migration
-        migration_success = await handle_automatic_migration()
+        migration_success = await migrations.handle_automatic_migration()
         
         if not migration_success and settings.ENVIRONMENT != "production":
             logger.warning("Automatic migration failed - continuing anyway")
         elif not migration_success and settings.ENVIRONMENT == "production":
             raise RuntimeError("Migration failed in production environment")
         
+        # NullPool (testing) keeps nothing, so there is nothing to warm.
+        # Only a few connections per pool: every worker runs this, and the
+        # rest of the pool still fills on demand
+        if settings.DATABASE_POOL_WARMUP and settings.ENVIRONMENT != "testing":
+            warmup_size = settings.DATABASE_POOL_WARMUP_SIZE
+            await asyncio.gather(
+                warm_up_pool(get_engine(), min(warmup_size, settings.DATABASE_POOL_SIZE)),
+                warm_up_pool(get_read_engine(), min(warmup_size, settings.DATABASE_READ_POOL_SIZE))
+            )
+        
         logger.info("Database initialization completed successfully")
         
     except Exception as e:
@@ -307,38 +728,44 @@ def with_db_retry(max_retries: int = 3, delay: float = 1.0):
         max_retries: Maximum number of retry attempts
         delay: Delay between retries in seconds
     """
+    # Exponential backoff schedule, computed once per decoration
+    delays = tuple(delay * (1 << attempt) for attempt in range(max_retries))
+    
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
+            try:
+                return await func(*args, **kwargs)
+            except (DisconnectionError, ConnectionError) as e:
+                error = e
+            except Exception as e:
+                # Don't retry non-connection errors
+                logger.error("Database operation failed with non-retryable error", error=str(e))
+                raise
             
-            for attempt in range(max_retries + 1):
+            for attempt, backoff in enumerate(delays, start=1):
+                logger.warning(
+                    "Database operation failed, retrying",
+                    attempt=attempt,
+                    max_retries=max_retries,
+                    error=str(error)
+                )
+                await asyncio.sleep(backoff)
+                
                 try:
                     return await func(*args, **kwargs)
-                    
                 except (DisconnectionError, ConnectionError) as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            "Database operation failed, retrying",
-                            attempt=attempt + 1,
-                            max_retries=max_retries,
-                            error=str(e)
-                        )
-                        await asyncio.sleep(delay * (2 ** attempt))  # Exponential backoff
-                    else:
-                        logger.error(
-                            "Database operation failed after all retries",
-                            attempts=max_retries + 1,
-                            error=str(e)
-                        )
-                        
+                    error = e
                 except Exception as e:
-                    # Don't retry non-connection errors
                     logger.error("Database operation failed with non-retryable error", error=str(e))
                     raise
-                    
-            # If we get here, all retries failed
-            raise last_exception
+            
+            logger.error(
+                "Database operation failed after all retries",
+                attempts=max_retries + 1,
+                error=str(error)
+            )
+            raise error
             
         return wrapper
     return decorator
@@ -6,16 +6,22 @@ including test database setup, fixtures, and cleanup utilities.
 """
 
 import asyncio
+import json
 from typing import AsyncGenerator, Optional
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import insert
 from sqlalchemy.sql import text
 from sqlalchemy.exc import SQLAlchemyError
 import pytest
+import pytest_asyncio
 import structlog
 
 from app.core.config import settings
 from app.core.database import Base
+# Register every model on Base.metadata; cleanup and insert_test_data
+# read the tables from it
+import app.models  # noqa: F401
 
 logger = structlog.get_logger(__name__)
 
@@ -140,28 +146,21 @@ async def drop_test_database():
 
 async def cleanup_test_database():
     """Clean up test database by truncating all tables."""
+    # The mapped tables are already known in-process, children first
+    table_names = [
+        table.name
+        for table in reversed(Base.metadata.sorted_tables)
+        if table.schema in (None, "testgen")
+    ]
+    if not table_names:
+        raise RuntimeError("No testgen tables registered on Base.metadata; are the models imported?")
+    
     try:
         async with get_test_db_session() as session:
-            # Get all table names in testgen schema
-            tables_query = text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'testgen'
-                AND table_type = 'BASE TABLE'
-            """)
-            
-            result = await session.execute(tables_query)
-            table_names = [row.table_name for row in result]
-            
-            # Disable foreign key checks temporarily
-            await session.execute(text("SET session_replication_role = replica"))
-            
-            # Truncate all tables
-            for table_name in table_names:
-                await session.execute(text(f"TRUNCATE TABLE testgen.{table_name} CASCADE"))
-            
-            # Re-enable foreign key checks
-            await session.execute(text("SET session_replication_role = DEFAULT"))
+            # Truncating every table in one statement satisfies the foreign
+            # keys without disabling them
+            qualified = ", ".join(f"testgen.{table_name}" for table_name in table_names)
+            await session.execute(text(f"TRUNCATE TABLE {qualified} RESTART IDENTITY CASCADE"))
             
             await session.commit()
             
@@ -188,7 +187,7 @@ async def close_test_database():
 
 
 # Test database fixtures for pytest
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def test_db_engine():
     """Test database engine fixture."""
     engine = create_test_engine()
@@ -196,7 +195,7 @@ async def test_db_engine():
     await engine.dispose()
 
 
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def test_db_setup():
     """Set up test database."""
     await create_test_database()
@@ -205,18 +204,28 @@ async def test_db_setup():
     await close_test_database()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_db_session(test_db_setup):
-    """Test database session fixture."""
-    async with get_test_db_session() as session:
-        yield session
-
-
-@pytest.fixture(autouse=True)
-async def cleanup_after_test(test_db_setup):
-    """Clean up test database after each test."""
-    yield
-    await cleanup_test_database()
+    """
+    Test database session fixture.
+    
+    The session is joined to an outer transaction that is rolled back at
+    teardown; commits inside the test only release a SAVEPOINT, so nothing
+    the test writes outlives it and no cleanup is needed.
+    """
+    async with create_test_engine().connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
 
 
 # Database testing utilities
@@ -230,16 +239,12 @@ async def insert_test_data(session: AsyncSession, table_name: str, data: dict):
         data: Data to insert
     """
     try:
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(f":{key}" for key in data.keys())
-        
-        query = text(f"""
-            INSERT INTO testgen.{table_name} ({columns})
-            VALUES ({placeholders})
-            RETURNING id
-        """)
+        # Core insert on the mapped table hits SQLAlchemy's compiled cache;
+        # the models live in the testgen schema, so metadata keys are qualified
+        table = Base.metadata.tables[f"testgen.{table_name}"]
+        stmt = insert(table).values(**data).returning(table.c.id)
         
-        result = await session.execute(query, data)
+        result = await session.execute(stmt)
         return result.scalar()
         
     except Exception as e:
@@ -277,10 +282,7 @@ async def verify_test_database_setup() -> bool:
     """
     try:
         async with get_test_db_session() as session:
-            # Test basic connectivity
-            await session.execute(text("SELECT 1"))
-            
-            # Check if required tables exist
+            # Check if required tables exist (also proves connectivity)
             tables_query = text("""
                 SELECT count(*) 
                 FROM information_schema.tables 
@@ -366,6 +368,10 @@ async def measure_query_performance(session: AsyncSession, query: str, params: d
     """
     Measure query performance.
     
+    Runs the query under ``EXPLAIN (ANALYZE, TIMING ON)`` so the reported
+    time is the server-side execution time and rows are never shipped
+    back to the client.
+    
     Args:
         session: Database session
         query: SQL query to measure
@@ -374,21 +380,23 @@ async def measure_query_performance(session: AsyncSession, query: str, params: d
     Returns:
         dict: Performance metrics
     """
-    import time
-    
     try:
-        start_time = time.time()
-        
-        result = await session.execute(text(query), params or {})
-        rows = result.fetchall()
+        result = await session.execute(
+            text(f"EXPLAIN (ANALYZE, TIMING ON, FORMAT JSON) {query}"),
+            params or {}
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
         
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = plan[0]["Execution Time"] / 1000
         
         return {
             "execution_time_seconds": execution_time,
-            "row_count": len(rows),
+            "planning_time_seconds": plan[0]["Planning Time"] / 1000,
+            "row_count": plan[0]["Plan"]["Actual Rows"],
             "query": query,
+            "plan": plan,
             "performance_ok": execution_time < 1.0  # 1 second threshold
         }
         
@@ -410,19 +418,19 @@ async def test_database_migrations():
                 "generation_statistics"
             ]
             
-            for table in expected_tables:
-                count_query = text(f"""
-                    SELECT count(*) 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'testgen' 
-                    AND table_name = :table_name
-                """)
-                
-                result = await session.execute(count_query, {"table_name": table})
-                exists = result.scalar() > 0
-                
-                if not exists:
-                    raise AssertionError(f"Expected table {table} does not exist")
+            tables_query = text("""
+                SELECT table_name 
+                FROM information_schema.tables 
+                WHERE table_schema = 'testgen' 
+                AND table_name = ANY(:names)
+            """)
+            
+            result = await session.execute(tables_query, {"names": expected_tables})
+            found = {row.table_name for row in result}
+            
+            missing = [table for table in expected_tables if table not in found]
+            if missing:
+                raise AssertionError(f"Expected tables do not exist: {', '.join(missing)}")
             
             logger.info("Database migration test passed", tables_verified=len(expected_tables))
             return True
@@ -5,11 +5,12 @@ This module provides comprehensive exception handling with proper error
 categorization, logging, monitoring, and user-friendly responses.
 """
 
+import asyncio
+import re
 import traceback
-from typing import Dict, Any, Optional, Union
-from fastapi import Request, HTTPException, status
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+from fastapi import Request, HTTPException, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from sqlalchemy.exc import (
     SQLAlchemyError, 
@@ -43,6 +44,247 @@ from app.schemas.error import (
 from app.utils.correlation import CorrelationIdManager, get_correlation_logger
 
 
+def _status_table(mapping: Dict[int, Any]) -> Tuple[Any, ...]:
+    """Expand a status code mapping into a tuple indexed by status code."""
+    table = [None] * 600
+    for status_code, value in mapping.items():
+        table[status_code] = value
+    return tuple(table)
+
+
+# HTTP status code -> error code / category, indexed directly by status
+_HTTP_ERROR_CODE: Tuple[Optional[ErrorCode], ...] = _status_table({
+    400: ErrorCode.VALIDATION_ERROR,
+    401: ErrorCode.AUTHENTICATION_FAILED,
+    403: ErrorCode.AUTHORIZATION_FAILED,
+    404: ErrorCode.RECORD_NOT_FOUND,
+    405: ErrorCode.INVALID_OPERATION,
+    409: ErrorCode.RESOURCE_CONFLICT,
+    422: ErrorCode.VALIDATION_ERROR,
+    429: ErrorCode.RATE_LIMIT_EXCEEDED,
+    500: ErrorCode.INTERNAL_SERVER_ERROR,
+    502: ErrorCode.EXTERNAL_SERVICE_ERROR,
+    503: ErrorCode.SERVICE_UNAVAILABLE,
+    504: ErrorCode.TIMEOUT_ERROR,
+})
+
+_HTTP_ERROR_CATEGORY: Tuple[Optional[ErrorCategory], ...] = _status_table({
+    400: ErrorCategory.CLIENT_ERROR,
+    401: ErrorCategory.AUTHENTICATION_ERROR,
+    403: ErrorCategory.AUTHORIZATION_ERROR,
+    404: ErrorCategory.NOT_FOUND_ERROR,
+    405: ErrorCategory.CLIENT_ERROR,
+    409: ErrorCategory.CONFLICT_ERROR,
+    422: ErrorCategory.VALIDATION_ERROR,
+    429: ErrorCategory.CLIENT_ERROR,
+    500: ErrorCategory.SERVER_ERROR,
+    502: ErrorCategory.EXTERNAL_SERVICE_ERROR,
+    503: ErrorCategory.SERVER_ERROR,
+    504: ErrorCategory.SERVER_ERROR,
+})
+
+
+# Error severity lookups, checked critical -> high -> medium -> low
+_CRITICAL_CODES = frozenset({
+    ErrorCode.INTERNAL_SERVER_ERROR,
+    ErrorCode.DATABASE_CONNECTION_ERROR,
+    ErrorCode.CONFIGURATION_ERROR,
+})
+_HIGH_CODES = frozenset({
+    ErrorCode.AUTHENTICATION_FAILED,
+    ErrorCode.AUTHORIZATION_FAILED,
+})
+_HIGH_CATEGORIES = frozenset({
+    ErrorCategory.SERVER_ERROR,
+    ErrorCategory.EXTERNAL_SERVICE_ERROR,
+})
+_MEDIUM_CATEGORIES = frozenset({
+    ErrorCategory.BUSINESS_LOGIC_ERROR,
+    ErrorCategory.VALIDATION_ERROR,
+    ErrorCategory.CONFLICT_ERROR,
+})
+
+# SQLSTATE for unique_violation, and the message fallback for drivers
+# that don't expose one
+UNIQUE_VIOLATION_SQLSTATE = "23505"
+_UNIQUE_VIOLATION_RE = re.compile(r"duplicate key|unique constraint", re.IGNORECASE)
+
+
+def _is_unique_violation(exc: IntegrityError) -> bool:
+    """Check whether an IntegrityError is a unique constraint violation."""
+    orig = getattr(exc, "orig", None)
+    sqlstate = getattr(orig, "pgcode", None)
+    if sqlstate is not None:
+        return sqlstate == UNIQUE_VIOLATION_SQLSTATE
+    
+    # The driver message is much shorter than str(exc), which also
+    # renders the statement and its parameters
+    return _UNIQUE_VIOLATION_RE.search(str(orig if orig is not None else exc)) is not None
+
+
+def _integrity_exception(exc: IntegrityError) -> BaseTestGenException:
+    """Map an IntegrityError to a duplicate record or constraint error."""
+    if _is_unique_violation(exc):
+        return DuplicateRecordException(
+            resource_type="resource",
+            cause=exc
+        )
+    return DatabaseException(
+        message=f"Database integrity error: {str(exc)}",
+        error_code=ErrorCode.DATABASE_CONSTRAINT_ERROR,
+        cause=exc
+    )
+
+
+def _no_result_exception(exc: NoResultFound) -> BaseTestGenException:
+    """Map NoResultFound to a not found error."""
+    return RecordNotFoundException(
+        resource_type="resource",
+        cause=exc
+    )
+
+
+def _operational_exception(exc: OperationalError) -> BaseTestGenException:
+    """Map an OperationalError to a connection error."""
+    return DatabaseException(
+        message=f"Database operational error: {str(exc)}",
+        error_code=ErrorCode.DATABASE_CONNECTION_ERROR,
+        cause=exc
+    )
+
+
+def _data_exception(exc: DataError) -> BaseTestGenException:
+    """Map a DataError to a data integrity error."""
+    return DatabaseException(
+        message=f"Database data error: {str(exc)}",
+        error_code=ErrorCode.DATA_INTEGRITY_ERROR,
+        cause=exc
+    )
+
+
+# SQLAlchemy exception class -> custom exception factory
+_SQLALCHEMY_EXCEPTION_FACTORIES: Dict[type, Callable[[SQLAlchemyError], BaseTestGenException]] = {
+    IntegrityError: _integrity_exception,
+    NoResultFound: _no_result_exception,
+    OperationalError: _operational_exception,
+    DataError: _data_exception,
+}
+
+
+def _error_response(error_response: ErrorResponse, status_code: int) -> Response:
+    """Serialize an error response straight to JSON bytes."""
+    return Response(
+        content=error_response.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+# (level, message, context, exception whose traceback to render)
+LogRecord = Tuple[str, str, Dict[str, Any], Optional[BaseException]]
+
+
+class _LogQueue:
+    """
+    Bounded queue that moves exception logging off the request path.
+    
+    Handlers enqueue records and a single background consumer, started in
+    the application lifespan, drains them in batches and emits them from
+    a worker thread. When the queue is full the oldest record is dropped.
+    Until the consumer runs (scripts, tests) records are logged inline.
+    """
+    
+    MAX_SIZE = 10_000
+    BATCH_SIZE = 256
+    
+    def __init__(self):
+        self.logger = structlog.get_logger(__name__)
+        # Bound log methods by level, resolved on first use because this
+        # object is created at import, before logging is configured
+        self._log_methods: Dict[str, Callable[..., Any]] = {}
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def put(
+        self,
+        level: str,
+        message: str,
+        context: Dict[str, Any],
+        exc: Optional[BaseException] = None
+    ) -> None:
+        """
+        Queue a log record.
+        
+        Args:
+            level: Log method name (e.g. "error")
+            message: Log message
+            context: Structured log context
+            exc: Exception whose traceback is rendered by the consumer
+        """
+        # The correlation ID lives in a context variable, so capture it now
+        correlation_id = CorrelationIdManager.get_correlation_id()
+        if correlation_id:
+            context["correlation_id"] = correlation_id
+        
+        record = (level, message, context, exc)
+        if self._task is None:
+            self._emit_batch([record])
+            return
+        
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(record)
+    
+    def start(self) -> None:
+        """Start the background consumer on the running event loop."""
+        if self._task is None:
+            self._log_methods.clear()
+            self._queue = asyncio.Queue(maxsize=self.MAX_SIZE)
+            self._task = asyncio.create_task(self._consume())
+    
+    async def stop(self) -> None:
+        """Stop the consumer and flush any queued records."""
+        if self._task is None:
+            return
+        
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        self._emit_batch(remaining)
+    
+    async def _consume(self) -> None:
+        """Drain the queue in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            await asyncio.to_thread(self._emit_batch, batch)
+    
+    def _emit_batch(self, batch: List[LogRecord]) -> None:
+        """Emit records to the underlying logger."""
+        if self.dropped:
+            self.logger.warning("Exception log records dropped", dropped=self.dropped)
+            self.dropped = 0
+        
+        for level, message, context, exc in batch:
+            if exc is not None:
+                context["error"]["traceback"] = "".join(traceback.format_exception(exc))
+            log_method = self._log_methods.get(level)
+            if log_method is None:
+                log_method = self._log_methods[level] = getattr(self.logger, level)
+            log_method(message, **context)
+
+
 class GlobalExceptionHandler:
     """
     Global exception handler that provides comprehensive error handling,
@@ -51,19 +293,20 @@ class GlobalExceptionHandler:
     
     def __init__(self):
         self.logger = get_correlation_logger(__name__)
+        self.log_queue = _LogQueue()
     
     async def handle_base_test_gen_exception(
         self, 
         request: Request, 
         exc: BaseTestGenException
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle custom application exceptions."""
         
         # Log the exception with appropriate level
         await self._log_exception(request, exc)
         
         # Create error response
-        error_response = ErrorResponse(
+        error_response = ErrorResponse.model_construct(
             error_code=exc.error_code,
             category=exc.category,
             message=exc.user_message,
@@ -72,169 +315,108 @@ class GlobalExceptionHandler:
             severity=self._get_error_severity(exc)
         )
         
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=error_response.model_dump()
-        )
+        return _error_response(error_response, exc.status_code)
     
     async def handle_validation_error(
         self, 
         request: Request, 
         exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle FastAPI validation errors."""
         
-        # Extract field errors
-        field_errors = []
-        for error in exc.errors():
-            field_path = ".".join(str(loc) for loc in error["loc"] if loc != "body")
-            field_errors.append(FieldError(
-                field=field_path or "unknown",
-                message=error["msg"],
-                code=error["type"],
-                value=error.get("input")
-            ))
+        # Extract field errors as plain dicts, shared by the log and response
+        field_error_dicts = [
+            {
+                "field": ".".join([str(loc) for loc in error["loc"] if loc != "body"]) or "unknown",
+                "message": error["msg"],
+                "code": error["type"],
+                "value": error.get("input")
+            }
+            for error in exc.errors()
+        ]
         
         # Log validation error
-        self.logger.warning(
-            "Request validation failed",
-            request={
+        self.log_queue.put("warning", "Request validation failed", {
+            "request": {
                 "method": request.method,
                 "path": request.url.path,
                 "url": str(request.url)
             },
-            validation_errors=[err.model_dump() for err in field_errors],
-            event_type="validation_error"
-        )
+            "validation_errors": field_error_dicts,
+            "event_type": "validation_error"
+        })
         
         # Create validation error response
-        error_response = ValidationErrorResponse(
+        error_response = ValidationErrorResponse.model_construct(
             message="Request validation failed",
-            details=ErrorDetails(field_errors=field_errors),
+            details=ErrorDetails.model_construct(
+                field_errors=[FieldError.model_construct(**field_error) for field_error in field_error_dicts]
+            ),
             request_id=CorrelationIdManager.get_correlation_id()
         )
         
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content=error_response.model_dump()
-        )
+        return _error_response(error_response, status.HTTP_422_UNPROCESSABLE_ENTITY)
     
     async def handle_http_exception(
         self, 
         request: Request, 
         exc: HTTPException
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle FastAPI HTTP exceptions."""
         
-        # Map HTTP status codes to error codes
-        error_code_mapping = {
-            400: ErrorCode.VALIDATION_ERROR,
-            401: ErrorCode.AUTHENTICATION_FAILED,
-            403: ErrorCode.AUTHORIZATION_FAILED,
-            404: ErrorCode.RECORD_NOT_FOUND,
-            405: ErrorCode.INVALID_OPERATION,
-            409: ErrorCode.RESOURCE_CONFLICT,
-            422: ErrorCode.VALIDATION_ERROR,
-            429: ErrorCode.RATE_LIMIT_EXCEEDED,
-            500: ErrorCode.INTERNAL_SERVER_ERROR,
-            502: ErrorCode.EXTERNAL_SERVICE_ERROR,
-            503: ErrorCode.SERVICE_UNAVAILABLE,
-            504: ErrorCode.TIMEOUT_ERROR,
-        }
-        
-        # Map to error categories
-        category_mapping = {
-            400: ErrorCategory.CLIENT_ERROR,
-            401: ErrorCategory.AUTHENTICATION_ERROR,
-            403: ErrorCategory.AUTHORIZATION_ERROR,
-            404: ErrorCategory.NOT_FOUND_ERROR,
-            405: ErrorCategory.CLIENT_ERROR,
-            409: ErrorCategory.CONFLICT_ERROR,
-            422: ErrorCategory.VALIDATION_ERROR,
-            429: ErrorCategory.CLIENT_ERROR,
-            500: ErrorCategory.SERVER_ERROR,
-            502: ErrorCategory.EXTERNAL_SERVICE_ERROR,
-            503: ErrorCategory.SERVER_ERROR,
-            504: ErrorCategory.SERVER_ERROR,
-        }
-        
-        error_code = error_code_mapping.get(exc.status_code, ErrorCode.INTERNAL_SERVER_ERROR)
-        category = category_mapping.get(exc.status_code, ErrorCategory.SERVER_ERROR)
+        # Map HTTP status codes to error codes and categories
+        if 0 <= exc.status_code < len(_HTTP_ERROR_CODE):
+            error_code = _HTTP_ERROR_CODE[exc.status_code] or ErrorCode.INTERNAL_SERVER_ERROR
+            category = _HTTP_ERROR_CATEGORY[exc.status_code] or ErrorCategory.SERVER_ERROR
+        else:
+            error_code = ErrorCode.INTERNAL_SERVER_ERROR
+            category = ErrorCategory.SERVER_ERROR
         
         # Log HTTP exception
         log_level = "error" if exc.status_code >= 500 else "warning"
-        log_method = getattr(self.logger, log_level)
         
-        log_method(
-            "HTTP exception occurred",
-            request={
+        self.log_queue.put(log_level, "HTTP exception occurred", {
+            "request": {
                 "method": request.method,
                 "path": request.url.path,
                 "url": str(request.url)
             },
-            error={
+            "error": {
                 "status_code": exc.status_code,
                 "detail": exc.detail,
                 "error_code": error_code.value
             },
-            event_type="http_exception"
-        )
+            "event_type": "http_exception"
+        })
         
         # Create error response
-        error_response = ErrorResponse(
+        error_response = ErrorResponse.model_construct(
             error_code=error_code,
             category=category,
             message=str(exc.detail),
-            details=ErrorDetails(
+            details=ErrorDetails.model_construct(
                 additional_context={"status_code": exc.status_code}
             ),
             request_id=CorrelationIdManager.get_correlation_id(),
             severity=ErrorSeverity.HIGH if exc.status_code >= 500 else ErrorSeverity.MEDIUM
         )
         
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=error_response.model_dump()
-        )
+        return _error_response(error_response, exc.status_code)
     
     async def handle_sqlalchemy_error(
         self, 
         request: Request, 
         exc: SQLAlchemyError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle SQLAlchemy database errors."""
         
-        # Map SQLAlchemy exceptions to custom exceptions
-        if isinstance(exc, IntegrityError):
-            # Check if it's a unique constraint violation
-            if "duplicate key" in str(exc).lower() or "unique constraint" in str(exc).lower():
-                custom_exc = DuplicateRecordException(
-                    resource_type="resource",
-                    cause=exc
-                )
-            else:
-                custom_exc = DatabaseException(
-                    message=f"Database integrity error: {str(exc)}",
-                    error_code=ErrorCode.DATABASE_CONSTRAINT_ERROR,
-                    cause=exc
-                )
-        elif isinstance(exc, NoResultFound):
-            custom_exc = RecordNotFoundException(
-                resource_type="resource",
-                cause=exc
-            )
-        elif isinstance(exc, OperationalError):
-            custom_exc = DatabaseException(
-                message=f"Database operational error: {str(exc)}",
-                error_code=ErrorCode.DATABASE_CONNECTION_ERROR,
-                cause=exc
-            )
-        elif isinstance(exc, DataError):
-            custom_exc = DatabaseException(
-                message=f"Database data error: {str(exc)}",
-                error_code=ErrorCode.DATA_INTEGRITY_ERROR,
-                cause=exc
-            )
+        # Map SQLAlchemy exceptions to custom exceptions, most specific
+        # class first
+        for exc_class in type(exc).__mro__:
+            factory = _SQLALCHEMY_EXCEPTION_FACTORIES.get(exc_class)
+            if factory is not None:
+                custom_exc = factory(exc)
+                break
         else:
             custom_exc = DatabaseException(
                 message=f"Database error: {str(exc)}",
@@ -247,31 +429,29 @@ class GlobalExceptionHandler:
         self, 
         request: Request, 
         exc: Exception
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle unexpected exceptions."""
         
-        # Log the full exception with stack trace
-        self.logger.error(
-            "Unhandled exception occurred",
-            request={
+        # Log the full exception; the consumer renders the stack trace
+        self.log_queue.put("error", "Unhandled exception occurred", {
+            "request": {
                 "method": request.method,
                 "path": request.url.path,
                 "url": str(request.url)
             },
-            error={
+            "error": {
                 "type": type(exc).__name__,
-                "message": str(exc),
-                "traceback": traceback.format_exc()
+                "message": str(exc)
             },
-            event_type="unhandled_exception"
-        )
+            "event_type": "unhandled_exception"
+        }, exc=exc)
         
         # Create generic error response (don't expose internal details)
-        error_response = ErrorResponse(
+        error_response = ErrorResponse.model_construct(
             error_code=ErrorCode.INTERNAL_SERVER_ERROR,
             category=ErrorCategory.SERVER_ERROR,
             message="An internal error occurred. Please try again later.",
-            details=ErrorDetails(
+            details=ErrorDetails.model_construct(
                 additional_context={
                     "error_type": type(exc).__name__,
                     "occurred_at": request.url.path
@@ -281,10 +461,7 @@ class GlobalExceptionHandler:
             severity=ErrorSeverity.CRITICAL
         )
         
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=error_response.model_dump()
-        )
+        return _error_response(error_response, status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     async def _log_exception(self, request: Request, exc: BaseTestGenException) -> None:
         """Log exception with appropriate level and context."""
@@ -299,8 +476,6 @@ class GlobalExceptionHandler:
         else:
             log_level = "warning"
         
-        log_method = getattr(self.logger, log_level)
-        
         # Create log context
         log_context = {
             "request": {
@@ -326,10 +501,7 @@ class GlobalExceptionHandler:
                 "message": str(exc.cause)
             }
         
-        log_method(
-            f"Application exception: {exc.error_code.value}",
-            **log_context
-        )
+        self.log_queue.put(log_level, f"Application exception: {exc.error_code.value}", log_context)
     
     def _create_error_details(self, exc: BaseTestGenException) -> Optional[ErrorDetails]:
         """Create error details from exception."""
@@ -346,35 +518,21 @@ class GlobalExceptionHandler:
                 "message": str(exc.cause)
             }
         
-        return ErrorDetails(additional_context=additional_context)
+        return ErrorDetails.model_construct(additional_context=additional_context)
     
     def _get_error_severity(self, exc: BaseTestGenException) -> ErrorSeverity:
         """Determine error severity based on exception type and category."""
         
         # Critical errors
-        if exc.error_code in [
-            ErrorCode.INTERNAL_SERVER_ERROR,
-            ErrorCode.DATABASE_CONNECTION_ERROR,
-            ErrorCode.CONFIGURATION_ERROR
-        ]:
+        if exc.error_code in _CRITICAL_CODES:
             return ErrorSeverity.CRITICAL
         
         # High severity errors
-        if exc.category in [
-            ErrorCategory.SERVER_ERROR,
-            ErrorCategory.EXTERNAL_SERVICE_ERROR
-        ] or exc.error_code in [
-            ErrorCode.AUTHENTICATION_FAILED,
-            ErrorCode.AUTHORIZATION_FAILED
-        ]:
+        if exc.category in _HIGH_CATEGORIES or exc.error_code in _HIGH_CODES:
             return ErrorSeverity.HIGH
         
         # Medium severity errors
-        if exc.category in [
-            ErrorCategory.BUSINESS_LOGIC_ERROR,
-            ErrorCategory.VALIDATION_ERROR,
-            ErrorCategory.CONFLICT_ERROR
-        ]:
+        if exc.category in _MEDIUM_CATEGORIES:
             return ErrorSeverity.MEDIUM
         
         # Low severity errors
@@ -385,28 +543,38 @@ class GlobalExceptionHandler:
 exception_handler = GlobalExceptionHandler()
 
 
+async def start_exception_logging() -> None:
+    """Start the background consumer for exception logs."""
+    exception_handler.log_queue.start()
+
+
+async def stop_exception_logging() -> None:
+    """Stop the exception log consumer and flush queued records."""
+    await exception_handler.log_queue.stop()
+
+
 # Exception handler functions for FastAPI
-async def base_test_gen_exception_handler(request: Request, exc: BaseTestGenException) -> JSONResponse:
+async def base_test_gen_exception_handler(request: Request, exc: BaseTestGenException) -> Response:
     """Handler for custom application exceptions."""
     return await exception_handler.handle_base_test_gen_exception(request, exc)
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """Handler for FastAPI validation errors."""
     return await exception_handler.handle_validation_error(request, exc)
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """Handler for FastAPI HTTP exceptions."""
     return await exception_handler.handle_http_exception(request, exc)
 
 
-async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> Response:
     """Handler for SQLAlchemy database errors."""
     return await exception_handler.handle_sqlalchemy_error(request, exc)
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handler for unexpected exceptions."""
     return await exception_handler.handle_general_exception(request, exc)
 
@@ -0,0 +1,110 @@
+"""
+Redis-backed rate limiting for the Test Generation Agent.
+
+This module implements a sliding-window rate limiter on top of a Redis
+sorted set. The window is trimmed, counted and extended inside a single
+Lua script so the check is atomic and costs one round-trip, and the limit
+holds across all worker processes sharing the Redis instance.
+"""
+
+import time
+import uuid
+from typing import Optional
+
+from redis.exceptions import NoScriptError, RedisError
+
+from app.core.redis import get_redis_client
+from app.utils.correlation import get_correlation_logger
+
+# Set up logger with correlation tracking
+logger = get_correlation_logger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "rl"
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+# KEYS[1] = window key
+# ARGV[1] = now, ARGV[2] = window, ARGV[3] = max requests, ARGV[4] = member
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max_requests = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+if count >= max_requests then
+    return 0
+end
+
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, window)
+return 1
+"""
+
+# SHA1 of the loaded script, populated on first use
+_script_sha: Optional[str] = None
+
+
+def build_rate_limit_key(client_ip: str, route: str) -> str:
+    """
+    Build the Redis key for a client/route rate limit window.
+
+    Args:
+        client_ip: Client IP address
+        route: Route path template
+
+    Returns:
+        str: Redis key for the window
+    """
+    return f"{RATE_LIMIT_KEY_PREFIX}:{client_ip}:{route}"
+
+
+async def _load_script(client) -> str:
+    """Load the sliding window script into Redis and remember its SHA."""
+    global _script_sha
+    _script_sha = await client.script_load(SLIDING_WINDOW_SCRIPT)
+    return _script_sha
+
+
+async def is_request_allowed(
+    client_ip: str,
+    route: str,
+    max_requests: int,
+    window_seconds: int = RATE_LIMIT_WINDOW_SECONDS
+) -> bool:
+    """
+    Record a request and check it against the sliding window limit.
+
+    Fails open: if Redis is unavailable the request is allowed so that
+    a cache outage does not take the API down with it.
+
+    Args:
+        client_ip: Client IP address
+        route: Route path template
+        max_requests: Maximum requests allowed in the window
+        window_seconds: Window length in seconds
+
+    Returns:
+        bool: True if the request is within the limit, False otherwise
+    """
+    key = build_rate_limit_key(client_ip, route)
+    args = (time.time(), window_seconds, max_requests, uuid.uuid4().hex)
+
+    try:
+        async with (await get_redis_client()) as client:
+            sha = _script_sha or await _load_script(client)
+            try:
+                allowed = await client.evalsha(sha, 1, key, *args)
+            except NoScriptError:
+                # Script cache was flushed (e.g. Redis restart)
+                sha = await _load_script(client)
+                allowed = await client.evalsha(sha, 1, key, *args)
+            return bool(int(allowed))
+    except RedisError as e:
+        logger.warning(
+            "Rate limit check failed, allowing request",
+            key=key,
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return True
@@ -11,7 +11,7 @@ from redis.asyncio.connection import ConnectionPool
 from redis.asyncio.retry import Retry
 from redis.exceptions import RedisError
 import structlog
-from typing import Optional, Any, Dict, List, Union, Set
+from typing import Optional, Any, Dict, List, Union, Set, Tuple
 import json
 import time
 import asyncio
@@ -122,3 +122,28 @@ async def get_redis_info() -> Dict[str, Any]:
             error_type=type(e).__name__
         )
         return {"error": str(e)}
+
+
+async def redis_probe_batch() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Ping Redis and fetch server information in a single round trip.
+    
+    Returns:
+        Tuple[bool, Dict[str, Any]]: Whether Redis responded to ping, and
+        the server information (or an error entry if unreachable).
+    """
+    try:
+        async with (await get_redis_client()) as client:
+            pipeline = client.pipeline(transaction=False)
+            pipeline.ping()
+            pipeline.info()
+            
+            healthy, info = await pipeline.execute()
+            return bool(healthy), info
+    except RedisError as e:
+        logger.error(
+            "Redis probe failed",
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return False, {"error": str(e)}
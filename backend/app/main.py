@@ -5,8 +5,10 @@ This module initializes the FastAPI application with comprehensive error handlin
 enhanced logging, correlation tracking, and all necessary configurations.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -25,16 +27,20 @@ from app.utils.request_logging import (
     PerformanceLoggingMiddleware,
     SecurityLoggingMiddleware
 )
+from app.utils.etag import ETagMiddleware
 from app.core.exception_handler import (
     EXCEPTION_HANDLERS,
     base_test_gen_exception_handler,
     validation_exception_handler,
     http_exception_handler,
     sqlalchemy_exception_handler,
-    general_exception_handler
+    general_exception_handler,
+    start_exception_logging,
+    stop_exception_logging
 )
 from app.core.exceptions import BaseTestGenException
-from app.api.v1.endpoints.health import router as health_router
+from app.api.v1.endpoints.health import router as health_router, metrics_refresher
+from app.api.v1.endpoints.test_cases import shutdown_generation_tasks
 from app.api.v1.api import api_router
 
 
@@ -59,7 +65,12 @@ async def lifespan(app: FastAPI):
         debug_mode=settings.DEBUG
     )
     
+    metrics_task = None
+    
     try:
+        # Move exception logging off the request path
+        await start_exception_logging()
+        
         # Initialize database
         await init_database()
         logger.info("Database initialized successfully")
@@ -77,6 +88,9 @@ async def lifespan(app: FastAPI):
             }
         )
         
+        # Start background metrics collection for /metrics
+        metrics_task = asyncio.create_task(metrics_refresher())
+        
         # Initialize additional services here (Redis, vector DB, etc.)
         logger.info("All services initialized successfully")
         
@@ -101,7 +115,12 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Shutting down Test Generation Agent")
+        if metrics_task is not None:
+            metrics_task.cancel()
         try:
+            # Generations still use Redis and logging, so stop them first
+            await shutdown_generation_tasks()
+            await stop_exception_logging()
             await close_db_connection()
             logger.info("Database connections closed successfully")
         except Exception as e:
@@ -121,6 +140,8 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
     lifespan=lifespan,
+    # Serialize responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
     # Enhanced exception handling
     debug=settings.DEBUG,
 )
@@ -164,6 +185,13 @@ app.add_middleware(
     log_security_events=True
 )
 
+# Answer repeat polls of unchanged health, metrics and test case reads with 304
+app.add_middleware(
+    ETagMiddleware,
+    paths={"/health", "/health/components", "/metrics"},
+    path_prefixes=(f"{settings.API_V1_STR}/test-cases",)
+)
+
 
 @app.middleware("http")
 async def correlation_id_middleware(request: Request, call_next):
@@ -1049,53 +1049,6 @@ class QueryBuilder:
             func.date(QualityMetrics.calculated_at)
         ).order_by('date')
 
-# Database session and connection management
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
-from contextlib import contextmanager
-
-class DatabaseConfig:
-    """Database configuration and session management."""
-    
-    def __init__(self, database_url: str, echo: bool = False):
-        self.engine = create_engine(
-            database_url,
-            echo=echo,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600
-        )
-        self.SessionLocal = scoped_session(sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine
-        ))
-    
-    def create_tables(self):
-        """Create all tables."""
-        Base.metadata.create_all(bind=self.engine)
-    
-    def drop_tables(self):
-        """Drop all tables (use with caution!)."""
-        Base.metadata.drop_all(bind=self.engine)
-    
-    @contextmanager
-    def get_session(self):
-        """Get database session with automatic cleanup."""
-        session = self.SessionLocal()
-        try:
-            yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
-    
-    def get_session_factory(self):
-        """Get session factory for dependency injection."""
-        return self.SessionLocal
 
 # Export all models and utilities
 __all__ = [
@@ -1115,5 +1068,5 @@ __all__ = [
     'QualityMetricsSchema', 'QAAnnotationSchema',
     
     # Utilities
-    'DatabaseManager', 'ModelConverter', 'QueryBuilder', 'DatabaseConfig'
+    'DatabaseManager', 'ModelConverter', 'QueryBuilder'
 ]
\ No newline at end of file
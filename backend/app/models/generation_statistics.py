@@ -4,7 +4,7 @@ Generation Statistics model for tracking test case generation performance.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from sqlalchemy import (
     Column, Integer, Numeric, ForeignKey, TIMESTAMP
 )
@@ -4,7 +4,7 @@ Quality Metrics model for tracking test case quality scores.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from sqlalchemy import (
     Column, Integer, Numeric, String, Boolean, 
     ForeignKey, Enum, TIMESTAMP
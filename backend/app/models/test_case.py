@@ -7,9 +7,9 @@ from decimal import Decimal
 from typing import Optional, Dict, Any, List, Union
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, 
-    Numeric, Enum, ForeignKey, ARRAY, TIMESTAMP, Boolean, event
+    Numeric, Enum, ForeignKey, TIMESTAMP, Boolean, Index, event
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, Session
 import enum
@@ -36,6 +36,15 @@ class TestPriority(str, enum.Enum):
     CRITICAL = "critical"
 
 
+# Classifications considered suitable for automation
+AUTOMATED_CLASSIFICATIONS = frozenset({
+    TestClassification.API_AUTOMATION,
+    TestClassification.UI_AUTOMATION,
+    TestClassification.PERFORMANCE,
+    TestClassification.INTEGRATION
+})
+
+
 class TestCase(Base):
     """
     Test Case model representing generated test cases for user stories.
@@ -102,7 +111,8 @@ class TestCase(Base):
     success_rate = Column(Numeric(3, 2), comment="Historical success rate (0-1)")
     
     # Soft delete functionality
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+    # Not indexed on its own: the partial indexes below cover live rows
+    is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True)
     deleted_by = Column(String(100), nullable=True)
     
@@ -172,13 +182,7 @@ class TestCase(Base):
     @property
     def is_automated(self) -> bool:
         """Check if the test case is suitable for automation."""
-        automated_types = [
-            TestClassification.API_AUTOMATION,
-            TestClassification.UI_AUTOMATION,
-            TestClassification.PERFORMANCE,
-            TestClassification.INTEGRATION
-        ]
-        return self.classification in automated_types
+        return self.classification in AUTOMATED_CLASSIFICATIONS
 
     @property
     def automation_confidence_level(self) -> str:
@@ -320,6 +324,86 @@ class TestCase(Base):
         
         return base_dict
 
+    @classmethod
+    def row_to_dict(cls, row: Any, include_steps: bool = True) -> Dict[str, Any]:
+        """
+        Convert a Core result row to the public test case representation.
+
+        Produces the same fields as ``to_dict(include_sensitive=False)``
+        without hydrating an ORM instance, for read-only listings.
+
+        Args:
+            row: Result row with the test case columns and an
+                ``overall_quality_score`` column
+            include_steps: Whether to include detailed step information
+        """
+        now = datetime.utcnow()
+        classification = row.classification
+        confidence = row.classification_confidence
+        estimated = row.estimated_duration
+        actual = row.actual_duration
+        last_executed_at = row.last_executed_at
+        created_at = row.created_at
+        days_since_executed = (
+            (now - last_executed_at.replace(tzinfo=None)).days if last_executed_at else None
+        )
+
+        if confidence is None:
+            confidence_level = "unknown"
+        elif float(confidence) >= 0.8:
+            confidence_level = "high"
+        elif float(confidence) >= 0.5:
+            confidence_level = "medium"
+        else:
+            confidence_level = "low"
+
+        base_dict = {
+            "id": row.id,
+            "user_story_id": row.user_story_id,
+            "azure_devops_id": row.azure_devops_id,
+            "title": row.title,
+            "description": row.description,
+            "step_count": len(row.steps) if isinstance(row.steps, list) else 0,
+            "has_test_data": bool(row.test_data),
+            "has_preconditions": bool(row.preconditions),
+            "has_postconditions": bool(row.postconditions),
+            "classification": classification.value if classification else None,
+            "classification_confidence": float(confidence) if confidence else None,
+            "classification_reasoning": row.classification_reasoning,
+            "automation_confidence_level": confidence_level,
+            "is_automated": classification in AUTOMATED_CLASSIFICATIONS,
+            "priority": row.priority.value if row.priority else "medium",
+            "estimated_duration": estimated,
+            "estimated_duration_hours": estimated / 60.0 if estimated else None,
+            "actual_duration": actual,
+            "execution_efficiency": estimated / actual if estimated and actual else None,
+            "tags": row.tags,
+            "test_environment": row.test_environment,
+            "test_type": row.test_type,
+            "execution_count": row.execution_count,
+            "last_executed_at": last_executed_at.isoformat() if last_executed_at else None,
+            "success_rate": float(row.success_rate) if row.success_rate else None,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            "is_active": not row.is_deleted,
+            "overall_quality_score": (
+                float(row.overall_quality_score) if row.overall_quality_score else None
+            ),
+            "days_since_created": (now - created_at.replace(tzinfo=None)).days if created_at else 0,
+            "days_since_executed": days_since_executed,
+            "needs_execution": days_since_executed is None or days_since_executed > 30
+        }
+
+        if include_steps:
+            base_dict.update({
+                "steps": row.steps,
+                "test_data": row.test_data,
+                "preconditions": row.preconditions,
+                "postconditions": row.postconditions
+            })
+
+        return base_dict
+
     def to_json(self, **kwargs) -> str:
         """Convert to JSON string representation."""
         return json.dumps(self.to_dict(**kwargs), default=str, indent=2)
@@ -665,7 +749,7 @@ class TestCase(Base):
         search_filter = (
             cls.title.ilike(f"%{search_term}%") |
             cls.description.ilike(f"%{search_term}%") |
-            cls.tags.op('?')(search_term)  # Check if tag exists in array
+            cls.tags.contains([search_term])  # Check if tag exists in array
         )
         
         return query.filter(search_filter).all()
@@ -708,6 +792,45 @@ class TestCase(Base):
         return hashlib.md5(content.encode()).hexdigest()
 
 
+# Indexes backing the list_test_cases filters, ordering and search. All are
+# partial on is_deleted = false since every API query excludes deleted rows;
+# queries must keep spelling that predicate for the planner to use them.
+Index(
+    "ix_test_cases_list",
+    TestCase.user_story_id,
+    TestCase.classification,
+    TestCase.priority,
+    TestCase.created_at.desc(),
+    postgresql_where=TestCase.is_deleted == False
+)
+Index(
+    "ix_test_cases_active_created_at",
+    TestCase.created_at.desc(),
+    postgresql_where=TestCase.is_deleted == False
+)
+Index(
+    "ix_test_cases_tags",
+    TestCase.tags,
+    postgresql_using="gin",
+    postgresql_where=TestCase.is_deleted == False
+)
+# Trigram indexes (pg_trgm) so ILIKE '%term%' search can use an index
+Index(
+    "ix_test_cases_title_trgm",
+    TestCase.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+    postgresql_where=TestCase.is_deleted == False
+)
+Index(
+    "ix_test_cases_description_trgm",
+    TestCase.description,
+    postgresql_using="gin",
+    postgresql_ops={"description": "gin_trgm_ops"},
+    postgresql_where=TestCase.is_deleted == False
+)
+
+
 # SQLAlchemy Event Listeners for enhanced functionality
 @event.listens_for(TestCase, 'before_insert')
 def before_insert_test_case(mapper, connection, target):
@@ -7,11 +7,12 @@ from decimal import Decimal
 from typing import Optional, Dict, Any, List, Union
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, 
-    Numeric, Enum, Boolean, TIMESTAMP, event
+    Numeric, Enum, Boolean, TIMESTAMP, Index, Computed, case, cast, event
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship, Session
+from sqlalchemy.orm import relationship, Session, deferred
+from sqlalchemy.ext.hybrid import hybrid_property
 import enum
 import json
 
@@ -55,6 +56,16 @@ class UserStory(Base):
     )
     domain_classification = Column(String(50), comment="Detected domain (e.g., ecommerce, finance)")
     
+    # Full-text search document maintained by PostgreSQL; never loaded by default
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || "
+            "coalesce(description, '') || ' ' || coalesce(acceptance_criteria, ''))",
+            persisted=True
+        )
+    ))
+    
     # Processing status and timestamps
     processing_status = Column(
         Enum(ProcessingStatus, name="processing_status"),
@@ -63,7 +74,7 @@ class UserStory(Base):
     )
     
     # Soft delete functionality
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+    is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True)
     deleted_by = Column(String(100), nullable=True)
     
@@ -109,17 +120,27 @@ class UserStory(Base):
         return f"User Story {self.azure_devops_id}: {self.title}"
 
     # Computed Properties
-    @property
+    # The hybrids also have SQL forms, so read-only listings can select the
+    # derived values as plain columns instead of computing them per row
+    @hybrid_property
     def is_processed(self) -> bool:
         """Check if the user story has been processed."""
         return self.processing_status == ProcessingStatus.COMPLETED
 
-    @property
+    @is_processed.expression
+    def is_processed(cls):
+        return cls.processing_status == ProcessingStatus.COMPLETED
+
+    @hybrid_property
     def needs_processing(self) -> bool:
         """Check if the user story needs processing."""
         return self.processing_status in [ProcessingStatus.PENDING, ProcessingStatus.FAILED]
 
-    @property
+    @needs_processing.expression
+    def needs_processing(cls):
+        return cls.processing_status.in_([ProcessingStatus.PENDING, ProcessingStatus.FAILED])
+
+    @hybrid_property
     def complexity_level(self) -> str:
         """Get human-readable complexity level."""
         if self.complexity_score is None:
@@ -133,6 +154,15 @@ class UserStory(Base):
         else:
             return "complex"
 
+    @complexity_level.expression
+    def complexity_level(cls):
+        return case(
+            (cls.complexity_score.is_(None), "unknown"),
+            (cls.complexity_score < 0.3, "simple"),
+            (cls.complexity_score < 0.7, "medium"),
+            else_="complex"
+        )
+
     @property
     def is_active(self) -> bool:
         """Check if the user story is active (not soft deleted)."""
@@ -145,7 +175,7 @@ class UserStory(Base):
             self._test_case_count = len(self.test_cases) if self.test_cases else 0
         return self._test_case_count
 
-    @property
+    @hybrid_property
     def days_since_created(self) -> int:
         """Get number of days since creation."""
         if not self.created_at:
@@ -153,6 +183,13 @@ class UserStory(Base):
         delta = datetime.utcnow() - self.created_at.replace(tzinfo=None)
         return delta.days
 
+    @days_since_created.expression
+    def days_since_created(cls):
+        return func.coalesce(
+            cast(func.date_part("day", func.now() - cls.created_at), Integer),
+            0
+        )
+
     # Serialization Methods
     def to_dict(self, include_relationships: bool = False, include_sensitive: bool = True) -> Dict[str, Any]:
         """
@@ -279,6 +316,43 @@ class UserStory(Base):
             "queued_by": updated_by
         }
 
+    @classmethod
+    def row_to_dict(cls, row: Any) -> Dict[str, Any]:
+        """
+        Convert a Core result row to the public user story representation.
+
+        Produces the same fields as ``to_dict(include_sensitive=False)``
+        without hydrating an ORM instance, for read-only listings.
+
+        Args:
+            row: Result row with the user story columns, the derived
+                columns in ``LIST_DERIVED_COLUMNS`` and a
+                ``test_case_count`` column
+        """
+        complexity_score = row.complexity_score
+        processing_status = row.processing_status
+        created_at = row.created_at
+
+        return {
+            "id": row.id,
+            "azure_devops_id": row.azure_devops_id,
+            "title": row.title,
+            "description": row.description,
+            "acceptance_criteria": row.acceptance_criteria,
+            "complexity_score": float(complexity_score) if complexity_score else None,
+            "complexity_level": row.complexity_level,
+            "domain_classification": row.domain_classification,
+            "processing_status": processing_status.value if processing_status else None,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            "processed_at": row.processed_at.isoformat() if row.processed_at else None,
+            "is_processed": row.is_processed,
+            "needs_processing": row.needs_processing,
+            "is_active": not row.is_deleted,
+            "total_test_cases": row.test_case_count,
+            "days_since_created": row.days_since_created
+        }
+
     # Soft Delete Methods
     def soft_delete(self, deleted_by: str = "system") -> None:
         """Perform soft delete operation."""
@@ -437,6 +511,57 @@ class UserStory(Base):
         self.normalization_metadata["processing_history"].append(step_entry)
 
 
+# Derived fields computed by PostgreSQL for UserStory.row_to_dict
+LIST_DERIVED_COLUMNS = (
+    UserStory.complexity_level.label("complexity_level"),
+    UserStory.is_processed.label("is_processed"),
+    UserStory.needs_processing.label("needs_processing"),
+    UserStory.days_since_created.label("days_since_created"),
+)
+
+
+# Index backing keyset pagination of live user stories, newest first
+Index(
+    "ix_user_stories_active_created_at_id",
+    UserStory.created_at.desc(),
+    UserStory.id.desc(),
+    postgresql_where=UserStory.is_deleted == False
+)
+# Filtered listings of live user stories, newest first
+Index(
+    "ix_user_stories_active_status_created_at",
+    UserStory.processing_status,
+    UserStory.created_at.desc(),
+    postgresql_where=UserStory.is_deleted == False
+)
+Index(
+    "ix_user_stories_active_domain_created_at",
+    UserStory.domain_classification,
+    UserStory.created_at.desc(),
+    postgresql_where=UserStory.is_deleted == False
+)
+Index(
+    "ix_user_stories_active_complexity",
+    UserStory.complexity_score,
+    postgresql_where=UserStory.is_deleted == False
+)
+# Full-text search over title, description and acceptance criteria
+Index(
+    "ix_user_stories_search_tsv",
+    UserStory.search_tsv,
+    postgresql_using="gin",
+    postgresql_where=UserStory.is_deleted == False
+)
+# Trigram index (pg_trgm) so substring title matches can use an index
+Index(
+    "ix_user_stories_title_trgm",
+    UserStory.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+    postgresql_where=UserStory.is_deleted == False
+)
+
+
 # SQLAlchemy Event Listeners for enhanced functionality
 @event.listens_for(UserStory, 'before_insert')
 def before_insert_user_story(mapper, connection, target):
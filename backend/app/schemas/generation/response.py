@@ -74,3 +74,12 @@ class GenerationResult(BaseModel):
     summary: GenerationSummary = Field(..., description="Generation summary")
     generated_at: datetime = Field(default_factory=datetime.utcnow, description="Generation timestamp")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+
+
+class GenerationTask(BaseModel):
+    """Status of an asynchronous test case generation task."""
+    task_id: str = Field(..., description="Generation task ID")
+    status: str = Field(..., description="Task status (pending, completed, failed)")
+    user_story_id: Optional[int] = Field(None, description="ID of the stored user story")
+    result: Optional[GenerationResult] = Field(None, description="Generation result once completed")
+    error: Optional[str] = Field(None, description="Error message if generation failed")
@@ -8,6 +8,7 @@ pattern-based cache invalidation, and cache statistics.
 
 import json
 import hashlib
+import orjson
 import time
 import asyncio
 from functools import wraps
@@ -98,6 +99,70 @@ async def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> bool:
         return False
 
 
+async def cache_get_many(keys: List[str]) -> List[Any]:
+    """
+    Get several values from cache in a single round-trip.
+    
+    Values are decoded with orjson, since this serves whole list pages.
+    
+    Args:
+        keys: The cache keys
+        
+    Returns:
+        Cached values in key order, with None for missing keys
+    """
+    if not keys:
+        return []
+    
+    try:
+        async with (await get_redis_client()) as client:
+            cached_values = await client.mget(keys)
+            return [orjson.loads(value) if value else None for value in cached_values]
+    except (RedisError, ValueError) as e:
+        await increment_cache_error(keys[0], str(e))
+        logger.warning(
+            "Cache get many error",
+            key_count=len(keys),
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return [None] * len(keys)
+
+
+async def cache_set_many(values: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    """
+    Set several values in cache in a single pipelined round-trip.
+    
+    Args:
+        values: Mapping of cache key to value (serialized with orjson)
+        ttl: Time-to-live in seconds (None for default from settings)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if not values:
+        return True
+    if ttl is None:
+        ttl = settings.REDIS_CACHE_TTL
+    
+    try:
+        async with (await get_redis_client()) as client:
+            pipeline = client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.set(key, orjson.dumps(value), ex=ttl)
+            await pipeline.execute()
+            return True
+    except (RedisError, TypeError, ValueError) as e:
+        await increment_cache_error(next(iter(values)), str(e))
+        logger.warning(
+            "Cache set many error",
+            key_count=len(values),
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return False
+
+
 async def cache_delete(key: str) -> bool:
     """
     Delete a value from cache.
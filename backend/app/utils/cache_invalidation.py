@@ -27,6 +27,23 @@ TAG_KEY_PREFIX = "testgen:tags:"
 ENTITY_KEY_PREFIX = "testgen:entities:"
 INVALIDATION_LOCKS_PREFIX = "testgen:invalidation:locks:"
 
+# Cached test case list pages and detail payloads; details embed the parent
+# user story, so story writes must clear them too
+TEST_CASE_CACHE_PREFIX = "testgen:test_cases"
+
+
+async def invalidate_test_case_caches() -> int:
+    """
+    Drop cached test case list pages and details after a write.
+    
+    Returns:
+        Number of keys invalidated
+    """
+    deleted = 0
+    for kind in ("list", "detail"):
+        deleted += await cache_delete_pattern(f"{TEST_CASE_CACHE_PREFIX}:{kind}:*")
+    return deleted
+
 
 async def tag_keys(tag: str, key: str) -> bool:
     """
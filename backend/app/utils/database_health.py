@@ -12,7 +12,7 @@ from sqlalchemy.sql import text
 from sqlalchemy.exc import SQLAlchemyError
 import structlog
 
-from app.core.database import get_db_session, test_database_connection
+from app.core.database import get_db_session, get_health_db_session, test_database_connection
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -47,21 +47,24 @@ class DatabaseHealthChecker:
             return self.last_result
         
         try:
-            # Basic connection test
-            connection_info = await test_database_connection()
-            
-            # Performance metrics
-            performance_metrics = await self._check_performance_metrics()
-            
-            # Table and schema checks
-            schema_info = await self._check_schema_health()
+            # Connection test, performance metrics, schema checks and the
+            # health log are independent probes, each on its own session
+            # and each catching its own errors, so run them concurrently
+            (
+                connection_info,
+                performance_metrics,
+                schema_info,
+                health_log_info
+            ) = await asyncio.gather(
+                test_database_connection(read_only=True, include_stats=True),
+                self._check_performance_metrics(),
+                self._check_schema_health(),
+                self._check_health_log()
+            )
             
             # Connection pool status
             pool_info = await self._check_pool_status()
             
-            # System health log check
-            health_log_info = await self._check_health_log()
-            
             result = {
                 "status": "healthy" if connection_info["status"] == "healthy" else "unhealthy",
                 "timestamp": now.isoformat(),
@@ -94,7 +97,7 @@ class DatabaseHealthChecker:
     async def _check_performance_metrics(self) -> Dict[str, Any]:
         """Check database performance metrics."""
         try:
-            async with get_db_session() as session:
+            async with get_health_db_session() as session:
                 # Connection and query metrics
                 metrics_query = text("""
                     SELECT 
@@ -130,7 +133,7 @@ class DatabaseHealthChecker:
     async def _check_schema_health(self) -> Dict[str, Any]:
         """Check schema and table health."""
         try:
-            async with get_db_session() as session:
+            async with get_health_db_session() as session:
                 # Check for required tables
                 required_tables = [
                     'user_stories', 'test_cases', 'quality_metrics',
@@ -199,7 +202,7 @@ class DatabaseHealthChecker:
     async def _check_health_log(self) -> Dict[str, Any]:
         """Check recent system health log entries."""
         try:
-            async with get_db_session() as session:
+            async with get_health_db_session() as session:
                 # Get recent health log entries
                 log_query = text("""
                     SELECT component, status, message, timestamp
@@ -254,7 +257,7 @@ async def quick_health_check() -> bool:
         bool: True if database is healthy, False otherwise
     """
     try:
-        async with get_db_session() as session:
+        async with get_health_db_session() as session:
             await session.execute(text("SELECT 1"))
             return True
     except Exception as e:
@@ -327,7 +330,7 @@ async def cleanup_old_health_logs(days_to_keep: int = 7):
 async def check_test_generation_health() -> Dict[str, Any]:
     """Check health of test generation system."""
     try:
-        async with get_db_session() as session:
+        async with get_health_db_session() as session:
             # Check recent generation statistics
             stats_query = text("""
                 SELECT 
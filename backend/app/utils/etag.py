@@ -0,0 +1,101 @@
+"""
+ETag support for frequently polled GET endpoints.
+
+Probes, scrapers and UI polling usually receive the same body on every
+request. This middleware tags successful responses with a weak ETag derived
+from the body and answers matching ``If-None-Match`` requests with an empty
+304 Not Modified response.
+"""
+
+import hashlib
+from typing import Callable, Iterable, Optional, Set, Tuple
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute a weak ETag for a response body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        str: Weak ETag header value
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Check an ETag against an If-None-Match header using weak comparison.
+
+    Args:
+        etag: ETag of the current representation
+        if_none_match: Raw If-None-Match header value
+
+    Returns:
+        bool: True if the client already holds this representation
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware adding ETag / If-None-Match handling to selected GET routes.
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        paths: Optional[Set[str]] = None,
+        path_prefixes: Iterable[str] = ()
+    ):
+        super().__init__(app)
+        self.paths = paths or set()
+        self.path_prefixes: Tuple[str, ...] = tuple(path_prefixes)
+
+    def _applies_to(self, request: Request) -> bool:
+        """Check whether the request targets an ETag-enabled route."""
+        if request.method != "GET":
+            return False
+        path = request.url.path
+        return path in self.paths or path.startswith(self.path_prefixes)
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Tag successful responses and short-circuit unchanged ones."""
+
+        if not self._applies_to(request):
+            return await call_next(request)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = compute_etag(body)
+
+        if etag_matches(etag, request.headers.get("if-none-match")):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        rebuilt = Response(
+            content=body,
+            status_code=response.status_code,
+            background=response.background
+        )
+        # Copy the raw header list so repeated headers such as Set-Cookie
+        # survive; a dict would keep only the last of each
+        rebuilt.raw_headers = list(response.raw_headers)
+        rebuilt.headers["ETag"] = etag
+        return rebuilt
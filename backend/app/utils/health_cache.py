@@ -0,0 +1,89 @@
+"""
+Short-lived in-process cache for health probe results.
+
+Kubernetes probes, load balancers and monitoring can hit the health
+endpoints many times per second. This module collapses bursts of probes
+into a single backend call by caching results for a short TTL, and
+single-flights concurrent calls so that callers arriving while a check
+is running await that check instead of starting their own.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+# key -> (expiry timestamp, value)
+_cache: Dict[str, Tuple[float, Any]] = {}
+# key -> future for the check currently in flight
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def single_flight(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run ``coro_factory`` once for all concurrent callers sharing ``key``.
+
+    The result (or exception) of the in-flight call is delivered to every
+    caller that arrived while it was running.
+
+    Args:
+        key: Key identifying the check
+        coro_factory: Zero-argument callable returning the check coroutine
+
+    Returns:
+        The check result
+    """
+    future = _inflight.get(key)
+    if future is not None:
+        # Shield so a cancelled waiter doesn't cancel the shared result
+        return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await coro_factory()
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark retrieved so an unobserved failure doesn't log a warning
+        future.exception()
+        raise
+    else:
+        future.set_result(value)
+        return value
+    finally:
+        _inflight.pop(key, None)
+
+
+async def cached(key: str, ttl: float, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return a cached probe result or compute it with ``coro_factory``.
+
+    Failed probes are never cached: exceptions propagate and falsy results
+    are returned without being stored, so an outage is reported immediately
+    and recovery is picked up on the next call.
+
+    Args:
+        key: Cache key for the probe
+        ttl: Time-to-live in seconds
+        coro_factory: Zero-argument callable returning the probe coroutine
+
+    Returns:
+        The probe result
+    """
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    async def refresh() -> Any:
+        value = await coro_factory()
+        if value:
+            _cache[key] = (time.monotonic() + ttl, value)
+        else:
+            _cache.pop(key, None)
+        return value
+
+    return await single_flight(key, refresh)
+
+
+def clear_health_cache() -> None:
+    """Drop all cached probe results."""
+    _cache.clear()
@@ -17,7 +17,8 @@ from alembic import command
 from sqlalchemy import text
 
 from app.core.config import settings
-from app.core.database import get_db_session
+# Module import (not a name import) because database imports this module
+from app.core import database
 
 logger = structlog.get_logger(__name__)
 
@@ -60,7 +61,7 @@ async def get_current_revision() -> Optional[str]:
         str: Current revision or None if no revision
     """
     try:
-        async with get_db_session() as session:
+        async with database.get_db_session() as session:
             # Check if alembic_version table exists
             check_query = text("""
                 SELECT EXISTS (
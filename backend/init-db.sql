@@ -4,6 +4,8 @@
 -- Enable required extensions for the Test Generation Agent
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+-- Trigram operator classes for the title and description search indexes
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
 -- Try to create vector extension, but don't fail if it doesn't exist
 -- The vector extension is needed for pgvector support but may not be available in all PostgreSQL images
@@ -48,6 +50,17 @@ EXCEPTION
     WHEN duplicate_object THEN null;
 END $;
 
+DO $$ BEGIN
+    CREATE TYPE test_priority AS ENUM (
+        'low',
+        'medium',
+        'high',
+        'critical'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
 DO $ BEGIN
     CREATE TYPE confidence_level AS ENUM (
         'low',
@@ -271,6 +284,52 @@ ON generation_statistics (user_story_id, generation_start DESC);
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_generation_stats_performance 
 ON generation_statistics (generation_start DESC, processing_time_seconds, average_quality_score DESC);
 
+-- Columns the partial list and search indexes below depend on; ADD COLUMN
+-- IF NOT EXISTS brings databases created by older versions of this file up
+-- to date
+ALTER TABLE user_stories ADD COLUMN IF NOT EXISTS is_deleted BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE user_stories ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || coalesce(acceptance_criteria, ''))
+    ) STORED;
+ALTER TABLE test_cases ADD COLUMN IF NOT EXISTS is_deleted BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE test_cases ADD COLUMN IF NOT EXISTS priority test_priority NOT NULL DEFAULT 'medium';
+
+-- Live user story listings, keyset pagination and search
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_stories_active_created_at_id 
+ON user_stories (created_at DESC, id DESC) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_stories_active_status_created_at 
+ON user_stories (processing_status, created_at DESC) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_stories_active_domain_created_at 
+ON user_stories (domain_classification, created_at DESC) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_stories_active_complexity 
+ON user_stories (complexity_score) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_stories_search_tsv 
+ON user_stories USING gin (search_tsv) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_stories_title_trgm 
+ON user_stories USING gin (title gin_trgm_ops) WHERE is_deleted = false;
+
+-- Live test case listings and search
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_test_cases_list 
+ON test_cases (user_story_id, classification, priority, created_at DESC) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_test_cases_active_created_at 
+ON test_cases (created_at DESC) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_test_cases_tags 
+ON test_cases USING gin (tags) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_test_cases_title_trgm 
+ON test_cases USING gin (title gin_trgm_ops) WHERE is_deleted = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_test_cases_description_trgm 
+ON test_cases USING gin (description gin_trgm_ops) WHERE is_deleted = false;
+
 -- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
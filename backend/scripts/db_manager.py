@@ -78,7 +78,7 @@ async def check_health():
         click.echo("Checking database health...")
         
         # Basic connection test
-        connection_info = await test_database_connection()
+        connection_info = await test_database_connection(include_stats=True)
         
         if connection_info["status"] == "healthy":
             click.echo("✅ Database connection: Healthy")
@@ -241,7 +241,7 @@ async def show_info():
             click.echo(f"Test Database URL: {settings.DATABASE_TEST_URL.split('@')[-1]}")
         
         # Test connection
-        connection_info = await test_database_connection()
+        connection_info = await test_database_connection(include_stats=True)
         if connection_info["status"] == "healthy":
             click.echo(f"\nDatabase Name: {connection_info['database_name']}")
             click.echo(f"User: {connection_info['user_name']}")
@@ -116,15 +116,28 @@ async def test_generate_test_cases():
             json=generation_request,
             headers={"Content-Type": "application/json"}
         ) as response:
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ Test cases generated: {len(data['test_cases'])} cases")
-                print(f"   Average quality score: {data['summary']['average_quality_score']:.2f}")
-                return data["test_cases"]
-            else:
+            if response.status != 202:
                 error_text = await response.text()
                 print(f"❌ Test case generation failed: {response.status} - {error_text}")
                 return None
+            task = await response.json()
+        
+        # Poll the generation task until it finishes
+        for _ in range(30):
+            async with session.get(f"{API_BASE}/test-cases/generate/{task['task_id']}") as response:
+                task = await response.json()
+            if task.get("status") != "pending":
+                break
+            await asyncio.sleep(0.5)
+        
+        if task.get("status") == "completed":
+            data = task["result"]
+            print(f"✅ Test cases generated: {len(data['test_cases'])} cases")
+            print(f"   Average quality score: {data['summary']['average_quality_score']:.2f}")
+            return data["test_cases"]
+        else:
+            print(f"❌ Test case generation failed: {task.get('status')} - {task.get('error', task.get('detail'))}")
+            return None
 
 
 async def test_list_test_cases():
@@ -0,0 +1,63 @@
+"""
+Shared pytest configuration for the backend tests.
+
+Exposes the database fixtures from ``app.core.database_test``, provides
+a session-scoped event loop so the session-scoped async fixtures can run,
+and a client for the user story endpoints backed by the test session.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import user_stories
+from app.core.database import get_db_readonly
+from app.core.database_test import (  # noqa: F401
+    test_db_engine,
+    test_db_setup,
+    test_db_session,
+)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Event loop shared by the whole test session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    """Make every user story cache lookup miss so responses come from the database."""
+    async def cache_get(key, default=None):
+        return default
+
+    async def cache_get_many(keys):
+        return [None] * len(keys)
+
+    async def cache_set(*args, **kwargs):
+        return True
+
+    monkeypatch.setattr(user_stories, "cache_get", cache_get)
+    monkeypatch.setattr(user_stories, "cache_get_many", cache_get_many)
+    monkeypatch.setattr(user_stories, "cache_set", cache_set)
+    monkeypatch.setattr(user_stories, "cache_set_many", cache_set)
+
+
+@pytest_asyncio.fixture
+async def user_stories_client(test_db_session, no_cache):
+    """Client for the user story router reading through the test session."""
+    app = FastAPI()
+    app.include_router(user_stories.router, prefix="/user-stories")
+
+    async def override_get_db_readonly():
+        yield test_db_session
+
+    app.dependency_overrides[get_db_readonly] = override_get_db_readonly
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
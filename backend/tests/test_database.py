@@ -15,8 +15,11 @@ from app.core.database_test import (
     drop_test_database,
     cleanup_test_database,
     verify_test_database_setup,
+    insert_test_data,
+    count_table_rows,
     TestDataFactory
 )
+from app.models.user_story import ProcessingStatus
 from app.utils.database_health import quick_health_check, detailed_health_check
 
 
@@ -84,6 +87,24 @@ class TestDatabaseSetup:
         finally:
             await drop_test_database()
     
+    @pytest.mark.asyncio
+    async def test_insert_test_data_round_trip(self, test_db_session):
+        """Test that insert_test_data inserts into the testgen table and returns the ID."""
+        story_data = TestDataFactory.create_user_story_data(
+            azure_devops_id="TEST-INSERT-1",
+            processing_status=ProcessingStatus.PENDING
+        )
+        
+        story_id = await insert_test_data(test_db_session, "user_stories", story_data)
+        assert story_id is not None, "Should get a story ID back"
+        
+        result = await test_db_session.execute(
+            text("SELECT title FROM testgen.user_stories WHERE id = :id"),
+            {"id": story_id}
+        )
+        assert result.scalar() == story_data["title"], "Should retrieve the same title"
+        assert await count_table_rows(test_db_session, "user_stories") == 1
+    
     @pytest.mark.asyncio
     async def test_health_check_functions(self):
         """Test health check functionality."""
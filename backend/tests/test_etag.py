@@ -0,0 +1,168 @@
+"""
+Tests for the ETag / If-None-Match middleware.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+from starlette.background import BackgroundTask
+
+from app.utils.etag import ETagMiddleware, compute_etag, etag_matches
+
+
+BODY = {"status": "healthy"}
+
+
+@pytest.fixture
+def background_calls():
+    """Collect calls made by response background tasks."""
+    return []
+
+
+@pytest.fixture
+def client(background_calls):
+    """Client for a small app with ETag-enabled and plain routes."""
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware, paths={"/health"}, path_prefixes=("/items",))
+
+    @app.get("/health")
+    async def health():
+        return BODY
+
+    @app.post("/health")
+    async def post_health():
+        return BODY
+
+    @app.get("/items/missing")
+    async def missing():
+        return JSONResponse({"detail": "Not found"}, status_code=404)
+
+    @app.get("/items/with-extras")
+    async def with_extras():
+        response = PlainTextResponse(
+            "extras",
+            headers={"X-Custom": "kept", "Cache-Control": "max-age=5"},
+            background=BackgroundTask(background_calls.append, "ran")
+        )
+        response.set_cookie("first", "1")
+        response.set_cookie("second", "2")
+        return response
+
+    @app.get("/untracked")
+    async def untracked():
+        return BODY
+
+    return TestClient(app)
+
+
+class TestETagMatching:
+    """Test ETag computation and If-None-Match comparison."""
+
+    def test_compute_etag_is_weak_and_stable(self):
+        """Test that ETags are weak and depend only on the body."""
+        etag = compute_etag(b"body")
+
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert compute_etag(b"body") == etag
+        assert compute_etag(b"other") != etag
+
+    def test_missing_header_does_not_match(self):
+        """Test that no If-None-Match means no match."""
+        assert not etag_matches('W/"abc"', None)
+        assert not etag_matches('W/"abc"', "")
+
+    def test_weak_comparison(self):
+        """Test that weak and strong forms of the same tag match."""
+        assert etag_matches('W/"abc"', 'W/"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert not etag_matches('W/"abc"', 'W/"abd"')
+
+    def test_list_of_candidates(self):
+        """Test that any tag in a comma-separated list can match."""
+        assert etag_matches('W/"abc"', '"xyz", W/"abc"')
+        assert not etag_matches('W/"abc"', '"xyz", W/"uvw"')
+
+    def test_wildcard(self):
+        """Test that * matches any representation."""
+        assert etag_matches('W/"abc"', "*")
+        assert etag_matches('W/"abc"', " * ")
+
+
+class TestETagMiddleware:
+    """Test the middleware on enabled and passthrough routes."""
+
+    def test_tags_successful_get(self, client):
+        """Test that a 200 GET carries the body's ETag."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == BODY
+        assert response.headers["etag"] == compute_etag(response.content)
+
+    def test_not_modified_on_matching_etag(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get("/health").headers["etag"]
+
+        response = client.get("/health", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_not_modified_on_strong_form_of_tag(self, client):
+        """Test that the strong form of the tag also gets a 304."""
+        etag = client.get("/health").headers["etag"]
+
+        response = client.get("/health", headers={"If-None-Match": etag.removeprefix("W/")})
+
+        assert response.status_code == 304
+
+    def test_not_modified_on_wildcard(self, client):
+        """Test that If-None-Match: * gets a 304."""
+        response = client.get("/health", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 304
+
+    def test_full_response_on_stale_etag(self, client):
+        """Test that a non-matching tag gets the full body."""
+        response = client.get("/health", headers={"If-None-Match": 'W/"stale"'})
+
+        assert response.status_code == 200
+        assert response.json() == BODY
+
+    def test_non_get_passes_through(self, client):
+        """Test that non-GET requests are neither tagged nor short-circuited."""
+        response = client.post("/health", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    def test_non_200_passes_through(self, client):
+        """Test that error responses are returned untouched."""
+        response = client.get("/items/missing", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Not found"}
+        assert "etag" not in response.headers
+
+    def test_untracked_path_passes_through(self, client):
+        """Test that routes outside paths and prefixes are not tagged."""
+        response = client.get("/untracked", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    def test_rebuilt_response_keeps_headers_and_background(self, client, background_calls):
+        """Test that the rebuilt 200 keeps headers, cookies and background tasks."""
+        response = client.get("/items/with-extras")
+
+        assert response.status_code == 200
+        assert response.text == "extras"
+        assert response.headers["x-custom"] == "kept"
+        assert response.headers["cache-control"] == "max-age=5"
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["content-length"] == str(len(b"extras"))
+        cookies = response.headers.get_list("set-cookie")
+        assert [cookie.split("=", 1)[0] for cookie in cookies] == ["first", "second"]
+        assert background_calls == ["ran"]
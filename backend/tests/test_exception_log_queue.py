@@ -0,0 +1,179 @@
+"""
+Tests for the background exception log queue.
+"""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from app.core import exception_handler as exception_handler_module
+from app.core.exception_handler import (
+    _LogQueue,
+    start_exception_logging,
+    stop_exception_logging,
+)
+from app.utils.correlation import CorrelationIdManager
+
+
+class RecordingLogger:
+    """Logger stand-in that records every call."""
+
+    def __init__(self):
+        self.records = []
+
+    def __getattr__(self, level):
+        def log(message, **context):
+            self.records.append((level, message, context))
+        return log
+
+    def messages(self):
+        return [message for _, message, _ in self.records]
+
+
+@pytest.fixture
+def log_queue():
+    """A fresh queue whose output goes to a RecordingLogger."""
+    queue = _LogQueue()
+    queue.logger = RecordingLogger()
+    yield queue
+
+
+@pytest.fixture
+def batches(log_queue, monkeypatch):
+    """Record the size of every batch the queue emits."""
+    sizes = []
+    emit_batch = log_queue._emit_batch
+
+    def recording_emit_batch(batch):
+        sizes.append(len(batch))
+        emit_batch(batch)
+
+    monkeypatch.setattr(log_queue, "_emit_batch", recording_emit_batch)
+    return sizes
+
+
+async def wait_for_records(logger, count, timeout=2.0):
+    """Wait until the consumer has emitted at least ``count`` records."""
+    async def poll():
+        while len(logger.records) < count:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestLogQueue:
+    """Test queueing, batching, dropping and draining of log records."""
+
+    def test_logs_inline_before_start(self, log_queue):
+        """Test that records are emitted immediately without a consumer."""
+        log_queue.put("error", "inline", {"path": "/x"})
+
+        assert log_queue.logger.records == [("error", "inline", {"path": "/x"})]
+
+    def test_renders_exception_traceback(self, log_queue):
+        """Test that the exception traceback is attached to the error context."""
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            log_queue.put("error", "failed", {"error": {"type": "ValueError"}}, exc=e)
+
+        _, _, context = log_queue.logger.records[0]
+        assert "ValueError: boom" in context["error"]["traceback"]
+
+    def test_captures_correlation_id_at_put(self, log_queue):
+        """Test that the caller's correlation ID travels with the record."""
+        def put_in_request_context():
+            CorrelationIdManager.set_correlation_id("corr-123")
+            log_queue.put("warning", "tagged", {})
+
+        # Run in a copied context so the ID does not leak into other tests
+        contextvars.copy_context().run(put_in_request_context)
+
+        _, _, context = log_queue.logger.records[0]
+        assert context["correlation_id"] == "corr-123"
+
+    @pytest.mark.asyncio
+    async def test_consumer_emits_queued_records(self, log_queue):
+        """Test that the background consumer emits records in order."""
+        log_queue.start()
+        try:
+            for i in range(3):
+                log_queue.put("error", f"record {i}", {})
+            assert log_queue.logger.records == []
+
+            await wait_for_records(log_queue.logger, 3)
+        finally:
+            await log_queue.stop()
+
+        assert log_queue.logger.messages() == ["record 0", "record 1", "record 2"]
+
+    @pytest.mark.asyncio
+    async def test_batches_up_to_batch_size(self, log_queue, batches):
+        """Test that a backlog is drained in batches of at most BATCH_SIZE."""
+        log_queue.BATCH_SIZE = 2
+        log_queue.start()
+        try:
+            for i in range(5):
+                log_queue.put("error", f"record {i}", {})
+
+            await wait_for_records(log_queue.logger, 5)
+        finally:
+            await log_queue.stop()
+
+        # stop() flushes whatever is left, which here is nothing
+        assert [size for size in batches if size] == [2, 2, 1]
+        assert log_queue.logger.messages() == [f"record {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_drops_oldest_when_full(self, log_queue):
+        """Test that a full queue drops its oldest records and reports them."""
+        log_queue.MAX_SIZE = 3
+        log_queue.start()
+
+        # No await between puts, so the consumer cannot drain in between
+        for i in range(5):
+            log_queue.put("error", f"record {i}", {})
+        assert log_queue.dropped == 2
+
+        await log_queue.stop()
+
+        assert log_queue.logger.records[0] == (
+            "warning", "Exception log records dropped", {"dropped": 2}
+        )
+        assert log_queue.logger.messages()[1:] == ["record 2", "record 3", "record 4"]
+        assert log_queue.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queue(self, log_queue):
+        """Test that stop flushes records the consumer has not reached."""
+        log_queue.start()
+        for i in range(10):
+            log_queue.put("error", f"record {i}", {})
+
+        await log_queue.stop()
+
+        assert log_queue.logger.messages() == [f"record {i}" for i in range(10)]
+
+        # Without a consumer, later records are logged inline again
+        log_queue.put("error", "after stop", {})
+        assert log_queue.logger.messages()[-1] == "after stop"
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start_is_noop(self, log_queue):
+        """Test that stopping an unstarted queue does nothing."""
+        await log_queue.stop()
+
+        assert log_queue.logger.records == []
+
+    @pytest.mark.asyncio
+    async def test_lifespan_helpers_start_and_drain(self, log_queue, monkeypatch):
+        """Test that the lifespan helpers drive the global handler's queue."""
+        monkeypatch.setattr(exception_handler_module.exception_handler, "log_queue", log_queue)
+
+        await start_exception_logging()
+        log_queue.put("error", "queued", {})
+        assert log_queue.logger.records == []
+
+        await stop_exception_logging()
+
+        assert log_queue.logger.messages() == ["queued"]
@@ -0,0 +1,158 @@
+"""
+Tests for the Redis-backed sliding window rate limiter.
+
+Redis is replaced by an in-memory fake that mirrors the Lua script's
+semantics, so these tests need no running Redis instance.
+"""
+
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError, NoScriptError
+
+from app.core import rate_limit
+from app.core.rate_limit import build_rate_limit_key, is_request_allowed
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for the sliding window script."""
+
+    def __init__(self):
+        self.scripts = {}
+        self.windows = {}
+        self.script_loads = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def script_load(self, script):
+        self.script_loads += 1
+        sha = hashlib.sha1(script.encode()).hexdigest()
+        self.scripts[sha] = script
+        return sha
+
+    async def evalsha(self, sha, numkeys, key, now, window, max_requests, member):
+        if sha not in self.scripts:
+            raise NoScriptError("NOSCRIPT No matching script. Please use EVAL.")
+
+        # ZREMRANGEBYSCORE key 0 (now - window), then ZCARD
+        entries = {
+            entry: score
+            for entry, score in self.windows.get(key, {}).items()
+            if score > now - window
+        }
+        self.windows[key] = entries
+        if len(entries) >= max_requests:
+            return 0
+
+        entries[member] = now
+        return 1
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Route the rate limiter to a fresh FakeRedis with no cached script."""
+    redis = FakeRedis()
+
+    async def get_fake_client():
+        return redis
+
+    monkeypatch.setattr(rate_limit, "get_redis_client", get_fake_client)
+    monkeypatch.setattr(rate_limit, "_script_sha", None)
+    return redis
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the limiter's clock; tests advance it through clock.now."""
+    frozen = SimpleNamespace(now=1_000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: frozen.now))
+    return frozen
+
+
+class TestRateLimit:
+    """Test the sliding window rate limiter."""
+
+    def test_build_rate_limit_key(self):
+        """Test that keys combine client IP and route."""
+        assert build_rate_limit_key("10.0.0.1", "/api/v1/test-cases") == "rl:10.0.0.1:/api/v1/test-cases"
+
+    @pytest.mark.asyncio
+    async def test_allows_up_to_limit_then_denies(self, fake_redis, clock):
+        """Test that the request at the limit is allowed and the next one denied."""
+        results = [await is_request_allowed("10.0.0.1", "/route", max_requests=3) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_denied_requests_are_not_recorded(self, fake_redis, clock):
+        """Test that denied requests do not extend the window."""
+        for _ in range(5):
+            await is_request_allowed("10.0.0.1", "/route", max_requests=2)
+
+        key = build_rate_limit_key("10.0.0.1", "/route")
+        assert len(fake_redis.windows[key]) == 2
+
+    @pytest.mark.asyncio
+    async def test_window_slides(self, fake_redis, clock):
+        """Test that requests older than the window stop counting."""
+        assert await is_request_allowed("10.0.0.1", "/route", max_requests=1, window_seconds=60)
+
+        clock.now += 59
+        assert not await is_request_allowed("10.0.0.1", "/route", max_requests=1, window_seconds=60)
+
+        clock.now += 2
+        assert await is_request_allowed("10.0.0.1", "/route", max_requests=1, window_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_limits_are_per_client_and_route(self, fake_redis, clock):
+        """Test that one client's window does not affect another's."""
+        assert await is_request_allowed("10.0.0.1", "/route", max_requests=1)
+        assert not await is_request_allowed("10.0.0.1", "/route", max_requests=1)
+
+        assert await is_request_allowed("10.0.0.2", "/route", max_requests=1)
+        assert await is_request_allowed("10.0.0.1", "/other", max_requests=1)
+
+    @pytest.mark.asyncio
+    async def test_script_loaded_once(self, fake_redis, clock):
+        """Test that the script SHA is cached after the first call."""
+        for _ in range(3):
+            await is_request_allowed("10.0.0.1", "/route", max_requests=10)
+
+        assert fake_redis.script_loads == 1
+        assert rate_limit._script_sha in fake_redis.scripts
+
+    @pytest.mark.asyncio
+    async def test_reloads_script_after_noscript(self, fake_redis, clock, monkeypatch):
+        """Test that a flushed script cache is reloaded and the check still runs."""
+        monkeypatch.setattr(rate_limit, "_script_sha", "stale-sha")
+
+        assert await is_request_allowed("10.0.0.1", "/route", max_requests=1)
+        assert not await is_request_allowed("10.0.0.1", "/route", max_requests=1)
+
+        assert fake_redis.script_loads == 1
+        assert rate_limit._script_sha in fake_redis.scripts
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_script_call_fails(self, fake_redis, clock, monkeypatch):
+        """Test that a Redis error during the check allows the request."""
+        async def broken_evalsha(*args, **kwargs):
+            raise RedisConnectionError("Connection refused")
+
+        monkeypatch.setattr(fake_redis, "evalsha", broken_evalsha)
+
+        assert await is_request_allowed("10.0.0.1", "/route", max_requests=0)
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_unreachable(self, monkeypatch):
+        """Test that failing to get a Redis client allows the request."""
+        async def unreachable():
+            raise RedisConnectionError("Connection refused")
+
+        monkeypatch.setattr(rate_limit, "get_redis_client", unreachable)
+
+        assert await is_request_allowed("10.0.0.1", "/route", max_requests=0)
@@ -0,0 +1,157 @@
+"""
+Tests for keyset (cursor) pagination of the user story list endpoint.
+
+The endpoint tests run against the test database through the
+``test_db_session`` fixture, so every row they add is rolled back.
+"""
+
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.user_stories import decode_cursor, encode_cursor
+from app.core.database_test import TestDataFactory
+from app.models.user_story import ProcessingStatus, UserStory
+
+
+CREATED_AT = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def raw_cursor(value: bytes) -> str:
+    """Encode arbitrary bytes the way a cursor is encoded."""
+    return base64.urlsafe_b64encode(value).decode()
+
+
+TAMPERED_CURSORS = [
+    "not a cursor",
+    raw_cursor(b"garbage"),
+    raw_cursor(b"\xff\xfe\xfd"),
+    raw_cursor(b"2024-05-01T12:00:00+00:00|abc"),
+    raw_cursor(b"2024-05-01T12:00:00+00:00|1|2"),
+    raw_cursor(b"yesterday|1"),
+    raw_cursor(b"2024-05-01T12:00:00+00:00|99999999999"),
+    raw_cursor(b"2024-05-01T12:00:00+00:00|-1"),
+    raw_cursor(b"2024-05-01T12:00:00|1"),
+]
+
+
+async def add_stories(session, created_ats):
+    """Add one user story per timestamp and return their IDs."""
+    stories = [
+        UserStory(
+            **TestDataFactory.create_user_story_data(
+                azure_devops_id=f"PAGE-{index}",
+                processing_status=ProcessingStatus.PENDING
+            ),
+            created_at=created_at
+        )
+        for index, created_at in enumerate(created_ats)
+    ]
+    session.add_all(stories)
+    await session.flush()
+    return [story.id for story in stories]
+
+
+async def walk_pages(client, limit):
+    """Follow next_cursor from the first page to the last."""
+    pages = []
+    params = {"limit": limit, "skip_total": True}
+    while True:
+        response = await client.get("/user-stories", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append(body)
+        if not body["pagination"]["has_next"]:
+            return pages
+        params["cursor"] = body["pagination"]["next_cursor"]
+
+
+class TestCursorEncoding:
+    """Test cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the position it encodes."""
+        assert decode_cursor(encode_cursor(CREATED_AT, 42)) == (CREATED_AT, 42)
+
+    def test_cursor_is_url_safe(self):
+        """Test that cursors need no escaping in a query string."""
+        cursor = encode_cursor(CREATED_AT + timedelta(microseconds=123456), 2 ** 31 - 1)
+
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+
+    @pytest.mark.parametrize("cursor", TAMPERED_CURSORS)
+    def test_malformed_cursor_rejected(self, cursor):
+        """Test that malformed or tampered cursors raise a 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestCursorPagination:
+    """Test the list endpoint's cursor and skip_total pagination."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", TAMPERED_CURSORS)
+    async def test_tampered_cursor_returns_400(self, user_stories_client, cursor):
+        """Test that a bad cursor is a client error, not a 500."""
+        response = await user_stories_client.get("/user-stories", params={"cursor": cursor})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid pagination cursor"
+
+    @pytest.mark.asyncio
+    async def test_created_at_ties_are_paged_by_id(self, user_stories_client, test_db_session):
+        """Test that rows sharing created_at are neither skipped nor repeated."""
+        ids = await add_stories(test_db_session, [CREATED_AT] * 5)
+
+        pages = await walk_pages(user_stories_client, limit=2)
+
+        seen = [story["id"] for page in pages for story in page["user_stories"]]
+        assert seen == sorted(ids, reverse=True)
+        assert [len(page["user_stories"]) for page in pages] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_pages_newest_first_across_timestamps(self, user_stories_client, test_db_session):
+        """Test cursor order when ties and distinct timestamps mix."""
+        created_ats = [
+            CREATED_AT,
+            CREATED_AT + timedelta(minutes=1),
+            CREATED_AT + timedelta(minutes=1),
+            CREATED_AT + timedelta(minutes=2),
+        ]
+        ids = await add_stories(test_db_session, created_ats)
+
+        pages = await walk_pages(user_stories_client, limit=3)
+
+        seen = [story["id"] for page in pages for story in page["user_stories"]]
+        assert seen == [ids[3], ids[2], ids[1], ids[0]]
+
+    @pytest.mark.asyncio
+    async def test_skip_total_omits_count(self, user_stories_client, test_db_session):
+        """Test that skip_total returns null totals and detects the next page."""
+        await add_stories(test_db_session, [CREATED_AT + timedelta(seconds=i) for i in range(3)])
+
+        response = await user_stories_client.get("/user-stories", params={"limit": 2, "skip_total": True})
+
+        pagination = response.json()["pagination"]
+        assert response.status_code == 200
+        assert pagination["total"] is None
+        assert pagination["pages"] is None
+        assert pagination["has_next"] is True
+        assert pagination["has_prev"] is False
+        assert pagination["next_cursor"] is not None
+
+    @pytest.mark.asyncio
+    async def test_skip_total_last_page(self, user_stories_client, test_db_session):
+        """Test that an exactly full last page reports no next page."""
+        await add_stories(test_db_session, [CREATED_AT + timedelta(seconds=i) for i in range(2)])
+
+        response = await user_stories_client.get("/user-stories", params={"limit": 2, "skip_total": True})
+
+        body = response.json()
+        assert len(body["user_stories"]) == 2
+        assert body["pagination"]["has_next"] is False
+        assert body["pagination"]["next_cursor"] is None
@@ -0,0 +1,192 @@
+"""
+Tests for the user story statistics endpoint.
+
+The statistics come from one GROUPING SETS query whose rows are told apart
+by their GROUPING() bitmask, so these tests run against the test database
+through the ``test_db_session`` fixture; every row they add is rolled back.
+"""
+
+import pytest
+
+from app.core.database_test import TestDataFactory
+from app.models.quality_metrics import ConfidenceLevel, QualityMetrics
+from app.models.test_case import TestCase, TestClassification, TestPriority
+from app.models.user_story import ProcessingStatus, UserStory
+
+
+async def add_story(session, azure_devops_id, **overrides):
+    """Add a user story and return it."""
+    story = UserStory(**TestDataFactory.create_user_story_data(
+        azure_devops_id=azure_devops_id,
+        processing_status=ProcessingStatus.PENDING,
+        **overrides
+    ))
+    session.add(story)
+    await session.flush()
+    return story
+
+
+async def add_test_case(session, story, classification, priority, test_type, scores=(), **overrides):
+    """
+    Add a test case with one quality metrics row per score, oldest first.
+
+    Each score is an (overall_score, validation_passed) pair.
+    """
+    test_case = TestCase(**TestDataFactory.create_test_case_data(
+        story.id,
+        classification=classification,
+        priority=priority,
+        test_type=test_type,
+        **overrides
+    ))
+    session.add(test_case)
+    await session.flush()
+
+    for overall_score, validation_passed in scores:
+        session.add(QualityMetrics(**TestDataFactory.create_quality_metrics_data(
+            test_case.id,
+            overall_score=overall_score,
+            confidence_level=ConfidenceLevel.HIGH,
+            validation_passed=validation_passed
+        )))
+        # Flush one at a time so ids follow insertion order
+        await session.flush()
+    return test_case
+
+
+async def get_statistics(client, story_id):
+    """Fetch the statistics payload for a story."""
+    response = await client.get(f"/user-stories/{story_id}/statistics")
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestUserStoryStatistics:
+    """Test the GROUPING SETS statistics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_rows_dispatched_by_grouping_bitmask(self, user_stories_client, test_db_session):
+        """Test that each grouping set lands in its own breakdown."""
+        story = await add_story(test_db_session, "STATS-1")
+        await add_test_case(
+            test_db_session, story, TestClassification.API_AUTOMATION, TestPriority.HIGH, "positive",
+            scores=[(0.5, False), (0.9, True)]
+        )
+        await add_test_case(
+            test_db_session, story, TestClassification.MANUAL, TestPriority.HIGH, "negative",
+            scores=[(0.6, False)]
+        )
+        await add_test_case(
+            test_db_session, story, TestClassification.UI_AUTOMATION, TestPriority.CRITICAL, "positive",
+            scores=[(0.85, True)]
+        )
+
+        test_cases = (await get_statistics(user_stories_client, story.id))["test_cases"]
+
+        assert test_cases["total"] == 3
+        assert test_cases["by_classification"] == {"api_automation": 1, "manual": 1, "ui_automation": 1}
+        assert test_cases["by_priority"] == {"high": 2, "critical": 1}
+        assert test_cases["by_type"] == {"positive": 2, "negative": 1}
+        assert test_cases["automated"] == 2
+        assert test_cases["manual"] == 1
+
+    @pytest.mark.asyncio
+    async def test_quality_uses_latest_metrics(self, user_stories_client, test_db_session):
+        """Test that only each test case's newest metrics row counts."""
+        story = await add_story(test_db_session, "STATS-2")
+        await add_test_case(
+            test_db_session, story, TestClassification.API_AUTOMATION, TestPriority.HIGH, "positive",
+            scores=[(0.5, False), (0.9, True)]
+        )
+        await add_test_case(
+            test_db_session, story, TestClassification.MANUAL, TestPriority.LOW, "negative",
+            scores=[(0.6, False)]
+        )
+        await add_test_case(
+            test_db_session, story, TestClassification.MANUAL, TestPriority.LOW, "negative"
+        )
+
+        quality = (await get_statistics(user_stories_client, story.id))["quality_metrics"]
+
+        # The case without metrics is left out of the average
+        assert quality["average_quality_score"] == pytest.approx((0.9 + 0.6) / 2)
+        assert quality["high_quality_cases"] == 1
+        assert quality["validation_passed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_null_buckets_are_not_mistaken_for_totals(self, user_stories_client, test_db_session):
+        """Test that NULL classification and test type buckets are dropped, not read as totals."""
+        story = await add_story(test_db_session, "STATS-3")
+        await add_test_case(test_db_session, story, None, TestPriority.LOW, None)
+        await add_test_case(
+            test_db_session, story, TestClassification.PERFORMANCE, TestPriority.MEDIUM, "edge"
+        )
+
+        test_cases = (await get_statistics(user_stories_client, story.id))["test_cases"]
+
+        # Priority is NOT NULL, so only classification and test type can be NULL
+        assert test_cases["total"] == 2
+        assert test_cases["by_classification"] == {"performance": 1}
+        assert test_cases["by_type"] == {"edge": 1}
+        assert test_cases["by_priority"] == {"low": 1, "medium": 1}
+        assert test_cases["automated"] == 1
+        assert test_cases["manual"] == 1
+
+    @pytest.mark.asyncio
+    async def test_excludes_deleted_and_other_stories_test_cases(self, user_stories_client, test_db_session):
+        """Test that soft-deleted cases and other stories' cases are not counted."""
+        story = await add_story(test_db_session, "STATS-4")
+        other_story = await add_story(test_db_session, "STATS-5")
+        await add_test_case(test_db_session, story, TestClassification.MANUAL, TestPriority.LOW, "positive")
+        await add_test_case(
+            test_db_session, story, TestClassification.MANUAL, TestPriority.LOW, "positive",
+            is_deleted=True
+        )
+        await add_test_case(
+            test_db_session, other_story, TestClassification.SECURITY, TestPriority.HIGH, "negative"
+        )
+
+        test_cases = (await get_statistics(user_stories_client, story.id))["test_cases"]
+
+        assert test_cases["total"] == 1
+        assert test_cases["by_classification"] == {"manual": 1}
+
+    @pytest.mark.asyncio
+    async def test_story_without_test_cases(self, user_stories_client, test_db_session):
+        """Test that a story with no test cases reports zeroes and empty breakdowns."""
+        story = await add_story(test_db_session, "STATS-6", complexity_score=0.9)
+
+        statistics = await get_statistics(user_stories_client, story.id)
+
+        assert statistics["user_story_id"] == story.id
+        assert statistics["azure_devops_id"] == "STATS-6"
+        assert statistics["complexity_score"] == pytest.approx(0.9)
+        assert statistics["test_cases"] == {
+            "total": 0,
+            "by_classification": {},
+            "by_priority": {},
+            "by_type": {},
+            "automated": 0,
+            "manual": 0
+        }
+        assert statistics["quality_metrics"] == {
+            "average_quality_score": 0.0,
+            "high_quality_cases": 0,
+            "validation_passed": 0
+        }
+
+    @pytest.mark.asyncio
+    async def test_missing_story_returns_404(self, user_stories_client):
+        """Test that an unknown story ID is a 404."""
+        response = await user_stories_client.get("/user-stories/999999/statistics")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_deleted_story_returns_404(self, user_stories_client, test_db_session):
+        """Test that a soft-deleted story has no statistics."""
+        story = await add_story(test_db_session, "STATS-7", is_deleted=True)
+
+        response = await user_stories_client.get(f"/user-stories/{story.id}/statistics")
+
+        assert response.status_code == 404